@@ -0,0 +1,94 @@
+"""Memory allocated by a call of an overtaken function, measured with tracemalloc.
+
+A successful dispatch should allocate close to nothing, apart from what the
+call of the implementation needs. The peak of memory traced during a single
+call is compared with a direct call of the implementation. When no overload
+matches, the error message is only built if it's read.
+"""
+import tracemalloc
+from typing import Callable, List
+
+from overtake import overtake
+from typing_extensions import overload
+
+
+class Cat:
+    pass
+
+
+class Dog:
+    pass
+
+
+@overload
+def describe(name: int, animal: Cat) -> str:
+    return "int cat"
+
+
+@overload
+def describe(name: str, animal: Cat) -> str:
+    return "str cat"
+
+
+@overload
+def describe(name: str, animal: Dog) -> str:
+    return "str dog"
+
+
+@overtake
+def describe(name, animal):
+    ...
+
+
+@overload
+def total(values: List[int]) -> str:
+    return "ints"
+
+
+@overload
+def total(values: List[str]) -> str:
+    return "strings"
+
+
+@overtake(runtime_type_checker="beartype")
+def total(values):
+    ...
+
+
+def direct(name, animal):
+    return "str dog"
+
+
+def measure_peak(call: Callable[[], object]) -> int:
+    """Bytes allocated at the peak of a single call, once warm."""
+    for _ in range(100):
+        call()
+    tracemalloc.start()
+    try:
+        tracemalloc.reset_peak()
+        before, _ = tracemalloc.get_traced_memory()
+        call()
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    return peak - before
+
+
+def fail_and_ignore() -> None:
+    try:
+        describe(1.5, Dog())
+    except Exception:
+        pass
+
+
+dog = Dog()
+values = ["a", "b"]
+calls = {
+    "direct call of the implementation": lambda: direct("rex", dog),
+    "last overload, positional arguments": lambda: describe("rex", dog),
+    "last overload, keyword arguments": lambda: describe(name="rex", animal=dog),
+    "not decidable from classes (List[str])": lambda: total(values),
+    "no compatible overload, error ignored": fail_and_ignore,
+}
+for description, call in calls.items():
+    print(f"{description:>40}: {measure_peak(call):>5} bytes")
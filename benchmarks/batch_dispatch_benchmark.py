@@ -0,0 +1,39 @@
+"""Per-element cost of calling an overtaken function over a list of mixed inputs,
+one call at a time, or with `func.map(...)`."""
+import timeit
+from typing import Optional
+
+from overtake import overtake
+from typing_extensions import overload
+
+
+@overload
+def process(value: int) -> int:
+    return value
+
+
+@overload
+def process(value: Optional[str]) -> int:
+    return 0
+
+
+@overload
+def process(value: float) -> int:
+    return 1
+
+
+@overtake
+def process(value):
+    ...
+
+
+values = [1, "a", None, 2.5] * 2500
+
+one_by_one_time = timeit.timeit(lambda: [process(v) for v in values], number=20)
+map_time = timeit.timeit(lambda: process.map(values), number=20)
+per_element = 1e9 / (20 * len(values))
+print(
+    f"one call at a time: {one_by_one_time * per_element:.0f}ns per element,"
+    f" map: {map_time * per_element:.0f}ns per element,"
+    f" {one_by_one_time / map_time:.1f} times faster"
+)
@@ -0,0 +1,46 @@
+"""Measures the time needed to run `import overtake`, with `python -X importtime`.
+
+Each measure runs in a new interpreter, so nothing is cached in `sys.modules`.
+The optional backends (beartype, pydantic) should not be imported.
+"""
+import statistics
+import subprocess
+import sys
+from typing import Dict, List
+
+NUMBER_OF_RUNS = 20
+OPTIONAL_DEPENDENCIES = ["beartype", "pydantic"]
+
+
+def measure_import_times() -> Dict[str, int]:
+    """Returns the cumulative import time (in µs) of each imported module."""
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", "import overtake"],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    import_times = {}
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "cumulative" in line:
+            continue
+        _, cumulative, module_name = line[len("import time:") :].split("|")
+        import_times[module_name.strip()] = int(cumulative)
+    return import_times
+
+
+runs: List[Dict[str, int]] = [measure_import_times() for _ in range(NUMBER_OF_RUNS)]
+
+for optional_dependency in OPTIONAL_DEPENDENCIES:
+    if optional_dependency in runs[0]:
+        print(f"Warning: {optional_dependency} is imported by 'import overtake'")
+
+overtake_times = [run["overtake"] for run in runs]
+print(
+    f"import overtake: median {statistics.median(overtake_times) / 1000:.2f}ms,"
+    f" min {min(overtake_times) / 1000:.2f}ms over {NUMBER_OF_RUNS} runs"
+)
+print("Slowest imports (cumulative, last run):")
+slowest = sorted(runs[-1].items(), key=lambda item: item[1], reverse=True)[1:11]
+for module_name, cumulative in slowest:
+    print(f"    {module_name}: {cumulative / 1000:.2f}ms")
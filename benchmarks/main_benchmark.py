@@ -34,11 +34,30 @@ def overtake_function(
     pass
 
 
-@overtake
+@overtake(runtime_type_checker="beartype")
 def overtake_function(arg1, arg2, arg3, arg4, arg5, arg6):
     ...
 
 
+@overload
+def overtake_compiled_function(
+    arg1: list[str], arg2: str, arg3: str, arg4: tuple, arg5: int, arg6: list[int]
+):
+    pass
+
+
+@overload
+def overtake_compiled_function(
+    arg1: list[int], arg2: str, arg3: str, arg4: tuple, arg5: int, arg6: list[int]
+):
+    pass
+
+
+@overtake(runtime_type_checker="beartype", compile=True)
+def overtake_compiled_function(arg1, arg2, arg3, arg4, arg5, arg6):
+    ...
+
+
 big_list_int = [4] * 10_000
 
 
@@ -61,3 +80,18 @@ overtake_time = timeit.timeit(
 print("Overtake:", overtake_time)
 
 print(f"Overtake is {overtake_time / baseline_time} times slower than 'isisntance'.")
+
+# trigger first time computation
+overtake_compiled_function(big_list_int, "", "", (1,), 2, big_list_int)
+
+overtake_compiled_time = timeit.timeit(
+    "overtake_compiled_function(big_list_int, '', '', (1,), 2, big_list_int)",
+    number=1000,
+    globals=globals(),
+)
+print("Overtake (compile=True):", overtake_compiled_time)
+
+print(
+    f"Overtake (compile=True) is {overtake_compiled_time / baseline_time} times"
+    " slower than 'isisntance'."
+)
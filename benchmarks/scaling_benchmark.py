@@ -0,0 +1,341 @@
+"""Measures how the dispatch overhead grows with the shape of the overloads.
+
+Each scenario generates the overloads and a hand-written chain of `isinstance`
+doing the same dispatch, which is the baseline. The results are printed, and
+written as JSON with `--output results.json`, so releases can be compared.
+
+    python benchmarks/scaling_benchmark.py --output results.json
+"""
+import argparse
+import importlib.metadata
+import importlib.util
+import json
+import platform
+import sys
+import textwrap
+import timeit
+from typing import Callable, Dict, List, Optional, Tuple
+import warnings
+
+from overtake.overtake_class import OvertakenFunctionRegistry
+
+BACKENDS = [
+    backend
+    for backend in ["basic", "beartype", "pydantic"]
+    if backend == "basic" or importlib.util.find_spec(backend) is not None
+]
+
+_number_of_generated_modules = 0
+
+
+class Scenario:
+    def __init__(
+        self,
+        name: str,
+        parameter: object,
+        backend: str,
+        source: str,
+        call: str,
+        compile: bool = False,
+        container_check: Optional[str] = None,
+    ):
+        """`source` defines the overloads of `f`, and `baseline`, the isinstance
+        chain. `call` is the arguments of the call, like "(a, b)"."""
+        self.name = name
+        self.parameter = parameter
+        self.backend = backend
+        self.compile = compile
+        self.container_check = container_check
+        self.namespace = _execute(source, backend, compile, container_check)
+        self.call = call
+
+    def measure(self, statement: str, number: int) -> float:
+        """Nanoseconds per run, best of 5."""
+        timer = timeit.Timer(statement, globals=self.namespace)
+        return min(timer.repeat(repeat=5, number=number)) / number * 1e9
+
+    def run(self, number: int) -> Dict[str, object]:
+        overtake_call = f"f{self.call}"
+        baseline_call = f"baseline{self.call}"
+        eval(overtake_call, self.namespace)  # the first call inspects the overloads
+        overtake_ns = self.measure(overtake_call, number)
+        baseline_ns = self.measure(baseline_call, number)
+        return self.make_result(overtake_ns, baseline_ns)
+
+    def make_result(self, overtake_ns: float, baseline_ns: float) -> Dict[str, object]:
+        return {
+            "scenario": self.name,
+            "parameter": self.parameter,
+            "backend": self.backend,
+            "compile": self.compile,
+            "container_check": self.container_check,
+            "overtake_ns": round(overtake_ns, 1),
+            "baseline_ns": round(baseline_ns, 1),
+            "ratio": round(overtake_ns / baseline_ns, 2),
+        }
+
+
+class FirstCallScenario(Scenario):
+    """Time of the first call, which inspects the overloads."""
+
+    def run(self, number: int) -> Dict[str, object]:
+        registry = self.namespace["f"].__overtake_registry__
+        self.namespace["new_registry"] = lambda: OvertakenFunctionRegistry(
+            registry.overtaken_function, self.backend
+        )
+        overtake_ns = self.measure(f"new_registry(){self.call}", max(number // 100, 1))
+        baseline_ns = self.measure(f"baseline{self.call}", number)
+        return self.make_result(overtake_ns, baseline_ns)
+
+
+class FailureScenario(Scenario):
+    """No overload matches, both raise and the exception is caught."""
+
+    def run(self, number: int) -> Dict[str, object]:
+        overtake_ns = self.measure(
+            f"try:\n    f{self.call}\nexcept Exception:\n    pass", number
+        )
+        baseline_ns = self.measure(
+            f"try:\n    baseline{self.call}\nexcept Exception:\n    pass", number
+        )
+        return self.make_result(overtake_ns, baseline_ns)
+
+
+def _execute(
+    source: str, backend: str, compile: bool, container_check: Optional[str]
+) -> Dict[str, object]:
+    global _number_of_generated_modules
+    _number_of_generated_modules += 1
+    # overloads are registered per module and qualified name
+    namespace: Dict[str, object] = {
+        "__name__": f"scaling_benchmark_{_number_of_generated_modules}"
+    }
+    header = textwrap.dedent(f"""\
+        from typing import Dict, List, Literal, Tuple
+        from typing_extensions import overload
+        from overtake import overtake
+        decorator = overtake(
+            runtime_type_checker={backend!r},
+            compile={compile!r},
+            container_check={container_check!r},
+        )
+        """)
+    exec(header + textwrap.dedent(source), namespace)
+    return namespace
+
+
+def classes_source(number_of_classes: int) -> str:
+    # pydantic needs to be told how to validate classes it doesn't know
+    source = textwrap.dedent("""\
+        class Base:
+            @classmethod
+            def __get_pydantic_core_schema__(cls, source, handler):
+                from pydantic_core import core_schema
+                return core_schema.is_instance_schema(cls)
+        """)
+    return source + "".join(
+        f"class C{i}(Base): pass\n" for i in range(number_of_classes)
+    )
+
+
+def overloads_source(
+    number_of_overloads: int, number_of_args: int, varargs: bool = False
+) -> str:
+    """Overload i accepts instances of Ci for every argument, no overload accepts
+    instances of the last class."""
+    source = classes_source(number_of_overloads + 1)
+    for i in range(number_of_overloads):
+        if varargs:
+            parameters = f"*args: C{i}, **kwargs: C{i}"
+        else:
+            parameters = ", ".join(f"a{j}: C{i}" for j in range(number_of_args))
+        source += f"@overload\ndef f({parameters}) -> int:\n    return {i}\n"
+    if varargs:
+        source += "@decorator\ndef f(*args, **kwargs): ...\n"
+    else:
+        parameters = ", ".join(f"a{j}" for j in range(number_of_args))
+        source += f"@decorator\ndef f({parameters}): ...\n"
+    return source
+
+
+def baseline_source(
+    number_of_overloads: int, number_of_args: int, varargs: bool = False
+) -> str:
+    if varargs:
+        source = "def baseline(*args, **kwargs):\n"
+    else:
+        parameters = ", ".join(f"a{j}" for j in range(number_of_args))
+        source = f"def baseline({parameters}):\n"
+    for i in range(number_of_overloads):
+        if varargs:
+            condition = (
+                f"all(isinstance(a, C{i}) for a in args) and"
+                f" all(isinstance(a, C{i}) for a in kwargs.values())"
+            )
+        else:
+            condition = " and ".join(
+                f"isinstance(a{j}, C{i})" for j in range(number_of_args)
+            )
+        source += f"    if {condition}:\n        return {i}\n"
+    source += "    raise TypeError('no overload')\n"
+    return source
+
+
+def positional_call(winner: int, number_of_args: int) -> Tuple[str, str]:
+    """Returns the setup and the arguments of a call."""
+    setup = f"value = C{winner}()\n"
+    return setup, "(" + ", ".join(["value"] * number_of_args) + ",)"
+
+
+def make_scenarios(backend: str, quick: bool) -> List[Scenario]:
+    scenarios: List[Scenario] = []
+    sizes = [2, 8] if quick else [2, 4, 8, 16, 32]
+
+    def add(
+        name: str,
+        parameter: object,
+        number_of_overloads: int,
+        number_of_args: int,
+        winner: int,
+        keyword: bool = False,
+        varargs: bool = False,
+        scenario_class: Callable[..., Scenario] = Scenario,
+        compile: bool = False,
+    ) -> None:
+        setup, call = positional_call(winner, number_of_args)
+        if keyword:
+            call = "(" + ", ".join(f"a{j}=value" for j in range(number_of_args)) + ")"
+        if varargs:
+            call = "(value, value, a=value)"
+        source = (
+            overloads_source(number_of_overloads, number_of_args, varargs)
+            + baseline_source(number_of_overloads, number_of_args, varargs)
+            + setup
+        )
+        scenarios.append(
+            scenario_class(name, parameter, backend, source, call, compile=compile)
+        )
+
+    for number_of_overloads in sizes:
+        add(
+            "number_of_overloads",
+            number_of_overloads,
+            number_of_overloads,
+            1,
+            number_of_overloads - 1,
+        )
+    for winner in range(0, 8, 1 if not quick else 7):
+        add("winner_position", winner, 8, 1, winner)
+        add("winner_position_compiled", winner, 8, 1, winner, compile=True)
+    for number_of_args in [1, 4] if quick else [1, 2, 4, 8]:
+        add("number_of_args", number_of_args, 4, number_of_args, 3)
+        add("keyword_arguments", number_of_args, 4, number_of_args, 3, keyword=True)
+    if backend != "basic":
+        # the basic type checker cannot check Tuple[C, ...] and Dict[str, C]
+        add("varargs_and_varkwargs", 3, 4, 0, 3, varargs=True)
+    add("first_call", 8, 8, 2, 7, scenario_class=FirstCallScenario)
+    for number_of_overloads in sizes:
+        add(
+            "failure",
+            number_of_overloads,
+            number_of_overloads,
+            1,
+            number_of_overloads,
+            scenario_class=FailureScenario,
+        )
+
+    for number_of_overloads in sizes:
+        source = "".join(
+            f"@overload\ndef f(a: Literal['v{i}']) -> int:\n    return {i}\n"
+            for i in range(number_of_overloads)
+        )
+        source += "@decorator\ndef f(a): ...\ndef baseline(a):\n"
+        source += "".join(
+            f"    if a == 'v{i}':\n        return {i}\n"
+            for i in range(number_of_overloads)
+        )
+        source += "    raise TypeError('no overload')\n"
+        scenarios.append(
+            Scenario(
+                "literal_overloads",
+                number_of_overloads,
+                backend,
+                source,
+                f"('v{number_of_overloads - 1}')",
+            )
+        )
+
+    if backend != "basic":
+        for size in [10, 10_000] if quick else [10, 1000, 100_000]:
+            for container_check in [None, "first", "full"]:
+                source = textwrap.dedent(f"""\
+                    @overload
+                    def f(a: List[str]) -> int:
+                        return 0
+                    @overload
+                    def f(a: List[int]) -> int:
+                        return 1
+                    @decorator
+                    def f(a): ...
+                    def baseline(a):
+                        if isinstance(a, list) and isinstance(a[0], str):
+                            return 0
+                        if isinstance(a, list) and isinstance(a[0], int):
+                            return 1
+                        raise TypeError('no overload')
+                    values = [1] * {size}
+                    """)
+                scenarios.append(
+                    Scenario(
+                        "container_size",
+                        size,
+                        backend,
+                        source,
+                        "(values)",
+                        container_check=container_check,
+                    )
+                )
+    return scenarios
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[0])
+    parser.add_argument("--output", help="path of the JSON file to write")
+    parser.add_argument("--number", type=int, default=2000, help="calls per measure")
+    parser.add_argument(
+        "--quick", action="store_true", help="fewer sizes, to check the script"
+    )
+    parser.add_argument(
+        "--backend", action="append", choices=BACKENDS, help="default: all installed"
+    )
+    arguments = parser.parse_args()
+    # beartype warns about typing.List, typing.Tuple... at each new overload
+    warnings.simplefilter("ignore", DeprecationWarning)
+
+    results = []
+    for backend in arguments.backend or BACKENDS:
+        for scenario in make_scenarios(backend, arguments.quick):
+            result = scenario.run(arguments.number)
+            results.append(result)
+            print(
+                f"{result['backend']:>8} {result['scenario']:>26}"
+                f" {str(result['parameter']):>7}"
+                f" {str(result['container_check'] or ''):>6}:"
+                f" {result['overtake_ns']:>10.0f}ns"
+                f" (isinstance: {result['baseline_ns']:.0f}ns, x{result['ratio']})"
+            )
+
+    if arguments.output is not None:
+        report = {
+            "overtake_version": importlib.metadata.version("overtake"),
+            "python_version": sys.version,
+            "platform": platform.platform(),
+            "number_of_calls_per_measure": arguments.number,
+            "results": results,
+        }
+        with open(arguments.output, "w") as output_file:
+            json.dump(report, output_file, indent=2)
+
+
+if __name__ == "__main__":
+    main()
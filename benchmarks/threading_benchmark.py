@@ -0,0 +1,108 @@
+"""Throughput of an overtaken function called from several threads at once.
+
+Each thread makes the same number of calls, the total number of calls per
+second is printed for each number of threads. With the GIL, the throughput
+stays flat at best. On a free-threaded build (like `python3.13t`), the
+dispatch takes no lock once the function is inspected, so the throughput
+should grow with the number of threads, up to the number of cores.
+
+    python3.13t benchmarks/threading_benchmark.py --threads 1 2 4 8
+"""
+import argparse
+import os
+import sys
+import threading
+import time
+from typing import Callable, List, Optional
+
+from overtake import overtake
+from typing_extensions import overload
+
+
+class Cat:
+    pass
+
+
+class Dog:
+    pass
+
+
+@overload
+def describe(animal: Cat) -> str:
+    return "cat"
+
+
+@overload
+def describe(animal: Dog, name: Optional[str] = None) -> str:
+    return "dog"
+
+
+@overload
+def describe(animal: List[str]) -> str:
+    return "names"
+
+
+@overtake(runtime_type_checker="beartype")
+def describe(animal, name=None):
+    ...
+
+
+def make_calls(number_of_calls: int) -> Callable[[], None]:
+    cat, dog, names = Cat(), Dog(), ["rex"]
+
+    def calls() -> None:
+        for _ in range(number_of_calls // 4):
+            describe(cat)
+            describe(dog)
+            describe(dog, name="rex")
+            describe(names)
+
+    return calls
+
+
+def measure(number_of_threads: int, number_of_calls: int) -> float:
+    """Calls per second, all threads together."""
+    calls = make_calls(number_of_calls)
+    barrier = threading.Barrier(number_of_threads + 1)
+
+    def run() -> None:
+        barrier.wait()
+        calls()
+
+    threads = [threading.Thread(target=run) for _ in range(number_of_threads)]
+    for thread in threads:
+        thread.start()
+    barrier.wait()
+    start = time.perf_counter()
+    for thread in threads:
+        thread.join()
+    return number_of_threads * number_of_calls / (time.perf_counter() - start)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[0])
+    parser.add_argument("--threads", type=int, nargs="+", default=[1, 2, 4, 8])
+    parser.add_argument(
+        "--calls", type=int, default=200_000, help="calls made by each thread"
+    )
+    arguments = parser.parse_args()
+
+    is_gil_enabled = getattr(sys, "_is_gil_enabled", lambda: True)()
+    print(f"GIL enabled: {is_gil_enabled}, {os.cpu_count()} cores")
+
+    # the first calls from all the threads at once, the overloads are
+    # inspected only once
+    measure(max(arguments.threads), 4)
+
+    reference = None
+    for number_of_threads in arguments.threads:
+        throughput = measure(number_of_threads, arguments.calls)
+        reference = reference or throughput / number_of_threads
+        print(
+            f"{number_of_threads:>3} threads: {throughput:>12,.0f} calls/s"
+            f" (x{throughput / reference:.2f} the throughput of one thread)"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -1,3 +1,13 @@
 from overtake.decorator import overtake
+from overtake.incompatibility_reasons import IncompatibilityReason
+from overtake.instrumentation import disable_stats, enable_stats, stats
 from overtake.lazy_inspection import OverloadsNotFoundError
-from overtake.overtake_class import CompatibleOverloadNotFoundError
+from overtake.most_specific import AmbiguousOverloadsError, AmbiguousOverloadsWarning
+from overtake.overtake_class import (
+    NO_COMPATIBLE_OVERLOAD,
+    CompatibleOverloadNotFoundError,
+)
+from overtake.persistent_cache import set_cache_directory
+from overtake.runtime_type_checkers.base import RuntimeTypeChecker
+from overtake.runtime_type_checkers.umbrella import register_runtime_type_checker
+from overtake.warmup import warmup_all
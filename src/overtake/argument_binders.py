@@ -0,0 +1,299 @@
+"""Specialized replacements of `inspect.Signature.bind`, built once per overload.
+
+`Signature.bind` builds a `BoundArguments` and walks all the parameters in pure
+Python. Here, we only need to know if a call can bind, and the values of the
+arguments to check, so we precompute everything that depends only on the
+signature.
+"""
+
+from abc import ABC, abstractmethod
+import inspect
+import sys
+from typing import Dict, FrozenSet, List, Mapping, Optional, Set, Tuple
+
+from typing_extensions import Unpack, get_args, get_origin
+
+from overtake.check_costs import estimate_check_cost
+
+
+class _Missing:
+    def __repr__(self):
+        return "MISSING"
+
+
+MISSING = _Missing()
+
+
+class ArgumentCheck(ABC):
+    """An argument of an overload whose type hint must be checked."""
+
+    def __init__(self, argument_name: str, type_hint: object):
+        self.argument_name = argument_name
+        self.type_hint = type_hint
+
+    @abstractmethod
+    def extract(self, args: Tuple[object, ...], kwargs: Mapping[str, object]) -> object:
+        """Returns the value of the argument, or MISSING if the default is used."""
+
+
+class NamedArgumentCheck(ArgumentCheck):
+    def __init__(
+        self, argument_name: str, type_hint: object, position: int, can_be_keyword: bool
+    ):
+        super().__init__(argument_name, type_hint)
+        self.position = position
+        self.can_be_keyword = can_be_keyword
+
+    def extract(self, args: Tuple[object, ...], kwargs: Mapping[str, object]) -> object:
+        if self.position < len(args):
+            return args[self.position]
+        if self.can_be_keyword:
+            return kwargs.get(self.argument_name, MISSING)
+        return MISSING
+
+
+class VarPositionalCheck(ArgumentCheck):
+    def __init__(self, argument_name: str, type_hint: object, start: int):
+        super().__init__(argument_name, Tuple[type_hint, ...])  # type: ignore
+        self.start = start
+
+    def extract(self, args: Tuple[object, ...], kwargs: Mapping[str, object]) -> object:
+        if len(args) > self.start:
+            return args[self.start :]
+        return MISSING
+
+
+class VarKeywordCheck(ArgumentCheck):
+    def __init__(
+        self, argument_name: str, type_hint: object, named_keywords: FrozenSet[str]
+    ):
+        if get_origin(type_hint) == Unpack:
+            type_hint = get_args(type_hint)[0]
+        else:
+            type_hint = Dict[str, type_hint]  # type: ignore
+        super().__init__(argument_name, type_hint)
+        self.named_keywords = named_keywords
+
+    def extract(self, args: Tuple[object, ...], kwargs: Mapping[str, object]) -> object:
+        extra_kwargs = {
+            name: value
+            for name, value in kwargs.items()
+            if name not in self.named_keywords
+        }
+        if extra_kwargs:
+            return extra_kwargs
+        return MISSING
+
+
+class ArgumentBinder:
+    """Tells if a call can bind to a signature, and which arguments to check."""
+
+    def __init__(self, signature: inspect.Signature, arguments_to_check: Set[str]):
+        positional_names: List[str] = []
+        positional_only_names: Set[str] = set()
+        keyword_names: Set[str] = set()
+        required_positional_only = 0
+        required_parameters: List[Tuple[int, str]] = []
+        self.var_keyword = False
+        has_var_positional = False
+        self.checks: List[ArgumentCheck] = []
+
+        for name, parameter in signature.parameters.items():
+            has_default = parameter.default is not inspect.Parameter.empty
+            if parameter.kind == inspect.Parameter.POSITIONAL_ONLY:
+                positional_only_names.add(name)
+                if not has_default:
+                    required_positional_only += 1
+            elif parameter.kind == inspect.Parameter.VAR_POSITIONAL:
+                has_var_positional = True
+            elif parameter.kind == inspect.Parameter.VAR_KEYWORD:
+                self.var_keyword = True
+            else:
+                keyword_names.add(name)
+                if not has_default:
+                    position = (
+                        len(positional_names)
+                        if parameter.kind == inspect.Parameter.POSITIONAL_OR_KEYWORD
+                        else sys.maxsize
+                    )
+                    required_parameters.append((position, name))
+
+            if parameter.kind in (
+                inspect.Parameter.POSITIONAL_ONLY,
+                inspect.Parameter.POSITIONAL_OR_KEYWORD,
+            ):
+                positional_names.append(name)
+
+            if name in arguments_to_check:
+                self._add_check(parameter, len(positional_names) - 1, keyword_names)
+
+        # cheapest first, an overload which doesn't match fails on its cheapest
+        # check, the sort is stable so ties keep the order of the signature
+        self.checks.sort(key=lambda check: estimate_check_cost(check.type_hint))
+
+        self.number_of_positional_parameters = len(positional_names)
+        self.max_positional = (
+            sys.maxsize if has_var_positional else len(positional_names)
+        )
+        self.required_positional_only = required_positional_only
+        self.keyword_names = frozenset(keyword_names)
+        # indexed by the number of positional arguments given
+        self.names_given_positionally: Tuple[FrozenSet[str], ...] = tuple(
+            frozenset(positional_names[:n]) - positional_only_names
+            for n in range(len(positional_names) + 1)
+        )
+        self.required_keywords: Tuple[FrozenSet[str], ...] = tuple(
+            frozenset(name for position, name in required_parameters if position >= n)
+            for n in range(len(positional_names) + 1)
+        )
+
+    def _add_check(
+        self, parameter: inspect.Parameter, position: int, keyword_names: Set[str]
+    ) -> None:
+        if parameter.annotation is inspect.Parameter.empty:
+            return
+        if parameter.kind == inspect.Parameter.VAR_POSITIONAL:
+            check: ArgumentCheck = VarPositionalCheck(
+                parameter.name, parameter.annotation, position + 1
+            )
+        elif parameter.kind == inspect.Parameter.VAR_KEYWORD:
+            # **kwargs is always the last parameter, all the names are known
+            check = VarKeywordCheck(
+                parameter.name, parameter.annotation, frozenset(keyword_names)
+            )
+        elif parameter.kind == inspect.Parameter.KEYWORD_ONLY:
+            check = NamedArgumentCheck(
+                parameter.name, parameter.annotation, sys.maxsize, True
+            )
+        else:
+            check = NamedArgumentCheck(
+                parameter.name,
+                parameter.annotation,
+                position,
+                parameter.kind == inspect.Parameter.POSITIONAL_OR_KEYWORD,
+            )
+        self.checks.append(check)
+
+    def to_plan(self) -> Tuple[object, ...]:
+        """Everything computed from the signature, as plain data which can be
+        saved by `persistent_cache`."""
+        return (
+            tuple(_check_to_plan(check) for check in self.checks),
+            self.var_keyword,
+            self.number_of_positional_parameters,
+            self.max_positional,
+            self.required_positional_only,
+            self.keyword_names,
+            self.names_given_positionally,
+            self.required_keywords,
+        )
+
+    @classmethod
+    def from_plan(
+        cls, signature: inspect.Signature, plan: Tuple[object, ...]
+    ) -> "ArgumentBinder":
+        """The opposite of `to_plan`, the type hints are taken from `signature`."""
+        binder = cls.__new__(cls)
+        (
+            check_plans,
+            binder.var_keyword,
+            binder.number_of_positional_parameters,
+            binder.max_positional,
+            binder.required_positional_only,
+            binder.keyword_names,
+            binder.names_given_positionally,
+            binder.required_keywords,
+        ) = plan  # type: ignore
+        binder.checks = [
+            _check_from_plan(check_plan, signature)
+            for check_plan in check_plans  # type: ignore
+        ]
+        return binder
+
+    def can_bind(self, args: Tuple[object, ...], kwargs: Mapping[str, object]) -> bool:
+        number_of_args = len(args)
+        if number_of_args > self.max_positional:
+            return False
+        if number_of_args < self.required_positional_only:
+            return False
+        keywords = kwargs.keys()
+        if not self.var_keyword and not keywords <= self.keyword_names:
+            return False
+        index = min(number_of_args, self.number_of_positional_parameters)
+        if not keywords.isdisjoint(self.names_given_positionally[index]):
+            return False
+        return self.required_keywords[index] <= keywords
+
+
+def _check_to_plan(check: ArgumentCheck) -> Tuple[object, ...]:
+    if isinstance(check, NamedArgumentCheck):
+        return ("named", check.argument_name, check.position, check.can_be_keyword)
+    if isinstance(check, VarPositionalCheck):
+        return ("var_positional", check.argument_name, check.start)
+    assert isinstance(check, VarKeywordCheck)
+    return ("var_keyword", check.argument_name, check.named_keywords)
+
+
+def _check_from_plan(
+    plan: Tuple[object, ...], signature: inspect.Signature
+) -> ArgumentCheck:
+    kind, argument_name, *arguments = plan
+    type_hint = signature.parameters[argument_name].annotation  # type: ignore
+    if kind == "named":
+        return NamedArgumentCheck(argument_name, type_hint, *arguments)  # type: ignore
+    if kind == "var_positional":
+        return VarPositionalCheck(argument_name, type_hint, *arguments)  # type: ignore
+    if kind == "var_keyword":
+        return VarKeywordCheck(argument_name, type_hint, *arguments)  # type: ignore
+    raise ValueError(f"Unknown kind of argument check: {kind!r}")
+
+
+MAX_NUMBER_OF_INDEXED_SHAPES = 1024
+
+
+class ArityIndex:
+    """Maps a call shape to the overloads which can bind it.
+
+    The call shape is the number of positional arguments and the set of keyword
+    names. Calls without keyword arguments are indexed eagerly, the others
+    when they are first seen.
+    """
+
+    def __init__(
+        self,
+        binders: List[ArgumentBinder],
+        index: Optional[Dict[Tuple[int, FrozenSet[str]], Tuple[int, ...]]] = None,
+    ):
+        self.binders = binders
+        if index is not None:
+            # from `to_plan`
+            self._index = dict(index)
+            return
+        self._index = {}
+        max_number_of_args = max(
+            binder.number_of_positional_parameters for binder in binders
+        )
+        for number_of_args in range(max_number_of_args + 1):
+            self.compatible_overloads(number_of_args, frozenset())
+
+    def compatible_overloads(
+        self, number_of_args: int, keywords: FrozenSet[str]
+    ) -> Tuple[int, ...]:
+        """The indices of the overloads which can bind, in declaration order."""
+        key = (number_of_args, keywords)
+        compatible_overloads = self._index.get(key)
+        if compatible_overloads is None:
+            dummy_args = (MISSING,) * number_of_args
+            dummy_kwargs = dict.fromkeys(keywords, MISSING)
+            compatible_overloads = tuple(
+                index
+                for index, binder in enumerate(self.binders)
+                if binder.can_bind(dummy_args, dummy_kwargs)
+            )
+            if len(self._index) >= MAX_NUMBER_OF_INDEXED_SHAPES:
+                self._index.clear()
+            self._index[key] = compatible_overloads
+        return compatible_overloads
+
+    def to_plan(self) -> Dict[Tuple[int, FrozenSet[str]], Tuple[int, ...]]:
+        return dict(self._index)
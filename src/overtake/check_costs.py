@@ -0,0 +1,59 @@
+"""Static estimate of the cost of checking a value against a type hint.
+
+The checks of an overload are all needed for it to match, so the order in which
+they run doesn't change the result. Running the cheapest ones first means an
+overload that doesn't match is usually rejected by an `isinstance`, before a
+list with many elements is walked.
+
+The estimate only depends on the kind of type hint, not on the value. Ties keep
+the order of the parameters in the signature.
+"""
+
+import inspect
+from typing import Any
+
+from typing_extensions import get_args, is_typeddict
+
+from overtake.container_checks import container_kind
+from overtake.literal_checks import is_literal_type_hint
+from overtake.ndarray_checks import is_ndarray_type_hint
+from overtake.type_hint_analysis import is_plain_class, is_union
+
+# a set lookup
+LITERAL_COST = 0
+# a single `isinstance`
+CLASS_COST = 1
+UNION_COST = 2
+# `isinstance`, then the dtype and number of dimensions
+NDARRAY_COST = 3
+# `isinstance` looks for every attribute of the protocol
+PROTOCOL_COST = 4
+# anything else the runtime type checker understands, like `Callable[...]`
+OTHER_COST = 5
+# the elements are checked, possibly all of them
+CONTAINER_COST = 6
+# every key is checked, with its own type hint
+TYPED_DICT_COST = 7
+
+
+def estimate_check_cost(type_hint: object) -> int:
+    """The lower, the cheaper."""
+    if is_literal_type_hint(type_hint):
+        return LITERAL_COST
+    if type_hint is inspect.Parameter.empty or type_hint is None or type_hint is Any:
+        return CLASS_COST
+    if is_union(type_hint):
+        return max(
+            UNION_COST, *(estimate_check_cost(arg) for arg in get_args(type_hint))
+        )
+    if is_plain_class(type_hint):
+        return CLASS_COST
+    if is_typeddict(type_hint):
+        return TYPED_DICT_COST
+    if isinstance(type_hint, type) and getattr(type_hint, "_is_protocol", False):
+        return PROTOCOL_COST
+    if is_ndarray_type_hint(type_hint):
+        return NDARRAY_COST
+    if container_kind(type_hint) is not None:
+        return CONTAINER_COST
+    return OTHER_COST
@@ -0,0 +1,168 @@
+"""Code generation of a flat dispatcher, used with `@overtake(compile=True)`.
+
+Once the overloads are known, we write the source of a single function which
+checks the number of positional arguments, then runs a chain of `isinstance`
+for each overload, like one would write by hand. Calls with keyword arguments,
+and calls which do not match any overload, go through the registry.
+"""
+
+import threading
+import types
+import typing
+from typing import Callable, Dict, List, Optional, Tuple
+
+from overtake.argument_binders import (
+    ArgumentBinder,
+    ArgumentCheck,
+    NamedArgumentCheck,
+    VarPositionalCheck,
+)
+from overtake.overtake_class import OvertakenFunctionRegistry
+from overtake.type_hint_analysis import classes_of, is_decidable_from_type
+
+BOOTSTRAP_SOURCE = """\
+def dispatch(*args, **kwargs):
+    return compile_and_call(args, kwargs)
+"""
+
+ROUTED_SOURCE = """\
+def dispatch(*args, **kwargs):
+    return registry(*args, **kwargs)
+"""
+
+
+def make_compiled_wrapper(registry: OvertakenFunctionRegistry) -> Callable:
+    """The first call generates the dispatcher and swaps the code of the wrapper.
+
+    Both functions have no closure and share the same globals, so the wrapper
+    that the user holds becomes the generated function.
+    """
+    namespace: Dict[str, object] = {"registry": registry}
+    exec(BOOTSTRAP_SOURCE, namespace)
+    wrapper = typing.cast(types.FunctionType, namespace["dispatch"])
+
+    compile_lock = threading.Lock()
+
+    def compile_dispatcher() -> None:
+        if wrapper.__code__ is not bootstrap_code:
+            return
+        with compile_lock:
+            if wrapper.__code__ is not bootstrap_code:
+                return
+            source, generated_namespace = generate_dispatcher_source(registry)
+            namespace.update(generated_namespace)
+            exec(source, namespace)
+            wrapper.__code__ = namespace["dispatch"].__code__  # type: ignore
+            namespace["dispatch"] = wrapper
+
+    def compile_and_call(args: Tuple[object, ...], kwargs: Dict[str, object]):
+        compile_dispatcher()
+        return wrapper(*args, **kwargs)
+
+    # with stats enabled, calls go through the (instrumented) registry
+    codes_before_stats: List[types.CodeType] = []
+
+    def on_stats_toggled(enabled: bool) -> None:
+        if enabled:
+            codes_before_stats.append(wrapper.__code__)
+            wrapper.__code__ = routed_code
+        elif codes_before_stats:
+            wrapper.__code__ = codes_before_stats.pop()
+
+    bootstrap_code = wrapper.__code__
+    exec(ROUTED_SOURCE, namespace)
+    routed_code = namespace["dispatch"].__code__  # type: ignore
+    namespace["dispatch"] = wrapper
+    namespace["compile_and_call"] = compile_and_call
+    registry.warmup_callbacks.append(compile_dispatcher)
+    registry.stats_callbacks.append(on_stats_toggled)
+    return wrapper
+
+
+def generate_dispatcher_source(
+    registry: OvertakenFunctionRegistry,
+) -> Tuple[str, Dict[str, object]]:
+    namespace: Dict[str, object] = {}
+    lines = [
+        "def dispatch(*args, **kwargs):",
+        "    if kwargs:",
+        "        return registry(*args, **kwargs)",
+        "    number_of_args = len(args)",
+    ]
+    max_number_of_args = max(
+        binder.number_of_positional_parameters for binder in registry.binders
+    )
+    keyword = "if"
+    for number_of_args in range(max_number_of_args + 1):
+        branch = _generate_branch(registry, number_of_args, namespace)
+        if branch:
+            lines.append(f"    {keyword} number_of_args == {number_of_args}:")
+            lines.extend("        " + line for line in branch)
+            keyword = "elif"
+    lines.append("    return registry(*args, **kwargs)")
+    return "\n".join(lines) + "\n", namespace
+
+
+def _generate_branch(
+    registry: OvertakenFunctionRegistry,
+    number_of_args: int,
+    namespace: Dict[str, object],
+) -> List[str]:
+    lines = []
+    arity_index = registry.inspection_results.arity_index
+    for index in arity_index.compatible_overloads(number_of_args, frozenset()):
+        implementation, _ = registry.implementations[index]
+        binder = registry.binders[index]
+        implementation_name = f"implementation_{index}"
+        namespace[implementation_name] = implementation
+        conditions = _generate_conditions(
+            registry, binder, index, number_of_args, namespace
+        )
+        if not conditions:
+            lines.append(f"return {implementation_name}(*args)")
+            # the next overloads can never be reached
+            break
+        lines.append(f"if {' and '.join(conditions)}:")
+        lines.append(f"    return {implementation_name}(*args)")
+    return lines
+
+
+def _generate_conditions(
+    registry: OvertakenFunctionRegistry,
+    binder: ArgumentBinder,
+    overload_index: int,
+    number_of_args: int,
+    namespace: Dict[str, object],
+) -> List[str]:
+    predicates = registry.inspection_results.decision_trees.predicates
+    conditions = []
+    for check_index, argument_check in enumerate(binder.checks):
+        value_expression = _generate_value_expression(argument_check, number_of_args)
+        if value_expression is None:
+            continue
+        name = f"{overload_index}_{check_index}"
+        if registry.type_checker.isinstance_compatible and is_decidable_from_type(
+            argument_check.type_hint
+        ):
+            namespace[f"classes_{name}"] = classes_of(argument_check.type_hint)
+            conditions.append(f"isinstance({value_expression}, classes_{name})")
+        else:
+            namespace[f"predicate_{name}"] = predicates[id(argument_check)]
+            conditions.append(f"predicate_{name}({value_expression})")
+    return conditions
+
+
+def _generate_value_expression(
+    argument_check: ArgumentCheck, number_of_args: int
+) -> Optional[str]:
+    """Returns None when the argument is not provided (the default value is used)."""
+    if isinstance(argument_check, NamedArgumentCheck):
+        if argument_check.position < number_of_args:
+            return f"args[{argument_check.position}]"
+        return None
+    if isinstance(argument_check, VarPositionalCheck):
+        if argument_check.start < number_of_args:
+            return f"args[{argument_check.start}:]"
+        return None
+    # **kwargs, no keyword arguments are passed in this code path
+    return None
@@ -0,0 +1,178 @@
+"""How the elements of containers are checked, `@overtake(container_check=...)`.
+
+By default, containers are checked by the runtime type checker, which can walk
+the whole container (pydantic) or pick one random element (beartype). When a
+strategy is given, overtake checks the container class itself, then only some
+of the elements, with the runtime type checker. It applies to sequences,
+sets and mappings, like `list[int]`, `Sequence[str]`, `Set[int]`,
+`Dict[str, int]`, and to the hints of `*args` and `**kwargs`.
+
+* `"first"`: only the first element is checked.
+* `"sample(k)"`: at most k elements are checked, evenly spread in sequences,
+  the first k ones in sets and mappings.
+* `"full"`: every element is checked.
+"""
+
+import collections.abc
+import itertools
+import re
+import typing
+from typing import Any, Callable, Iterable, Optional, Sequence, Union
+
+from typing_extensions import Literal, get_args, get_origin
+
+# What can be given to @overtake(container_check=...), "sample(k)" is a str
+ContainerCheckChoice = Union[Literal["first", "full"], str, None]
+
+Predicate = Callable[[object], bool]
+
+SEQUENCE_ORIGINS = (
+    list,
+    collections.abc.Sequence,
+    collections.abc.MutableSequence,
+    collections.deque,
+)
+SET_ORIGINS = (set, frozenset, collections.abc.Set, collections.abc.MutableSet)
+MAPPING_ORIGINS = (
+    dict,
+    collections.abc.Mapping,
+    collections.abc.MutableMapping,
+    collections.defaultdict,
+    collections.OrderedDict,
+)
+
+_SAMPLE_PATTERN = re.compile(r"sample\((\d+)\)")
+
+
+class ContainerCheck:
+    def __init__(self, number_of_elements: Optional[int], description: str):
+        """`number_of_elements` is None to check every element."""
+        self.number_of_elements = number_of_elements
+        self.description = description
+
+    def select_from_sequence(self, sequence: Sequence) -> Iterable[Any]:
+        number_of_elements = self.number_of_elements
+        if number_of_elements is None or len(sequence) <= number_of_elements:
+            return sequence
+        # integer indexing only, some sequences (like deque) can't be sliced
+        if number_of_elements == 1:
+            return (sequence[0],)
+        step = (len(sequence) - 1) / (number_of_elements - 1)
+        return [sequence[round(i * step)] for i in range(number_of_elements)]
+
+    def select_from_iterable(self, iterable: Iterable) -> Iterable[Any]:
+        if self.number_of_elements is None:
+            return iterable
+        return itertools.islice(iterable, self.number_of_elements)
+
+
+def parse_container_check(
+    container_check: ContainerCheckChoice,
+) -> Optional[ContainerCheck]:
+    if container_check is None:
+        return None
+    if container_check == "first":
+        return ContainerCheck(1, container_check)
+    if container_check == "full":
+        return ContainerCheck(None, container_check)
+    match = _SAMPLE_PATTERN.fullmatch(container_check)
+    if match is not None and int(match.group(1)) > 0:
+        return ContainerCheck(int(match.group(1)), container_check)
+    raise ValueError(
+        f"Unknown container_check. '{container_check}' was provided, but only"
+        " 'first', 'sample(k)' (with k > 0) and 'full' are available"
+    )
+
+
+def make_container_predicate(
+    type_hint: object,
+    container_check: ContainerCheck,
+    make_element_predicate: Callable[[object], Predicate],
+) -> Optional[Predicate]:
+    """Returns None if the type hint is not a container handled here."""
+    kind = container_kind(type_hint)
+    if kind is None:
+        return None
+    origin = typing.cast(type, get_origin(type_hint))
+    arguments = get_args(type_hint)
+    if kind == "sequence":
+        return _make_sequence_predicate(
+            origin, make_element_predicate(arguments[0]), container_check
+        )
+    if kind == "set":
+        return _make_set_predicate(
+            origin, make_element_predicate(arguments[0]), container_check
+        )
+    return _make_mapping_predicate(
+        origin,
+        make_element_predicate(arguments[0]),
+        make_element_predicate(arguments[1]),
+        container_check,
+    )
+
+
+def container_kind(type_hint: object) -> Optional[str]:
+    """Returns "sequence", "set", "mapping" or None if it's not a container."""
+    origin = get_origin(type_hint)
+    arguments = get_args(type_hint)
+    if not isinstance(origin, type):
+        return None
+    if origin is tuple:
+        # fixed-size tuples are not containers of elements of the same type
+        if len(arguments) == 2 and arguments[1] is Ellipsis:
+            return "sequence"
+        return None
+    if issubclass(origin, SEQUENCE_ORIGINS) and len(arguments) == 1:
+        return "sequence"
+    if issubclass(origin, MAPPING_ORIGINS) and len(arguments) == 2:
+        return "mapping"
+    if origin in SET_ORIGINS and len(arguments) == 1:
+        return "set"
+    return None
+
+
+def _make_sequence_predicate(
+    origin: type, element_predicate: Predicate, container_check: ContainerCheck
+) -> Predicate:
+    def predicate(value: object) -> bool:
+        if not isinstance(value, origin):
+            return False
+        return all(
+            element_predicate(element)
+            for element in container_check.select_from_sequence(value)  # type: ignore
+        )
+
+    return predicate
+
+
+def _make_set_predicate(
+    origin: type, element_predicate: Predicate, container_check: ContainerCheck
+) -> Predicate:
+    def predicate(value: object) -> bool:
+        if not isinstance(value, origin):
+            return False
+        return all(
+            element_predicate(element)
+            for element in container_check.select_from_iterable(value)  # type: ignore
+        )
+
+    return predicate
+
+
+def _make_mapping_predicate(
+    origin: type,
+    key_predicate: Predicate,
+    value_predicate: Predicate,
+    container_check: ContainerCheck,
+) -> Predicate:
+    def predicate(value: object) -> bool:
+        if not isinstance(value, origin):
+            return False
+        return all(
+            key_predicate(key) and value_predicate(item)
+            for key, item in container_check.select_from_iterable(
+                value.items()  # type: ignore
+            )
+        )
+
+    return predicate
@@ -0,0 +1,488 @@
+"""Discrimination tree used to find the first overload compatible with a call.
+
+For a given call shape (number of positional arguments and keyword names), we
+know statically which overloads can bind, and where each argument to check
+comes from. Each node of the tree runs one check, taken from the first overload
+still possible. Depending on the result, the check is removed from (or the
+overload is dropped in) every other overload doing the same check, so a check
+is never run twice, and the first-match-wins behavior is kept.
+
+When the type checker agrees with `isinstance`, we also use the class
+hierarchy: if `value` is an `int`, a check for `object` passes, and if it's not
+a `float`, a check for a subclass of `float` fails.
+
+Nodes are built lazily, the first time a call goes through them.
+
+When several overloads check literals (like `Literal["json"]`) for the same
+argument, the node is a switch: the argument is looked up once in a table of
+the literals, instead of being checked against each of them in turn.
+
+When it's proven that some overloads cannot match the same calls (they check
+disjoint classes, like `int` and `str`, for the same argument), the order in
+which they are tried doesn't change the result. The trees then count which
+overload wins, and periodically put the most frequent ones first.
+"""
+
+from typing import Callable, Dict, FrozenSet, Hashable, List, Optional, Set, Tuple
+
+from overtake.argument_binders import (
+    ArgumentBinder,
+    ArgumentCheck,
+    ArityIndex,
+    NamedArgumentCheck,
+    VarKeywordCheck,
+    VarPositionalCheck,
+)
+from overtake.literal_checks import LiteralKey, is_literal_type_hint, literal_keys_of
+from overtake.type_hint_analysis import (
+    are_disjoint_classes,
+    classes_of,
+    is_decidable_from_type,
+)
+
+CallShape = Tuple[int, Tuple[str, ...]]
+
+MAX_NUMBER_OF_CALL_SHAPES = 1024
+
+
+class ShapedCheck:
+    """An argument check, once we know where the value comes from in the call."""
+
+    __slots__ = ("argument_check", "source", "predicate", "classes", "literal_keys")
+
+    def __init__(
+        self,
+        argument_check: ArgumentCheck,
+        source: Hashable,
+        predicate: Callable[[object], bool],
+        classes: Optional[Tuple[type, ...]],
+        literal_keys: Optional[FrozenSet[LiteralKey]] = None,
+    ):
+        self.argument_check = argument_check
+        self.source = source
+        self.predicate = predicate
+        self.classes = classes
+        # set for literals, the values accepted, see `literal_checks`
+        self.literal_keys = literal_keys
+
+    def is_same_as(self, other: "ShapedCheck") -> bool:
+        return (
+            self.source == other.source
+            and self.argument_check.type_hint == other.argument_check.type_hint
+        )
+
+    def passes_if_passed(self, other: "ShapedCheck") -> bool:
+        if self.is_same_as(other):
+            return True
+        if self.source != other.source:
+            return False
+        if self.literal_keys is not None and other.literal_keys is not None:
+            return other.literal_keys <= self.literal_keys
+        other_classes = other.classes_of_values()
+        if self.classes is None or other_classes is None:
+            return False
+        return all(issubclass(cls, self.classes) for cls in other_classes)
+
+    def is_disjoint_from(
+        self, other: "ShapedCheck", are_disjoint_classes: Callable[[type, type], bool]
+    ) -> bool:
+        """True if no value can pass both checks."""
+        if self.source != other.source:
+            return False
+        if self.literal_keys is not None and other.literal_keys is not None:
+            return not self.literal_keys & other.literal_keys
+        if self.literal_keys is not None or other.literal_keys is not None:
+            # the class of a literal is known exactly
+            literal, classes = (self, other.classes)
+            if literal.literal_keys is None:
+                literal, classes = (other, self.classes)
+            literal_classes = literal.classes_of_values()
+            return (
+                classes is not None
+                and literal_classes is not None
+                and not any(
+                    issubclass(literal_class, classes)
+                    for literal_class in literal_classes
+                )
+            )
+        if self.classes is None or other.classes is None:
+            return False
+        return all(
+            are_disjoint_classes(first, second)
+            for first in self.classes
+            for second in other.classes
+        )
+
+    def fails_if_failed(self, other: "ShapedCheck") -> bool:
+        if self.is_same_as(other):
+            return True
+        if self.source != other.source:
+            return False
+        if self.literal_keys is not None and other.literal_keys is not None:
+            return self.literal_keys <= other.literal_keys
+        self_classes = self.classes_of_values()
+        if self_classes is None or other.classes is None:
+            return False
+        return all(issubclass(cls, other.classes) for cls in self_classes)
+
+    def classes_of_values(self) -> Optional[Tuple[type, ...]]:
+        """Every value passing the check is an instance of one of these classes."""
+        if self.literal_keys is not None:
+            return tuple({cls for cls, _ in self.literal_keys})
+        return self.classes
+
+
+Candidate = Tuple[int, Tuple[ShapedCheck, ...]]
+
+REORDERING_PERIOD = 1000
+
+
+class HitCounter:
+    """Counts the winners of a tree, to try the most frequent overloads first."""
+
+    __slots__ = ("declared_candidates", "must_come_after", "hits", "calls_left")
+
+    def __init__(
+        self,
+        declared_candidates: Tuple[Candidate, ...],
+        must_come_after: List[FrozenSet[int]],
+    ):
+        self.declared_candidates = declared_candidates
+        # for each candidate, the positions of the candidates declared before
+        # it which can match the same calls, they must stay before it
+        self.must_come_after = must_come_after
+        self.hits: Dict[Optional[int], int] = {}
+        self.calls_left = REORDERING_PERIOD
+
+    def best_order(self) -> Tuple[Candidate, ...]:
+        """The most frequent candidates first, as long as it's allowed."""
+        hits = self.hits
+        placed: Set[int] = set()
+        order: List[Candidate] = []
+        positions = range(len(self.declared_candidates))
+        while len(order) < len(self.declared_candidates):
+            best = max(
+                (
+                    position
+                    for position in positions
+                    if position not in placed
+                    and self.must_come_after[position] <= placed
+                ),
+                key=lambda position: (
+                    hits.get(self.declared_candidates[position][0], 0),
+                    -position,
+                ),
+            )
+            placed.add(best)
+            order.append(self.declared_candidates[best])
+        return tuple(order)
+
+
+class DecisionNode:
+    __slots__ = (
+        "candidates",
+        "check",
+        "winner",
+        "if_passed",
+        "if_failed",
+        "hit_counter",
+        "cases",
+        "default_case",
+    )
+
+    def __init__(self, candidates: Tuple[Candidate, ...]):
+        self.candidates = candidates
+        self.if_passed: Optional[DecisionNode] = None
+        self.if_failed: Optional[DecisionNode] = None
+        self.check: Optional[ShapedCheck] = None
+        self.winner: Optional[int] = None
+        # only set on roots where the overloads can be reordered
+        self.hit_counter: Optional[HitCounter] = None
+        # only set on switches, the child for each literal, built on demand
+        self.cases: Optional[Dict[LiteralKey, Optional[DecisionNode]]] = None
+        self.default_case: Optional[DecisionNode] = None
+        if candidates:
+            overload_index, checks = candidates[0]
+            if checks:
+                self.check = checks[0]
+                self._make_switch_if_possible()
+            else:
+                self.winner = overload_index
+
+    def _make_switch_if_possible(self) -> None:
+        check = self.check
+        assert check is not None
+        if check.literal_keys is None:
+            return
+        literal_checks = [
+            c
+            for _, checks in self.candidates
+            for c in checks
+            if c.source == check.source and c.literal_keys is not None
+        ]
+        if len(literal_checks) < 2:
+            return
+        self.cases = dict.fromkeys(
+            key for c in literal_checks for key in c.literal_keys  # type: ignore
+        )
+
+    def switch(self, value: object) -> "DecisionNode":
+        """The child of a switch node, for the value of the argument."""
+        cases = self.cases
+        assert cases is not None
+        try:
+            key = (type(value), value)
+            child = cases.get(key)
+        except TypeError:
+            # unhashable, it cannot be a literal
+            return self.default_case or self.build_case(None)
+        if child is not None:
+            return child
+        if key not in cases:
+            return self.default_case or self.build_case(None)
+        return self.build_case(key)
+
+    def build_case(self, key: Optional[LiteralKey]) -> "DecisionNode":
+        """The literal checks of the switch pass if they contain the key, and
+        they all fail if the key is None. The other checks are kept."""
+        check = self.check
+        assert check is not None and self.cases is not None
+        remaining: List[Candidate] = []
+        for overload_index, checks in self.candidates:
+            kept_checks = []
+            for c in checks:
+                if c.source != check.source or c.literal_keys is None:
+                    kept_checks.append(c)
+                elif key is None or key not in c.literal_keys:
+                    break
+            else:
+                remaining.append((overload_index, tuple(kept_checks)))
+        child = DecisionNode(tuple(remaining))
+        if key is None:
+            self.default_case = child
+        else:
+            self.cases[key] = child
+        return child
+
+    def build_child(self, check_passed: bool) -> "DecisionNode":
+        check = self.check
+        assert check is not None
+        remaining: List[Candidate] = []
+        for overload_index, checks in self.candidates:
+            if check_passed:
+                checks = tuple(c for c in checks if not c.passes_if_passed(check))
+            elif any(c.fails_if_failed(check) for c in checks):
+                continue
+            remaining.append((overload_index, checks))
+        child = DecisionNode(tuple(remaining))
+        if check_passed:
+            self.if_passed = child
+        else:
+            self.if_failed = child
+        return child
+
+
+class DecisionTrees:
+    """One decision tree per call shape, built on demand."""
+
+    def __init__(
+        self,
+        binders: List[ArgumentBinder],
+        arity_index: ArityIndex,
+        make_predicate: Callable[[ArgumentCheck], Callable[[object], bool]],
+        isinstance_compatible: bool,
+    ):
+        self.binders = binders
+        self.arity_index = arity_index
+        self.isinstance_compatible = isinstance_compatible
+        self.predicates: Dict[int, Callable[[object], bool]] = {}
+        for binder in binders:
+            for argument_check in binder.checks:
+                self.predicates[id(argument_check)] = make_predicate(argument_check)
+        self._roots: Dict[CallShape, DecisionNode] = {}
+        # keyword arguments given in a different order share the same tree
+        self._roots_by_keyword_set: Dict[Tuple[int, FrozenSet[str]], DecisionNode] = {}
+        self._disjoint_classes: Dict[Tuple[type, type], bool] = {}
+
+    def find_overload(
+        self, args: Tuple[object, ...], kwargs: Dict[str, object]
+    ) -> Optional[int]:
+        """Returns the index of the first compatible overload, if any."""
+        call_shape = (len(args), tuple(kwargs))
+        root = self._roots.get(call_shape)
+        if root is None:
+            root = self._build_root(call_shape)
+        node = root
+        while node.check is not None:
+            check = node.check
+            if node.cases is not None:
+                node = node.switch(check.argument_check.extract(args, kwargs))
+            elif check.predicate(check.argument_check.extract(args, kwargs)):
+                node = node.if_passed or node.build_child(True)
+            else:
+                node = node.if_failed or node.build_child(False)
+        if root.hit_counter is not None:
+            self._count_hit(root, root.hit_counter, node.winner)
+        return node.winner
+
+    def build_trees_without_keywords(self) -> None:
+        """Builds the root of every tree for calls with positional arguments only."""
+        max_number_of_args = max(
+            binder.number_of_positional_parameters for binder in self.binders
+        )
+        for number_of_args in range(max_number_of_args + 1):
+            if (number_of_args, ()) not in self._roots:
+                self._build_root((number_of_args, ()))
+
+    def find_overload_with_stats(
+        self, args: Tuple[object, ...], kwargs: Dict[str, object]
+    ) -> Tuple[Optional[int], int]:
+        """Same as `find_overload`, also returns the number of failed checks."""
+        call_shape = (len(args), tuple(kwargs))
+        root = self._roots.get(call_shape)
+        if root is None:
+            root = self._build_root(call_shape)
+        node = root
+        failed_checks = 0
+        while node.check is not None:
+            check = node.check
+            if node.cases is not None:
+                node = node.switch(check.argument_check.extract(args, kwargs))
+            elif check.predicate(check.argument_check.extract(args, kwargs)):
+                node = node.if_passed or node.build_child(True)
+            else:
+                failed_checks += 1
+                node = node.if_failed or node.build_child(False)
+        if root.hit_counter is not None:
+            self._count_hit(root, root.hit_counter, node.winner)
+        return node.winner, failed_checks
+
+    def _count_hit(
+        self, root: DecisionNode, hit_counter: HitCounter, winner: Optional[int]
+    ) -> None:
+        hits = hit_counter.hits
+        hits[winner] = hits.get(winner, 0) + 1
+        hit_counter.calls_left -= 1
+        if hit_counter.calls_left > 0:
+            return
+        hit_counter.calls_left = REORDERING_PERIOD
+        best_order = hit_counter.best_order()
+        # older calls matter less and less, list() as other threads may add keys
+        for overload_index in list(hits):
+            hits[overload_index] //= 2
+        if best_order == root.candidates:
+            return
+        new_root = DecisionNode(best_order)
+        new_root.hit_counter = hit_counter
+        for call_shape, existing_root in list(self._roots.items()):
+            if existing_root is root:
+                self._roots[call_shape] = new_root
+        for keyword_set, existing_root in list(self._roots_by_keyword_set.items()):
+            if existing_root is root:
+                self._roots_by_keyword_set[keyword_set] = new_root
+
+    def _build_root(self, call_shape: CallShape) -> DecisionNode:
+        number_of_args, keywords = call_shape
+        keyword_set = frozenset(keywords)
+        root = self._roots_by_keyword_set.get((number_of_args, keyword_set))
+        if root is None:
+            root = self._build_tree(number_of_args, keyword_set)
+            if len(self._roots_by_keyword_set) >= MAX_NUMBER_OF_CALL_SHAPES:
+                self._roots_by_keyword_set.clear()
+            self._roots_by_keyword_set[(number_of_args, keyword_set)] = root
+
+        if len(self._roots) >= MAX_NUMBER_OF_CALL_SHAPES:
+            self._roots.clear()
+        self._roots[call_shape] = root
+        return root
+
+    def _build_tree(
+        self, number_of_args: int, keywords: FrozenSet[str]
+    ) -> DecisionNode:
+        candidates = []
+        for overload_index in self.arity_index.compatible_overloads(
+            number_of_args, keywords
+        ):
+            checks = []
+            for argument_check in self.binders[overload_index].checks:
+                source = _source_of(argument_check, number_of_args, keywords)
+                if source is None:
+                    continue
+                classes = None
+                if self.isinstance_compatible and is_decidable_from_type(
+                    argument_check.type_hint
+                ):
+                    classes = classes_of(argument_check.type_hint)
+                literal_keys = None
+                if is_literal_type_hint(argument_check.type_hint):
+                    literal_keys = literal_keys_of(argument_check.type_hint)
+                checks.append(
+                    ShapedCheck(
+                        argument_check,
+                        source,
+                        self.predicates[id(argument_check)],
+                        classes,
+                        literal_keys,
+                    )
+                )
+            candidates.append((overload_index, tuple(checks)))
+        root = DecisionNode(tuple(candidates))
+        root.hit_counter = self._make_hit_counter(root.candidates)
+        return root
+
+    def _make_hit_counter(
+        self, candidates: Tuple[Candidate, ...]
+    ) -> Optional[HitCounter]:
+        """Returns None if no candidate can be moved before another."""
+        must_come_after = []
+        for position, (_, checks) in enumerate(candidates):
+            must_come_after.append(
+                frozenset(
+                    previous_position
+                    for previous_position in range(position)
+                    if not self._are_disjoint(candidates[previous_position][1], checks)
+                )
+            )
+        if all(
+            len(previous_positions) == position
+            for position, previous_positions in enumerate(must_come_after)
+        ):
+            return None
+        return HitCounter(candidates, must_come_after)
+
+    def _are_disjoint(
+        self, checks: Tuple[ShapedCheck, ...], other_checks: Tuple[ShapedCheck, ...]
+    ) -> bool:
+        return any(
+            check.is_disjoint_from(other_check, self._are_disjoint_classes)
+            for check in checks
+            for other_check in other_checks
+        )
+
+    def _are_disjoint_classes(self, first: type, second: type) -> bool:
+        result = self._disjoint_classes.get((first, second))
+        if result is None:
+            result = are_disjoint_classes(first, second)
+            self._disjoint_classes[(first, second)] = result
+        return result
+
+
+def _source_of(
+    argument_check: ArgumentCheck, number_of_args: int, keywords: FrozenSet[str]
+) -> Optional[Hashable]:
+    """Where the value comes from in the call, or None if it's not provided."""
+    if isinstance(argument_check, NamedArgumentCheck):
+        if argument_check.position < number_of_args:
+            return ("positional", argument_check.position)
+        if argument_check.can_be_keyword and argument_check.argument_name in keywords:
+            return ("keyword", argument_check.argument_name)
+        return None
+    if isinstance(argument_check, VarPositionalCheck):
+        if argument_check.start < number_of_args:
+            return ("var_positional", argument_check.start)
+        return None
+    if isinstance(argument_check, VarKeywordCheck):
+        if any(name not in argument_check.named_keywords for name in keywords):
+            return ("var_keyword", argument_check.named_keywords)
+        return None
+    raise TypeError(f"Unknown argument check {argument_check}")
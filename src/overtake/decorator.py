@@ -3,8 +3,12 @@ from typing import Callable, TypeVar
 
 from typing_extensions import ParamSpec, overload
 
+from overtake.compiled_dispatcher import make_compiled_wrapper
+from overtake.container_checks import ContainerCheckChoice
+from overtake.instrumentation import enable_stats_if_enabled_by_default
+from overtake.most_specific import ResolutionChoice
 from overtake.overtake_class import OvertakenFunctionRegistry
-from overtake.runtime_type_checkers.umbrella import AVAILABLE_TYPE_CHECKERS
+from overtake.runtime_type_checkers.umbrella import RuntimeTypeCheckerChoice
 
 T = TypeVar("T")
 P = ParamSpec("P")
@@ -16,30 +20,98 @@ def overtake(func: Callable[P, T], /) -> Callable[P, T]:
 
 
 @overload
-def overtake(*, runtime_type_checker: AVAILABLE_TYPE_CHECKERS = "basic") -> Callable:
+def overtake(
+    *,
+    runtime_type_checker: RuntimeTypeCheckerChoice = "basic",
+    compile: bool = False,
+    container_check: ContainerCheckChoice = None,
+    resolution: ResolutionChoice = "first",
+) -> Callable:
     ...
 
 
-def overtake(func=None, /, *, runtime_type_checker: AVAILABLE_TYPE_CHECKERS = "basic"):
+def overtake(
+    func=None,
+    /,
+    *,
+    runtime_type_checker: RuntimeTypeCheckerChoice = "basic",
+    compile: bool = False,
+    container_check: ContainerCheckChoice = None,
+    resolution: ResolutionChoice = "first",
+):
     if func is None:
         return lambda f: make_registry_and_return_wrapper(
-            f, runtime_type_checker=runtime_type_checker
+            f,
+            runtime_type_checker=runtime_type_checker,
+            compile=compile,
+            container_check=container_check,
+            resolution=resolution,
         )
 
     return make_registry_and_return_wrapper(
-        func, runtime_type_checker=runtime_type_checker
+        func,
+        runtime_type_checker=runtime_type_checker,
+        compile=compile,
+        container_check=container_check,
+        resolution=resolution,
     )
 
 
 def make_registry_and_return_wrapper(
-    func: Callable[P, T], *, runtime_type_checker: AVAILABLE_TYPE_CHECKERS = "basic"
+    func: Callable[P, T],
+    *,
+    runtime_type_checker: RuntimeTypeCheckerChoice = "basic",
+    compile: bool = False,
+    container_check: ContainerCheckChoice = None,
+    resolution: ResolutionChoice = "first",
 ) -> Callable[P, T]:
+    if compile and resolution != "first":
+        raise ValueError(
+            "compile=True only supports resolution='first', the compiled"
+            " dispatcher tries the overloads in declaration order."
+        )
+    if isinstance(func, (classmethod, staticmethod)):
+        # the function inside is overtaken, then wrapped again
+        method_type = type(func)
+        registry = OvertakenFunctionRegistry(
+            func.__func__,
+            runtime_type_checker=runtime_type_checker,
+            container_check=container_check,
+            resolution=resolution,
+            takes_receiver=method_type is classmethod,
+        )
+        return method_type(make_wrapper(func.__func__, registry, compile))
     registry = OvertakenFunctionRegistry(
-        func, runtime_type_checker=runtime_type_checker
+        func,
+        runtime_type_checker=runtime_type_checker,
+        container_check=container_check,
+        resolution=resolution,
     )
+    return make_wrapper(func, registry, compile)
+
+
+def make_wrapper(
+    func: Callable[P, T], registry: OvertakenFunctionRegistry, compile: bool
+) -> Callable[P, T]:
+    if compile:
+        compiled_wrapper = wraps(func)(make_compiled_wrapper(registry))
+        add_registry_attributes(compiled_wrapper, registry)
+        return compiled_wrapper
 
     @wraps(func)
     def wrapper(*args: P.args, **kwargs: P.kwargs) -> T:
         return registry(*args, **kwargs)
 
+    add_registry_attributes(wrapper, registry)
     return wrapper
+
+
+def add_registry_attributes(
+    wrapper: Callable, registry: OvertakenFunctionRegistry
+) -> None:
+    wrapper.__overtake_registry__ = registry  # type: ignore
+    wrapper.map = registry.map  # type: ignore
+    wrapper.starmap = registry.starmap  # type: ignore
+    wrapper.try_dispatch = registry.try_dispatch  # type: ignore
+    wrapper.__overtake_stats__ = registry.stats  # type: ignore
+    enable_stats_if_enabled_by_default(wrapper)
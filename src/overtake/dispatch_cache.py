@@ -0,0 +1,263 @@
+"""Cache from the types of the arguments of a call to the overload to use.
+
+It is only used when all the type hints to check can be decided by looking
+at the class of the arguments, see `is_decidable_from_type`.
+
+Lookups don't take any lock, they are a single dictionary read. Only the
+updates, after a cache miss or when a class is garbage collected, are
+serialized.
+"""
+
+from abc import get_cache_token
+from collections import OrderedDict
+import functools
+import inspect
+import threading
+from typing import (
+    Callable,
+    Dict,
+    FrozenSet,
+    Hashable,
+    List,
+    Mapping,
+    Optional,
+    Set,
+    Tuple,
+)
+import weakref
+
+from overtake.type_hint_analysis import depends_on_abc_registry, is_decidable_from_type
+
+DEFAULT_CACHE_SIZE = 1024
+
+
+class CallKeyBuilder:
+    """Builds the cache key of a call.
+
+    The key contains the call shape (number of positional arguments and keyword
+    names) and the id of the class of each argument which can end up in a parameter
+    that must be checked.
+
+    With `with_abc_cache_token`, the key ends with `abc.get_cache_token()`, which
+    changes when a class is registered on any ABC. The entries added before
+    `ABC.register()` are never found again, like the ones of the cache of `ABCMeta`.
+    """
+
+    def __init__(
+        self,
+        positions: Tuple[int, ...],
+        varargs_start: Optional[int],
+        keywords: FrozenSet[str],
+        all_keywords: bool,
+        with_abc_cache_token: bool = False,
+    ):
+        self.positions = positions
+        self.varargs_start = varargs_start
+        self.keywords = keywords
+        self.all_keywords = all_keywords
+        self.with_abc_cache_token = with_abc_cache_token
+        self.make_key = self._generate_make_key()
+
+    def discriminating_values(
+        self, args: Tuple[object, ...], kwargs: Mapping[str, object]
+    ) -> List[object]:
+        number_of_args = len(args)
+        values = [args[i] for i in self.positions if i < number_of_args]
+        if self.varargs_start is not None:
+            values.extend(args[self.varargs_start :])
+        if self.all_keywords:
+            values.extend(kwargs.values())
+        elif self.keywords:
+            values.extend(
+                value for name, value in kwargs.items() if name in self.keywords
+            )
+        return values
+
+    def make_general_key(
+        self, args: Tuple[object, ...], kwargs: Mapping[str, object]
+    ) -> Hashable:
+        return _make_general_key(
+            self.positions,
+            self.varargs_start,
+            self.keywords,
+            self.all_keywords,
+            self.with_abc_cache_token,
+            args,
+            kwargs,
+        )
+
+    def _generate_make_key(
+        self,
+    ) -> Callable[[Tuple[object, ...], Mapping[str, object]], Hashable]:
+        """`make_key` is called by every call, the generated version builds the
+        key of calls with positional arguments only without intermediate lists.
+        It gives the same keys as `make_general_key`."""
+        # no reference to self, the builder would be part of a reference cycle
+        make_general_key = functools.partial(
+            _make_general_key,
+            self.positions,
+            self.varargs_start,
+            self.keywords,
+            self.all_keywords,
+            self.with_abc_cache_token,
+        )
+        if self.varargs_start is not None:
+            return make_general_key
+        minimum_number_of_args = max(self.positions, default=-1) + 1
+        class_ids = "".join(f" id(type(args[{i}]))," for i in self.positions)
+        if self.with_abc_cache_token:
+            class_ids += " get_cache_token(),"
+        source = (
+            "def make_key(args, kwargs):\n"
+            f"    if not kwargs and len(args) >= {minimum_number_of_args}:\n"
+            f"        return (len(args), (),{class_ids})\n"
+            "    return make_general_key(args, kwargs)\n"
+        )
+        namespace: Dict[str, object] = {
+            "make_general_key": make_general_key,
+            "get_cache_token": get_cache_token,
+        }
+        exec(source, namespace)
+        return namespace["make_key"]  # type: ignore
+
+
+def _make_general_key(
+    positions: Tuple[int, ...],
+    varargs_start: Optional[int],
+    keywords: FrozenSet[str],
+    all_keywords: bool,
+    with_abc_cache_token: bool,
+    args: Tuple[object, ...],
+    kwargs: Mapping[str, object],
+) -> Hashable:
+    # plain loops, comprehensions and generators allocate objects of their own
+    number_of_args = len(args)
+    key: List[object] = [number_of_args, tuple(kwargs)]
+    for i in positions:
+        if i < number_of_args:
+            key.append(id(type(args[i])))
+    if varargs_start is not None:
+        for value in args[varargs_start:]:
+            key.append(id(type(value)))
+    if all_keywords:
+        for value in kwargs.values():
+            key.append(id(type(value)))
+    elif keywords:
+        for name, value in kwargs.items():
+            if name in keywords:
+                key.append(id(type(value)))
+    if with_abc_cache_token:
+        key.append(get_cache_token())
+    return tuple(key)
+
+
+def make_call_key_builder(
+    implementations: List[Tuple[Callable, inspect.Signature]],
+    arguments_to_check_per_overload: List[Set[str]],
+) -> Optional[CallKeyBuilder]:
+    """Returns None if the dispatch cannot be decided from the classes only."""
+    positions = set()
+    varargs_start = None
+    keywords = set()
+    all_keywords = False
+    with_abc_cache_token = False
+    for (_, signature), arguments_to_check in zip(
+        implementations, arguments_to_check_per_overload
+    ):
+        for index, (name, parameter) in enumerate(signature.parameters.items()):
+            if name not in arguments_to_check:
+                continue
+            type_hint = parameter.annotation
+            if parameter.kind == inspect.Parameter.VAR_KEYWORD:
+                # Unpack[SomeTypedDict] can only be decided by looking at the keys
+                all_keywords = True
+            elif parameter.kind == inspect.Parameter.VAR_POSITIONAL:
+                if varargs_start is None or index < varargs_start:
+                    varargs_start = index
+            else:
+                if parameter.kind != inspect.Parameter.KEYWORD_ONLY:
+                    positions.add(index)
+                if parameter.kind != inspect.Parameter.POSITIONAL_ONLY:
+                    keywords.add(name)
+            if not is_decidable_from_type(type_hint):
+                return None
+            if depends_on_abc_registry(type_hint):
+                with_abc_cache_token = True
+    if varargs_start is not None:
+        positions = {position for position in positions if position < varargs_start}
+    return CallKeyBuilder(
+        tuple(sorted(positions)),
+        varargs_start,
+        frozenset(keywords),
+        all_keywords,
+        with_abc_cache_token,
+    )
+
+
+class TypeDispatchCache:
+    """Maps call keys to the implementation that won the dispatch.
+
+    Classes are only held through weak references, when a class is garbage
+    collected, all the entries using it are removed. When the cache is full,
+    the oldest entry is evicted.
+    """
+
+    def __init__(self, maxsize: int = DEFAULT_CACHE_SIZE):
+        self.maxsize = maxsize
+        self._entries: "OrderedDict[Hashable, Callable]" = OrderedDict()
+        self._class_references: Dict[int, weakref.ref] = {}
+        self._keys_by_class_id: Dict[int, Set[Hashable]] = {}
+        # reentrant, a class can be garbage collected (and forgotten) while
+        # an entry is added by the same thread
+        self._update_lock = threading.RLock()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get(self, key: Hashable) -> Optional[Callable]:
+        return self._entries.get(key)
+
+    def add(self, key: Hashable, values: List[object], implementation: Callable):
+        for value in values:
+            if type(value) is not value.__class__:
+                # isinstance() looks at __class__, which can lie (proxies, mocks...)
+                return
+        if self.maxsize <= 0:
+            return
+        with self._update_lock:
+            while self._entries and len(self._entries) >= self.maxsize:
+                oldest_key, _ = self._entries.popitem(last=False)
+                self._forget_key(oldest_key)
+            self._entries[key] = implementation
+            for value in values:
+                self._keep_track_of_class(type(value), key)
+
+    def clear(self) -> None:
+        with self._update_lock:
+            self._entries.clear()
+            self._class_references.clear()
+            self._keys_by_class_id.clear()
+
+    def _keep_track_of_class(self, cls: type, key: Hashable) -> None:
+        class_id = id(cls)
+        if class_id not in self._class_references:
+
+            def on_class_collected(_: weakref.ref) -> None:
+                self._forget_class(class_id)
+
+            self._class_references[class_id] = weakref.ref(cls, on_class_collected)
+        self._keys_by_class_id.setdefault(class_id, set()).add(key)
+
+    def _forget_class(self, class_id: int) -> None:
+        with self._update_lock:
+            self._class_references.pop(class_id, None)
+            for key in self._keys_by_class_id.pop(class_id, ()):
+                self._entries.pop(key, None)
+
+    def _forget_key(self, key: Hashable) -> None:
+        # the ABC cache token at the end of some keys is not the id of a class
+        # tracked here, it's skipped by the lookup
+        for class_id in key[2:]:  # type: ignore
+            keys = self._keys_by_class_id.get(class_id)
+            if keys is not None:
+                keys.discard(key)
@@ -0,0 +1,68 @@
+import inspect
+from typing import Callable, Dict, Union
+
+
+class DispatchStats:
+    """What happened in the calls of an overtaken function, while stats are enabled.
+
+    See `overtake.enable_stats()`. Times are in seconds. The time spent in the
+    implementation includes the nested calls to the same function.
+
+    The counters are updated without locking, when several threads call the
+    function at the same time, a few updates can be lost.
+    """
+
+    def __init__(self) -> None:
+        self.enabled = False
+        self.inspection_seconds = 0.0
+        self.reset()
+
+    def reset(self) -> None:
+        self.calls_per_implementation: Dict[Callable, int] = {}
+        self.failed_checks = 0
+        self.no_compatible_overload = 0
+        self.cache_hits = 0
+        self.cache_misses = 0
+        self.dispatch_seconds = 0.0
+        self.implementation_seconds = 0.0
+
+    def add(self, other: "DispatchStats") -> None:
+        """Adds the stats of another function, like one with the same name."""
+        for implementation, calls in list(other.calls_per_implementation.items()):
+            self.calls_per_implementation[implementation] = (
+                self.calls_per_implementation.get(implementation, 0) + calls
+            )
+        self.failed_checks += other.failed_checks
+        self.no_compatible_overload += other.no_compatible_overload
+        self.cache_hits += other.cache_hits
+        self.cache_misses += other.cache_misses
+        self.inspection_seconds += other.inspection_seconds
+        self.dispatch_seconds += other.dispatch_seconds
+        self.implementation_seconds += other.implementation_seconds
+
+    @property
+    def calls(self) -> int:
+        return sum(list(self.calls_per_implementation.values()))
+
+    @property
+    def cache_hit_rate(self) -> float:
+        lookups = self.cache_hits + self.cache_misses
+        return self.cache_hits / lookups if lookups else 0.0
+
+    def summary(self) -> Dict[str, Union[int, float, Dict[str, int]]]:
+        calls_per_overload: Dict[str, int] = {}
+        for implementation, calls in list(self.calls_per_implementation.items()):
+            signature = str(inspect.signature(implementation))
+            calls_per_overload[signature] = calls_per_overload.get(signature, 0) + calls
+        return {
+            "calls": self.calls,
+            "calls_per_overload": calls_per_overload,
+            "failed_checks": self.failed_checks,
+            "no_compatible_overload": self.no_compatible_overload,
+            "cache_hits": self.cache_hits,
+            "cache_misses": self.cache_misses,
+            "cache_hit_rate": self.cache_hit_rate,
+            "inspection_seconds": self.inspection_seconds,
+            "dispatch_seconds": self.dispatch_seconds,
+            "implementation_seconds": self.implementation_seconds,
+        }
@@ -1,9 +1,6 @@
 from abc import ABC, abstractmethod
 from inspect import Signature
-from typing import Callable, List
-
-import beartype.door
-import beartype.roar
+from typing import Callable, Dict, List, Optional, Tuple
 
 from overtake.display_objects import get_fully_qualified_name
 
@@ -18,30 +15,49 @@ class IncompatibilityReason(ABC):
 
 
 class IncompatibilityBind(IncompatibilityReason):
-    def __init__(self, exception: TypeError):
-        self.exception = exception
+    """We lazy-load the error message of Signature.bind, the binders used when
+    dispatching only tell if the call can bind or not."""
+
+    def __init__(
+        self, signature: Signature, args: Tuple[object, ...], kwargs: Dict[str, object]
+    ):
+        self.signature = signature
+        self.args = args
+        self.kwargs = kwargs
 
     def __str__(self):
-        return str(self.exception)
+        try:
+            self.signature.bind(*self.args, **self.kwargs)
+        except TypeError as e:
+            return str(e)
+        return "the call can bind, but not to the checked arguments"
 
 
-class IncompatibilityTypeHint(IncompatibilityReason):
-    """we lazy-load the beartype error message because die_if_unbearable is a lot slower
-    than is_bearable."""
+class IncompatibilityPredicate(IncompatibilityReason):
+    """Used when the predicate rejected the value, but the runtime type checker
+    cannot tell why, for example with `@overtake(container_check=...)`."""
 
-    def __init__(self, argument_name: str, value: object, type_hint: object):
-        self.argument_name = argument_name
+    def __init__(
+        self,
+        value: object,
+        type_hint: object,
+        argument_name: str,
+        container_check_description: Optional[str],
+    ):
         self.value = value
         self.type_hint = type_hint
+        self.argument_name = argument_name
+        self.container_check_description = container_check_description
 
     def __str__(self):
-        try:
-            beartype.door.die_if_unbearable(self.value, self.type_hint)
-        except beartype.roar.BeartypeDoorHintViolation as e:
-            return (
-                f"There is a type hint mismatch for argument {self.argument_name}: "
-                + str(e)
-            )
+        message = (
+            f"There is a type hint mismatch for argument {self.argument_name}: "
+            f"Object of class {self.value.__class__} is not compatible with "
+            f"{self.type_hint}"
+        )
+        if self.container_check_description is not None:
+            message += f" (container_check='{self.container_check_description}')"
+        return message
 
 
 class IncompatibilityOverload(IncompatibilityReason):
@@ -58,6 +74,18 @@ class IncompatibilityOverload(IncompatibilityReason):
         )
 
 
+class DeferredIncompatibilityReason(IncompatibilityReason):
+    """Finds the reason only when the message is read. Replaying the checks of all
+    the overloads is much slower than the dispatch itself, and a failed call
+    is often caught and ignored."""
+
+    def __init__(self, find_reason: Callable[[], IncompatibilityReason]):
+        self.find_reason = find_reason
+
+    def __str__(self):
+        return str(self.find_reason())
+
+
 class FullIncompatibilityReason(IncompatibilityReason):
     def __init__(
         self,
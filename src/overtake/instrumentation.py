@@ -0,0 +1,129 @@
+"""Opt-in statistics on the dispatch of overtaken functions.
+
+When stats are enabled for a function, the class of its registry is swapped
+for `InstrumentedOvertakenFunctionRegistry`, which counts and times the calls.
+When they are disabled, the original class is put back, so there is nothing
+to pay on the hot path, not even checking a flag.
+"""
+
+import time
+from typing import Callable, Dict, List, Tuple, Union
+
+from overtake.dispatch_stats import DispatchStats
+from overtake.display_objects import get_fully_qualified_name
+from overtake.overtake_class import ALL_REGISTRIES, OvertakenFunctionRegistry, P, T
+
+# used for the functions decorated after enable_stats()
+_enabled_by_default = False
+
+
+class InstrumentedOvertakenFunctionRegistry(OvertakenFunctionRegistry[P, T]):
+    def __call__(self, *args: P.args, **kwargs: P.kwargs) -> T:
+        stats = self.stats
+        inspection_results = self.inspection_results
+        start = time.perf_counter()
+
+        implementation = None
+        call_key_builder = inspection_results.call_key_builder
+        if call_key_builder is not None:
+            call_key = call_key_builder.make_key(args, kwargs)
+            implementation = self.dispatch_cache.get(call_key)
+            if implementation is None:
+                stats.cache_misses += 1
+            else:
+                stats.cache_hits += 1
+
+        if implementation is None:
+            overload_index, failed_checks = (
+                inspection_results.decision_trees.find_overload_with_stats(args, kwargs)
+            )
+            stats.failed_checks += failed_checks
+            if overload_index is None:
+                stats.no_compatible_overload += 1
+                stats.dispatch_seconds += time.perf_counter() - start
+                self.raise_no_compatible_overload(args, kwargs)
+            implementation = self.implementations[overload_index][0]
+            if call_key_builder is not None:
+                self.dispatch_cache.add(
+                    call_key,
+                    call_key_builder.discriminating_values(args, kwargs),
+                    implementation,
+                )
+
+        calls_per_implementation = stats.calls_per_implementation
+        calls_per_implementation[implementation] = (
+            calls_per_implementation.get(implementation, 0) + 1
+        )
+        dispatched = time.perf_counter()
+        stats.dispatch_seconds += dispatched - start
+        try:
+            return implementation(*args, **kwargs)
+        finally:
+            stats.implementation_seconds += time.perf_counter() - dispatched
+
+
+def enable_stats(*functions: Callable) -> None:
+    """Starts collecting stats for the given overtaken functions.
+
+    Without arguments, it's enabled for all of them, including the ones
+    decorated afterwards.
+    """
+    global _enabled_by_default
+    if not functions:
+        _enabled_by_default = True
+    for registry in _registries_of(functions):
+        if registry.stats.enabled:
+            continue
+        registry.stats.enabled = True
+        registry.__class__ = InstrumentedOvertakenFunctionRegistry
+        for callback in registry.stats_callbacks:
+            callback(True)
+
+
+def disable_stats(*functions: Callable) -> None:
+    """Stops collecting stats, for all the functions if none is given.
+
+    The stats collected so far are kept.
+    """
+    global _enabled_by_default
+    if not functions:
+        _enabled_by_default = False
+    for registry in _registries_of(functions):
+        if not registry.stats.enabled:
+            continue
+        registry.stats.enabled = False
+        registry.__class__ = OvertakenFunctionRegistry
+        for callback in registry.stats_callbacks:
+            callback(False)
+
+
+def stats() -> Dict[str, Dict[str, Union[int, float, Dict[str, int]]]]:
+    """Returns the summary of the stats of each function called while stats were
+    enabled, by fully qualified name.
+
+    The stats of functions with the same name, like a function defined in
+    another function, are added together.
+    """
+    stats_per_name: Dict[str, DispatchStats] = {}
+    for registry in list(ALL_REGISTRIES):
+        registry_stats = registry.stats
+        if not (registry_stats.calls or registry_stats.no_compatible_overload):
+            continue
+        name = get_fully_qualified_name(registry.overtaken_function)
+        total = stats_per_name.get(name)
+        if total is None:
+            total = stats_per_name[name] = DispatchStats()
+        total.add(registry_stats)
+    return {name: total.summary() for name, total in stats_per_name.items()}
+
+
+def enable_stats_if_enabled_by_default(function: Callable) -> None:
+    """Called when a function is decorated."""
+    if _enabled_by_default:
+        enable_stats(function)
+
+
+def _registries_of(functions: Tuple[Callable, ...]) -> List[OvertakenFunctionRegistry]:
+    if not functions:
+        return list(ALL_REGISTRIES)
+    return [function.__overtake_registry__ for function in functions]  # type: ignore
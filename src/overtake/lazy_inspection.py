@@ -1,12 +1,34 @@
 """This file contains every computation done at the first call of the function."""
 
 import inspect
+import os
 import sys
-from typing import Callable, List, Set, Tuple
+import types
+from typing import Callable, Iterable, List, Optional, Set, Tuple
+import warnings
 
 from typing_extensions import get_overloads
 
+from overtake.argument_binders import ArgumentBinder, ArgumentCheck, ArityIndex
+from overtake.container_checks import ContainerCheck
+from overtake.decision_tree import DecisionTrees
+from overtake.dispatch_cache import CallKeyBuilder, make_call_key_builder
 from overtake.display_objects import get_fully_qualified_name
+from overtake.most_specific import (
+    AmbiguousOverloadsWarning,
+    MostSpecificDecisionTrees,
+    ResolutionChoice,
+)
+from overtake.persistent_cache import (
+    get_cache_directory,
+    load_dispatch_plan,
+    save_dispatch_plan,
+)
+from overtake.predicates import make_predicate
+from overtake.runtime_type_checkers.base import RuntimeTypeChecker
+
+# the names of the first parameter of methods and classmethods
+RECEIVER_NAMES = ("self", "cls")
 
 
 class OverloadsNotFoundError(Exception):
@@ -14,14 +36,191 @@ class OverloadsNotFoundError(Exception):
 
 
 class LazyOverloadsInspection:
-    def __init__(self, overtaken_function: Callable):
+    def __init__(
+        self,
+        overtaken_function: Callable,
+        type_checker: RuntimeTypeChecker,
+        container_check: Optional[ContainerCheck] = None,
+        takes_receiver: Optional[bool] = None,
+        resolution: ResolutionChoice = "first",
+    ):
         self.implementations: List[Tuple[Callable, inspect.Signature]] = (
             find_implementations(overtaken_function)
         )
-        self.arguments_to_check: Set[str] = _find_arguments_to_check(
-            self.implementations
+        if takes_receiver is None:
+            takes_receiver = overloads_take_receiver(overtaken_function)
+        self.takes_receiver = takes_receiver
+        plan_fingerprint = None
+        if get_cache_directory() is not None:
+            plan_fingerprint = make_plan_fingerprint(
+                self.implementations, takes_receiver
+            )
+        if plan_fingerprint is None or not self._load_plan(
+            overtaken_function, plan_fingerprint
+        ):
+            # for each overload, the names of the arguments to check
+            self.arguments_to_check_per_overload: List[Set[str]] = (
+                _find_arguments_to_check(self.implementations, takes_receiver)
+            )
+            self.binders: List[ArgumentBinder] = [
+                ArgumentBinder(signature, arguments_to_check)
+                for (_, signature), arguments_to_check in zip(
+                    self.implementations, self.arguments_to_check_per_overload
+                )
+            ]
+            self.arity_index = ArityIndex(self.binders)
+            if plan_fingerprint is not None:
+                save_dispatch_plan(
+                    overtaken_function, plan_fingerprint, self._make_plan()
+                )
+        self.arguments_to_check: Set[str] = set().union(
+            *self.arguments_to_check_per_overload
+        )
+        self.call_key_builder: Optional[CallKeyBuilder] = None
+        if type_checker.decided_by_class:
+            self.call_key_builder = make_call_key_builder(
+                self.implementations, self.arguments_to_check_per_overload
+            )
+
+        def make_argument_predicate(
+            argument_check: ArgumentCheck,
+        ) -> Callable[[object], bool]:
+            return make_predicate(
+                type_checker,
+                container_check,
+                argument_check.type_hint,
+                argument_check.argument_name,
+            )
+
+        if resolution == "most_specific":
+            self.decision_trees: DecisionTrees = MostSpecificDecisionTrees(
+                self.binders,
+                self.arity_index,
+                make_argument_predicate,
+                type_checker.isinstance_compatible,
+                [signature for _, signature in self.implementations],
+            )
+            warn_about_ambiguous_overloads(overtaken_function, self)
+        else:
+            self.decision_trees = DecisionTrees(
+                self.binders,
+                self.arity_index,
+                make_argument_predicate,
+                type_checker.isinstance_compatible,
+            )
+
+    def _make_plan(self) -> Tuple[object, ...]:
+        return (
+            tuple(
+                frozenset(arguments_to_check)
+                for arguments_to_check in self.arguments_to_check_per_overload
+            ),
+            tuple(binder.to_plan() for binder in self.binders),
+            self.arity_index.to_plan(),
         )
 
+    def _load_plan(self, overtaken_function: Callable, fingerprint: str) -> bool:
+        """Returns False if there is no plan saved, or if it cannot be used."""
+        plan = load_dispatch_plan(overtaken_function, fingerprint)
+        if plan is None:
+            return False
+        try:
+            arguments_to_check_per_overload, binder_plans, arity_index_plan = plan
+            if not (
+                len(arguments_to_check_per_overload)
+                == len(binder_plans)
+                == len(self.implementations)
+            ):
+                return False
+            binders = [
+                ArgumentBinder.from_plan(signature, binder_plan)
+                for (_, signature), binder_plan in zip(
+                    self.implementations, binder_plans
+                )
+            ]
+        except (TypeError, ValueError, KeyError):
+            return False
+        self.arguments_to_check_per_overload = [
+            set(arguments_to_check)
+            for arguments_to_check in arguments_to_check_per_overload
+        ]
+        self.binders = binders
+        self.arity_index = ArityIndex(self.binders, arity_index_plan)
+        return True
+
+
+def make_plan_fingerprint(
+    implementations: List[Tuple[Callable, inspect.Signature]], takes_receiver: bool
+) -> str:
+    """Everything the plan saved by `persistent_cache` depends on.
+
+    The arguments to check and the binders only depend on the parameters of the
+    overloads, and on which type hints are equal to each other. Each type hint is
+    replaced by the index of the first one equal to it, so the fingerprint also
+    changes when an alias imported by the overloads refers to another class.
+    """
+    type_hints: List[object] = []
+    lines = [f"takes_receiver={takes_receiver}"]
+    for _, signature in implementations:
+        parameters = []
+        for parameter in signature.parameters.values():
+            type_hint_index: object = None
+            if parameter.annotation is not inspect.Parameter.empty:
+                type_hint_index = _index_of_equal(type_hints, parameter.annotation)
+            has_default = parameter.default is not inspect.Parameter.empty
+            parameters.append(
+                f"{parameter.kind.name} {parameter.name} {has_default}"
+                f" {type_hint_index}"
+            )
+        lines.append(", ".join(parameters))
+    return "\n".join(lines)
+
+
+def _index_of_equal(type_hints: List[object], type_hint: object) -> int:
+    for index, other_type_hint in enumerate(type_hints):
+        # the same comparison as `_find_arguments_to_check`
+        if not type_hint != other_type_hint:
+            return index
+    type_hints.append(type_hint)
+    return len(type_hints) - 1
+
+
+def warn_about_ambiguous_overloads(
+    overtaken_function: Callable, inspection: LazyOverloadsInspection
+) -> None:
+    decision_trees = inspection.decision_trees
+    assert isinstance(decision_trees, MostSpecificDecisionTrees)
+    for first, second in decision_trees.find_ambiguous_overloads():
+        warnings.warn(
+            AmbiguousOverloadsWarning(
+                f"The overloads '{inspection.implementations[first][1]}' and"
+                f" '{inspection.implementations[second][1]}' of"
+                f" '{get_fully_qualified_name(overtaken_function)}' are ambiguous,"
+                " each one is more specific than the other for some argument."
+                " Calls matching both will raise AmbiguousOverloadsError, unless"
+                " an overload more specific than both is added."
+            ),
+            stacklevel=_stacklevel_outside_of_overtake(),
+        )
+
+
+def _stacklevel_outside_of_overtake() -> int:
+    """The stacklevel of the first caller outside of overtake, for warnings.
+
+    The overloads are inspected at the first call, by `warmup_all()` or by
+    `try_dispatch()`..., so the number of frames of overtake varies.
+    """
+    package_directory = os.path.dirname(os.path.abspath(__file__)) + os.sep
+    # the frame of the function calling warnings.warn(), it's stacklevel 1
+    frame: Optional[types.FrameType] = sys._getframe(1)
+    stacklevel = 1
+    while frame is not None and os.path.abspath(frame.f_code.co_filename).startswith(
+        package_directory
+    ):
+        frame = frame.f_back
+        stacklevel += 1
+    return stacklevel
+
 
 def find_implementations(
     overtaken_function: Callable,
@@ -31,12 +230,52 @@ def find_implementations(
 
     result = []
     for overloaded_implementation in overloaded_implementations:
+        if isinstance(overloaded_implementation, (classmethod, staticmethod)):
+            # we are called with the class already, like the function inside
+            overloaded_implementation = overloaded_implementation.__func__
         result.append(
             (overloaded_implementation, inspect.signature(overloaded_implementation))
         )
     return result
 
 
+def overloads_take_receiver(overtaken_function: Callable) -> bool:
+    """True if the overloads are methods or classmethods, their first argument
+    is `self` or `cls`.
+
+    Overloads decorated with `@staticmethod` or `@classmethod` are known for
+    sure. Otherwise, it's a method only if the function is defined in the body
+    of a class and the first parameter of every overload is named `self` or
+    `cls`. A module-level function with a `cls` parameter is not a method, and
+    neither is a function overtaken before being wrapped in `@staticmethod`,
+    unless it names its first parameter `self`.
+    """
+    overloaded_implementations = list(get_overloads(overtaken_function))
+    if any(isinstance(o, staticmethod) for o in overloaded_implementations):
+        return False
+    if any(isinstance(o, classmethod) for o in overloaded_implementations):
+        return True
+    return _is_defined_in_class(overtaken_function) and all(
+        _first_parameter_name(o) in RECEIVER_NAMES for o in overloaded_implementations
+    )
+
+
+def _is_defined_in_class(function: Callable) -> bool:
+    # "MyClass.method" or "my_function.<locals>.MyClass.method"
+    qualname_parts = getattr(function, "__qualname__", "").split(".")
+    return len(qualname_parts) >= 2 and qualname_parts[-2] != "<locals>"
+
+
+def _first_parameter_name(function: Callable) -> Optional[str]:
+    parameters = list(inspect.signature(function).parameters.values())
+    if parameters and parameters[0].kind in (
+        inspect.Parameter.POSITIONAL_ONLY,
+        inspect.Parameter.POSITIONAL_OR_KEYWORD,
+    ):
+        return parameters[0].name
+    return None
+
+
 def raise_if_no_implementations(
     overtaken_function: Callable, implementations: List[Callable]
 ) -> None:
@@ -60,22 +299,125 @@ def raise_if_no_implementations(
 
 
 def _find_arguments_to_check(
-    implementations: List[Tuple[Callable, inspect.Signature]]
-) -> Set[str]:
-    """We optimise by writing arguments that have types that are changing.
+    implementations: List[Tuple[Callable, inspect.Signature]],
+    takes_receiver: bool = False,
+) -> List[Set[str]]:
+    """We optimise by only checking the arguments that can change the overload.
+
+    For each overload, an argument is checked if another overload can receive
+    the same value, at the same position or with the same name, with a
+    different type hint. Overloads which can never bind the same calls, because
+    of their number of arguments, don't need to be told apart.
 
     In some special cases, there might be no types change at all,
     meaning the dispatching is decided by the number of arguments
     provided.
+
+    With `takes_receiver`, the first argument is `self` or `cls`, it's never
+    checked, so the dispatch doesn't depend on the class of the receiver.
     """
-    arguments_to_check = set()
-    found_types = {}
-    for overloaded_implementation, signature in implementations:
-        for argument_name, argument in signature.parameters.items():
-            if argument_name not in found_types:
-                found_types[argument_name] = argument.annotation
-            else:
-                if argument.annotation != found_types[argument_name]:
-                    # it changed, let's check it later
-                    arguments_to_check.add(argument_name)
+    shapes = [_SignatureShape(signature) for _, signature in implementations]
+    arguments_to_check: List[Set[str]] = []
+    for shape in shapes:
+        to_check = set()
+        for parameter in shape.parameters:
+            if takes_receiver and parameter is shape.parameters[0]:
+                continue
+            if any(
+                other_shape is not shape
+                and other_shape.can_bind_same_calls(shape)
+                and any(
+                    type_hint != parameter.annotation
+                    for type_hint in other_shape.type_hints_receiving(shape, parameter)
+                )
+                for other_shape in shapes
+            ):
+                to_check.add(parameter.name)
+        arguments_to_check.append(to_check)
     return arguments_to_check
+
+
+class _SignatureShape:
+    """Where the values of a call can go in a signature."""
+
+    def __init__(self, signature: inspect.Signature):
+        self.parameters = list(signature.parameters.values())
+        self.positional = [
+            parameter
+            for parameter in self.parameters
+            if parameter.kind
+            in (
+                inspect.Parameter.POSITIONAL_ONLY,
+                inspect.Parameter.POSITIONAL_OR_KEYWORD,
+            )
+        ]
+        self.by_keyword = {
+            parameter.name: parameter
+            for parameter in self.parameters
+            if parameter.kind
+            in (inspect.Parameter.POSITIONAL_OR_KEYWORD, inspect.Parameter.KEYWORD_ONLY)
+        }
+        self.var_positional = self._find(inspect.Parameter.VAR_POSITIONAL)
+        self.var_keyword = self._find(inspect.Parameter.VAR_KEYWORD)
+        # the total number of arguments of a call that can bind
+        self.min_number_of_args = sum(
+            parameter.default is inspect.Parameter.empty
+            for parameter in self.parameters
+            if parameter is not self.var_positional
+            and parameter is not self.var_keyword
+        )
+        self.max_number_of_args = (
+            sys.maxsize
+            if self.var_positional is not None or self.var_keyword is not None
+            else len(self.parameters)
+        )
+
+    def _find(self, kind: object) -> Optional[inspect.Parameter]:
+        for parameter in self.parameters:
+            if parameter.kind == kind:
+                return parameter
+        return None
+
+    def can_bind_same_calls(self, other: "_SignatureShape") -> bool:
+        return (
+            self.min_number_of_args <= other.max_number_of_args
+            and other.min_number_of_args <= self.max_number_of_args
+        )
+
+    def type_hints_receiving(
+        self, other: "_SignatureShape", parameter: inspect.Parameter
+    ) -> List[object]:
+        """The type hints of the parameters of this signature that can receive a
+        value going to `parameter` in the other signature."""
+        positions: Iterable[int] = ()
+        names: Iterable[str] = ()
+        if parameter.kind == inspect.Parameter.VAR_POSITIONAL:
+            first_position = len(other.positional)
+            positions = range(
+                first_position, max(first_position, len(self.positional)) + 1
+            )
+        elif parameter.kind == inspect.Parameter.VAR_KEYWORD:
+            names = self.by_keyword.keys() - other.by_keyword.keys()
+        else:
+            if parameter in other.positional:
+                positions = [other.positional.index(parameter)]
+            if parameter.name in other.by_keyword:
+                names = [parameter.name]
+
+        type_hints = []
+        for position in positions:
+            if position < len(self.positional):
+                type_hints.append(self.positional[position].annotation)
+            elif self.var_positional is not None:
+                type_hints.append(self.var_positional.annotation)
+        for name in names:
+            if name in self.by_keyword:
+                type_hints.append(self.by_keyword[name].annotation)
+            elif self.var_keyword is not None:
+                type_hints.append(self.var_keyword.annotation)
+        if (
+            parameter.kind == inspect.Parameter.VAR_KEYWORD
+            and self.var_keyword is not None
+        ):
+            type_hints.append(self.var_keyword.annotation)
+        return type_hints
@@ -0,0 +1,67 @@
+"""Checks of `Literal[...]` type hints, like `Literal["json", "msgpack"]` or
+`Literal[Color.RED]`, done by overtake with a set lookup.
+
+A value matches a literal if it's equal to it and of the same class, so `True`
+doesn't match `Literal[1]`. The key of a value is `(type(value), value)`.
+
+In the decision trees, when several overloads check literals for the same
+argument, the key of the argument is looked up once in a table giving the
+overloads that remain possible, whatever the number of literals.
+"""
+
+import typing
+from typing import Callable, FrozenSet, Optional, Tuple
+
+from typing_extensions import Literal, get_args, get_origin
+
+from overtake.type_hint_analysis import is_union
+
+LiteralKey = Tuple[type, object]
+
+LITERAL_TYPES = {Literal, typing.Literal}
+
+
+def literal_keys_of(type_hint: object) -> Optional[FrozenSet[LiteralKey]]:
+    """None if the type hint is not made of literals only. `None` and unions of
+    literals, like `Optional[Literal["a", "b"]]`, are accepted."""
+    if type_hint is None or type_hint is type(None):
+        return frozenset({(type(None), None)})
+    if get_origin(type_hint) in LITERAL_TYPES:
+        try:
+            return frozenset((type(value), value) for value in get_args(type_hint))
+        except TypeError:
+            # not hashable, it's not a valid literal anyway
+            return None
+    if is_union(type_hint):
+        keys: FrozenSet[LiteralKey] = frozenset()
+        for arg in get_args(type_hint):
+            arg_keys = literal_keys_of(arg)
+            if arg_keys is None:
+                return None
+            keys |= arg_keys
+        return keys
+    return None
+
+
+def is_literal_type_hint(type_hint: object) -> bool:
+    return get_origin(type_hint) in LITERAL_TYPES or (
+        is_union(type_hint) and literal_keys_of(type_hint) is not None
+    )
+
+
+def make_literal_predicate(type_hint: object) -> Optional[Callable[[object], bool]]:
+    """Returns None if the type hint is not a literal, or a union of literals."""
+    if not is_literal_type_hint(type_hint):
+        return None
+    keys = literal_keys_of(type_hint)
+    if keys is None:
+        return None
+
+    def predicate(value: object) -> bool:
+        try:
+            return (type(value), value) in keys
+        except TypeError:
+            # an unhashable value is never equal to a literal
+            return False
+
+    return predicate
@@ -0,0 +1,272 @@
+"""Resolution of a call to the most specific compatible overload, used with
+`@overtake(resolution="most_specific")`.
+
+Like `functools.singledispatch`, but over several arguments. Each argument of
+the call is looked at in the MRO of its class: an overload accepting a class
+which comes earlier in the MRO is more specific for this argument. An overload
+wins if it's at least as specific as every other compatible overload, for
+every argument. When no overload wins, like `f(int, object)` and
+`f(object, int)` called with two integers, the call is ambiguous.
+
+The ranking only depends on the classes of the arguments, so the registry
+caches the result per combination of classes, like in the default resolution.
+"""
+
+import inspect
+import sys
+from typing import Callable, Dict, Hashable, List, Optional, Sequence, Set, Tuple
+
+from typing_extensions import Literal
+
+from overtake.argument_binders import (
+    ArgumentBinder,
+    ArgumentCheck,
+    ArityIndex,
+    NamedArgumentCheck,
+)
+from overtake.decision_tree import Candidate, DecisionTrees, HitCounter, ShapedCheck
+from overtake.type_hint_analysis import classes_of, is_decidable_from_type
+
+ResolutionChoice = Literal["first", "most_specific"]
+RESOLUTIONS = ("first", "most_specific")
+
+# for each argument of the call checked by an overload, its rank in the MRO of
+# the class of the argument, and the classes accepted by the overload
+Ranks = Dict[Hashable, Tuple[int, Tuple[type, ...]]]
+
+# the rank of `object`, and of the arguments not checked by an overload
+LEAST_SPECIFIC = sys.maxsize
+
+
+class AmbiguousOverloadsError(Exception):
+    pass
+
+
+class AmbiguousOverloadsWarning(UserWarning):
+    pass
+
+
+def raise_if_invalid_resolution(resolution: str) -> None:
+    if resolution not in RESOLUTIONS:
+        raise ValueError(
+            f"Invalid resolution {resolution!r}, expected one of {RESOLUTIONS}"
+        )
+
+
+class MostSpecificDecisionTrees(DecisionTrees):
+    """Same interface as `DecisionTrees`, but the most specific compatible
+    overload is returned, instead of the first one.
+
+    All the checks of all the overloads which can bind are run, so it's slower
+    on a cache miss. Only classes and unions of classes can be ranked.
+    """
+
+    def __init__(
+        self,
+        binders: List[ArgumentBinder],
+        arity_index: ArityIndex,
+        make_predicate: Callable[[ArgumentCheck], Callable[[object], bool]],
+        isinstance_compatible: bool,
+        signatures: List[inspect.Signature],
+    ):
+        super().__init__(binders, arity_index, make_predicate, isinstance_compatible)
+        self.signatures = signatures
+        for binder, signature in zip(self.binders, signatures):
+            for argument_check in binder.checks:
+                if not isinstance(
+                    argument_check, NamedArgumentCheck
+                ) or not is_decidable_from_type(argument_check.type_hint):
+                    raise TypeError(
+                        "With resolution='most_specific', the type hints must be"
+                        " classes or unions of classes, it's not the case of"
+                        f" argument '{argument_check.argument_name}' in"
+                        f" '{signature}'."
+                    )
+
+    def find_overload(
+        self, args: Tuple[object, ...], kwargs: Dict[str, object]
+    ) -> Optional[int]:
+        return self.find_overload_with_stats(args, kwargs)[0]
+
+    def find_overload_with_stats(
+        self, args: Tuple[object, ...], kwargs: Dict[str, object]
+    ) -> Tuple[Optional[int], int]:
+        call_shape = (len(args), tuple(kwargs))
+        root = self._roots.get(call_shape)
+        if root is None:
+            root = self._build_root(call_shape)
+        failed_checks = 0
+        compatible_candidates = []
+        for candidate in root.candidates:
+            for check in candidate[1]:
+                if not check.predicate(check.argument_check.extract(args, kwargs)):
+                    failed_checks += 1
+                    break
+            else:
+                compatible_candidates.append(candidate)
+        if not compatible_candidates:
+            return None, failed_checks
+        if len(compatible_candidates) == 1:
+            return compatible_candidates[0][0], failed_checks
+        return self._most_specific(compatible_candidates, args, kwargs), failed_checks
+
+    def find_ambiguous_overloads(self) -> List[Tuple[int, int]]:
+        """Pairs of overloads which are each more specific than the other for some
+        argument, when no other overload is exactly as specific as both.
+
+        Only calls with positional arguments are looked at, and only pairs whose
+        classes are subclasses of each other for every argument. Others can
+        still be ambiguous for some classes, it's then detected at the call.
+        """
+        ambiguous_pairs: Set[Tuple[int, int]] = set()
+        self.build_trees_without_keywords()
+        for (_, keywords), root in list(self._roots.items()):
+            if keywords:
+                continue
+            candidates = [
+                (overload_index, _static_classes_of(checks))
+                for overload_index, checks in root.candidates
+            ]
+            for position, (first_index, first) in enumerate(candidates):
+                for second_index, second in candidates[position + 1 :]:
+                    if (first_index, second_index) in ambiguous_pairs:
+                        continue
+                    if self._is_ambiguous_pair(first, second, candidates):
+                        ambiguous_pairs.add((first_index, second_index))
+        return sorted(ambiguous_pairs)
+
+    def _make_hit_counter(
+        self, candidates: Tuple[Candidate, ...]
+    ) -> Optional[HitCounter]:
+        # all the candidates are tried, their order doesn't matter
+        return None
+
+    def _most_specific(
+        self,
+        candidates: List[Candidate],
+        args: Tuple[object, ...],
+        kwargs: Dict[str, object],
+    ) -> int:
+        ranks = [_rank(checks, args, kwargs) for _, checks in candidates]
+        sources = {source for candidate_ranks in ranks for source in candidate_ranks}
+        for position, candidate_ranks in enumerate(ranks):
+            if all(
+                _is_at_least_as_specific(candidate_ranks, other_ranks, sources)
+                for other_ranks in ranks
+            ):
+                # exactly as specific ones are resolved in declaration order
+                return candidates[position][0]
+
+        best_signatures = [
+            str(self.signatures[overload_index])
+            for position, (overload_index, _) in enumerate(candidates)
+            if not any(
+                _is_at_least_as_specific(other_ranks, ranks[position], sources)
+                and not _is_at_least_as_specific(ranks[position], other_ranks, sources)
+                for other_ranks in ranks
+            )
+        ]
+        raise AmbiguousOverloadsError(
+            "The call matches several overloads, and none of them is more specific"
+            " than the others: "
+            + ", ".join(f"'{s}'" for s in best_signatures)
+        )
+
+    def _is_ambiguous_pair(
+        self,
+        first: Dict[Hashable, Tuple[type, ...]],
+        second: Dict[Hashable, Tuple[type, ...]],
+        candidates: Sequence[Tuple[int, Dict[Hashable, Tuple[type, ...]]]],
+    ) -> bool:
+        sources = first.keys() | second.keys()
+        first_is_narrower = second_is_narrower = False
+        intersection = {}
+        for source in sources:
+            first_classes = first.get(source, (object,))
+            second_classes = second.get(source, (object,))
+            if all(
+                self._are_disjoint_classes(first_class, second_class)
+                for first_class in first_classes
+                for second_class in second_classes
+            ):
+                # no call can match both
+                return False
+            first_narrower = _is_narrower(first_classes, second_classes)
+            second_narrower = _is_narrower(second_classes, first_classes)
+            if not (first_narrower or second_narrower):
+                # unrelated classes, it depends on the MRO of the argument
+                return False
+            first_is_narrower |= not second_narrower
+            second_is_narrower |= not first_narrower
+            intersection[source] = first_classes if first_narrower else second_classes
+        if not (first_is_narrower and second_is_narrower):
+            return False
+        # an overload for exactly the intersection of both resolves it
+        return not any(
+            _is_equivalent(classes, intersection) for _, classes in candidates
+        )
+
+
+def _static_classes_of(
+    checks: Sequence[ShapedCheck],
+) -> Dict[Hashable, Tuple[type, ...]]:
+    return {
+        check.source: classes_of(check.argument_check.type_hint) for check in checks
+    }
+
+
+def _rank(
+    checks: Sequence[ShapedCheck], args: Tuple[object, ...], kwargs: Dict[str, object]
+) -> Ranks:
+    ranks = {}
+    for check in checks:
+        classes = classes_of(check.argument_check.type_hint)
+        value = check.argument_check.extract(args, kwargs)
+        ranks[check.source] = (_rank_in_mro(value, classes), classes)
+    return ranks
+
+
+def _rank_in_mro(value: object, classes: Tuple[type, ...]) -> int:
+    """The lower, the more specific. `object` comes last, after the abstract
+    classes that the class of the value is only registered to, which are not in
+    its MRO."""
+    mro = type(value).__mro__
+    rank = LEAST_SPECIFIC
+    for cls in classes:
+        if cls is object or not isinstance(value, cls):
+            continue
+        rank = min(rank, mro.index(cls) if cls in mro else len(mro) - 1)
+    return rank
+
+
+def _is_at_least_as_specific(
+    ranks: Ranks, other_ranks: Ranks, sources: Set[Hashable]
+) -> bool:
+    for source in sources:
+        rank, classes = ranks.get(source, (LEAST_SPECIFIC, (object,)))
+        other_rank, other_classes = other_ranks.get(source, (LEAST_SPECIFIC, (object,)))
+        if rank > other_rank:
+            return False
+        if rank == other_rank and not _is_narrower(classes, other_classes):
+            return False
+    return True
+
+
+def _is_narrower(classes: Tuple[type, ...], other_classes: Tuple[type, ...]) -> bool:
+    """True if every instance of `classes` is an instance of `other_classes`."""
+    return all(
+        any(issubclass(cls, other_class) for other_class in other_classes)
+        for cls in classes
+    )
+
+
+def _is_equivalent(
+    classes: Dict[Hashable, Tuple[type, ...]],
+    other_classes: Dict[Hashable, Tuple[type, ...]],
+) -> bool:
+    for source in classes.keys() | other_classes.keys():
+        first = classes.get(source, (object,))
+        second = other_classes.get(source, (object,))
+        if not (_is_narrower(first, second) and _is_narrower(second, first)):
+            return False
+    return True
@@ -0,0 +1,91 @@
+"""Checks of NumPy arrays, like `NDArray[np.float32]`, with the dtype and ndim only.
+
+Runtime type checkers don't know what's inside an array, or they look at
+the elements. The dtype and the number of dimensions of an array are enough
+to decide, so the predicate reads `value.dtype` and `value.ndim`, and the
+result of the dtype check is cached per scalar type of the dtype.
+
+NumPy is never imported by overtake. If it's not imported already, no type
+hint can be a NumPy array.
+"""
+
+import sys
+from typing import Any, Callable, Dict, Optional, Tuple
+
+MAX_NUMBER_OF_CACHED_RESULTS = 1024
+
+
+def is_ndarray_type_hint(type_hint: object) -> bool:
+    numpy = sys.modules.get("numpy")
+    if numpy is None:
+        return False
+    return _origin_of(type_hint) is numpy.ndarray and len(_args_of(type_hint)) == 2
+
+
+def make_ndarray_predicate(type_hint: object) -> Optional[Callable[[object], bool]]:
+    """Returns None if the type hint is not a parametrized `numpy.ndarray`."""
+    if not is_ndarray_type_hint(type_hint):
+        return None
+    numpy = sys.modules["numpy"]
+    shape_type_hint, dtype_type_hint = _args_of(type_hint)
+    ndim = _ndim_of(shape_type_hint)
+    scalar_type = _scalar_type_of(dtype_type_hint, numpy)
+    ndarray = numpy.ndarray
+    # the dtype matches or not depending on its scalar type only
+    results: Dict[type, bool] = {}
+
+    def predicate(value: object) -> bool:
+        if not isinstance(value, ndarray):
+            return False
+        if ndim is not None and value.ndim != ndim:
+            return False
+        if scalar_type is None:
+            return True
+        dtype_type = value.dtype.type
+        if dtype_type is scalar_type:
+            return True
+        result = results.get(dtype_type)
+        if result is None:
+            result = issubclass(dtype_type, scalar_type)
+            if len(results) >= MAX_NUMBER_OF_CACHED_RESULTS:
+                results.clear()
+            results[dtype_type] = result
+        return result
+
+    return predicate
+
+
+def _ndim_of(shape_type_hint: object) -> Optional[int]:
+    """None if any number of dimensions is accepted."""
+    if _origin_of(shape_type_hint) is not tuple:
+        return None
+    dimensions = _args_of(shape_type_hint)
+    if not dimensions or (len(dimensions) == 2 and dimensions[1] is Ellipsis):
+        return None
+    return len(dimensions)
+
+
+def _scalar_type_of(dtype_type_hint: object, numpy: Any) -> Optional[type]:
+    """None if any dtype is accepted."""
+    if _origin_of(dtype_type_hint) is not numpy.dtype:
+        return None
+    (scalar_type,) = _args_of(dtype_type_hint)
+    if not isinstance(scalar_type, type):
+        # like np.floating[Any]
+        scalar_type = _origin_of(scalar_type)
+    if not isinstance(scalar_type, type) or scalar_type is Any:
+        # Any (a class since Python 3.11), or a TypeVar
+        return None
+    return scalar_type
+
+
+# `get_origin` and `get_args` don't know the generic aliases of NumPy before
+# Python 3.9, which all have the same attributes as the ones of `typing`
+
+
+def _origin_of(type_hint: object) -> object:
+    return getattr(type_hint, "__origin__", None)
+
+
+def _args_of(type_hint: object) -> Tuple[Any, ...]:
+    return getattr(type_hint, "__args__", ())
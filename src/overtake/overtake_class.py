@@ -1,21 +1,92 @@
 import inspect
+import threading
+import time
 import typing
-from typing import Callable, Dict, Generic, List, Optional, Set, Tuple, TypeVar, Union
+from typing import (
+    Callable,
+    Dict,
+    Generic,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Set,
+    Tuple,
+    TypeVar,
+    Union,
+)
+import weakref
 
-from typing_extensions import ParamSpec, Unpack
+from typing_extensions import ParamSpec
 
+from overtake.argument_binders import MISSING, ArgumentBinder, ArgumentCheck
+from overtake.container_checks import ContainerCheckChoice, parse_container_check
+from overtake.dispatch_cache import TypeDispatchCache
+from overtake.dispatch_stats import DispatchStats
 from overtake.incompatibility_reasons import (
+    DeferredIncompatibilityReason,
     FullIncompatibilityReason,
     IncompatibilityBind,
     IncompatibilityOverload,
+    IncompatibilityPredicate,
     IncompatibilityReason,
 )
 from overtake.lazy_inspection import LazyOverloadsInspection
-from overtake.runtime_type_checkers.umbrella import AVAILABLE_TYPE_CHECKERS, check_type
+from overtake.most_specific import ResolutionChoice, raise_if_invalid_resolution
+from overtake.predicates import is_checked_by_overtake
+from overtake.runtime_type_checkers.base import RuntimeTypeChecker
+from overtake.runtime_type_checkers.umbrella import (
+    RuntimeTypeCheckerChoice,
+    get_runtime_type_checker,
+)
 
 
 class CompatibleOverloadNotFoundError(Exception):
-    pass
+    """The message is built the first time it's read, including from `args`."""
+
+    def __init__(self, reason: Union[str, IncompatibilityReason]):
+        super().__init__()
+        self._set_reason(reason)
+
+    def _set_reason(self, reason: object) -> None:
+        self._reason = reason
+        self._message = reason if isinstance(reason, str) else None
+
+    def __str__(self) -> str:
+        if self._message is None:
+            self._message = str(self._reason)
+        return self._message
+
+    @property
+    def args(self) -> Tuple[object, ...]:
+        return (str(self),)
+
+    @args.setter
+    def args(self, args: Tuple[object, ...]) -> None:
+        self._set_reason(args[0] if args else "")
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}({str(self)!r})"
+
+    def __reduce__(self):
+        # the reason references the arguments of the call, which may not pickle
+        return type(self), (str(self),)
+
+
+class _NoCompatibleOverload:
+    def __repr__(self):
+        return "NO_COMPATIBLE_OVERLOAD"
+
+    def __bool__(self):
+        return False
+
+
+# returned by `try_dispatch()` instead of raising
+NO_COMPATIBLE_OVERLOAD = _NoCompatibleOverload()
+
+
+# Every registry alive, used by `overtake.warmup_all()`
+ALL_REGISTRIES: "weakref.WeakSet[OvertakenFunctionRegistry]" = weakref.WeakSet()
 
 
 T = TypeVar("T")
@@ -26,17 +97,59 @@ class OvertakenFunctionRegistry(Generic[P, T]):
     def __init__(
         self,
         overtaken_function: Callable[P, T],
-        runtime_type_checker: AVAILABLE_TYPE_CHECKERS,
+        runtime_type_checker: RuntimeTypeCheckerChoice,
+        container_check: ContainerCheckChoice = None,
+        takes_receiver: Optional[bool] = None,
+        resolution: ResolutionChoice = "first",
     ):
         self.overtaken_function = overtaken_function
         self._lazy_inspection: Optional[LazyOverloadsInspection] = None
-        self.runtime_type_checker: AVAILABLE_TYPE_CHECKERS = runtime_type_checker
+        # reentrant, so a call of the function during its inspection can't deadlock
+        self._inspection_lock = threading.RLock()
+        self.runtime_type_checker: RuntimeTypeCheckerChoice = runtime_type_checker
+        self.type_checker: RuntimeTypeChecker = get_runtime_type_checker(
+            runtime_type_checker
+        )
+        self.container_check = parse_container_check(container_check)
+        # True for methods and classmethods, `self` and `cls` are never checked,
+        # found from the overloads if None
+        self.takes_receiver = takes_receiver
+        raise_if_invalid_resolution(resolution)
+        self.resolution: ResolutionChoice = resolution
+        self.dispatch_cache = TypeDispatchCache()
+        # called by warmup(), for example to generate the compiled dispatcher
+        self.warmup_callbacks: List[Callable[[], None]] = []
+        self.stats = DispatchStats()
+        # called with True when stats are enabled, and False when disabled
+        self.stats_callbacks: List[Callable[[bool], None]] = []
+        ALL_REGISTRIES.add(self)
 
     @property
     def inspection_results(self) -> LazyOverloadsInspection:
-        if self._lazy_inspection is None:
-            self._lazy_inspection = LazyOverloadsInspection(self.overtaken_function)
-        return self._lazy_inspection
+        lazy_inspection = self._lazy_inspection
+        if lazy_inspection is None:
+            # threads calling the function for the first time wait for the first
+            # one to inspect it, once done, no lock is taken anymore
+            with self._inspection_lock:
+                lazy_inspection = self._lazy_inspection
+                if lazy_inspection is None:
+                    start = time.perf_counter()
+                    lazy_inspection = LazyOverloadsInspection(
+                        self.overtaken_function,
+                        self.type_checker,
+                        self.container_check,
+                        self.takes_receiver,
+                        self.resolution,
+                    )
+                    self.stats.inspection_seconds = time.perf_counter() - start
+                    self._lazy_inspection = lazy_inspection
+        return lazy_inspection
+
+    def warmup(self) -> None:
+        """Does the work of the first call in advance."""
+        self.inspection_results.decision_trees.build_trees_without_keywords()
+        for callback in self.warmup_callbacks:
+            callback()
 
     @property
     def implementations(self) -> List[Tuple[Callable, inspect.Signature]]:
@@ -46,63 +159,170 @@ class OvertakenFunctionRegistry(Generic[P, T]):
     def arguments_to_check(self) -> Set[str]:
         return self.inspection_results.arguments_to_check
 
+    @property
+    def binders(self) -> List[ArgumentBinder]:
+        return self.inspection_results.binders
+
     def __call__(self, *args: P.args, **kwargs: P.kwargs) -> T:
+        call_key_builder = self.inspection_results.call_key_builder
+        if call_key_builder is not None:
+            call_key = call_key_builder.make_key(args, kwargs)
+            cached_implementation = self.dispatch_cache.get(call_key)
+            if cached_implementation is not None:
+                return cached_implementation(*args, **kwargs)
+
+        overload_index = self.inspection_results.decision_trees.find_overload(
+            args, kwargs
+        )
+        if overload_index is None:
+            self.raise_no_compatible_overload(args, kwargs)
+
+        overloaded_implementation = self.implementations[overload_index][0]
+        if call_key_builder is not None:
+            self.dispatch_cache.add(
+                call_key,
+                call_key_builder.discriminating_values(args, kwargs),
+                overloaded_implementation,
+            )
+        return overloaded_implementation(*args, **kwargs)
+
+    def try_dispatch(
+        self, *args: P.args, **kwargs: P.kwargs
+    ) -> Union[Callable[P, T], _NoCompatibleOverload]:
+        """Returns the implementation that would be called with these arguments,
+        without calling it, or NO_COMPATIBLE_OVERLOAD if there is none.
+
+        Nothing is raised, and the incompatibilities are never looked for.
+        """
+        call_key_builder = self.inspection_results.call_key_builder
+        if call_key_builder is not None:
+            call_key = call_key_builder.make_key(args, kwargs)
+            cached_implementation = self.dispatch_cache.get(call_key)
+            if cached_implementation is not None:
+                return cached_implementation
+
+        overload_index = self.inspection_results.decision_trees.find_overload(
+            args, kwargs
+        )
+        if overload_index is None:
+            return NO_COMPATIBLE_OVERLOAD
+
+        overloaded_implementation = self.implementations[overload_index][0]
+        if call_key_builder is not None:
+            self.dispatch_cache.add(
+                call_key,
+                call_key_builder.discriminating_values(args, kwargs),
+                overloaded_implementation,
+            )
+        return overloaded_implementation
+
+    def map(
+        self, iterable: Iterable[object], lazy: bool = False
+    ) -> Union[List[T], Iterator[T]]:
+        """Calls the function with each element, see `starmap`."""
+        return self.starmap(((value,) for value in iterable), lazy=lazy)
+
+    def starmap(
+        self, iterable: Iterable[Tuple[object, ...]], lazy: bool = False
+    ) -> Union[List[T], Iterator[T]]:
+        """Calls the function with each tuple of positional arguments.
+
+        Returns the results in order, in a list, or in a generator if `lazy`.
+        """
+        results = self._iterate_starmap(iterable)
+        if lazy:
+            return results
+        return list(results)
+
+    def _iterate_starmap(self, iterable: Iterable[Tuple[object, ...]]) -> Iterator[T]:
+        if self.inspection_results.call_key_builder is None:
+            # the dispatch doesn't depend on the classes only
+            for args in iterable:
+                yield self(*args)  # type: ignore
+            return
+
+        # the calls are grouped by classes of the arguments, each group is
+        # dispatched once, then it's a dictionary lookup per call
+        implementations: Dict[Tuple[type, ...], Callable[..., T]] = {}
+        for args in iterable:
+            classes = tuple(map(type, args))
+            implementation = implementations.get(classes)
+            if implementation is None:
+                implementation = self._find_implementation(args)
+                if all(type(value) is value.__class__ for value in args):
+                    implementations[classes] = implementation
+            yield implementation(*args)
+
+    def _find_implementation(self, args: Tuple[object, ...]) -> Callable[..., T]:
+        overload_index = self.inspection_results.decision_trees.find_overload(args, {})
+        if overload_index is None:
+            self.raise_no_compatible_overload(args, {})
+        return self.implementations[overload_index][0]
+
+    def find_all_incompatibilities(
+        self, args: Tuple[object, ...], kwargs: Dict[str, object]
+    ) -> List[IncompatibilityOverload]:
+        """Replays all the checks, only used to build the error message."""
         incompatibilities = []
-        for overloaded_implementation, signature in self.implementations:
-            incompatibility = self.find_incompatibility(args, kwargs, signature)
-            if incompatibility is None:
-                return overloaded_implementation(*args, **kwargs)
-            else:
+        for (_, signature), binder in zip(self.implementations, self.binders):
+            incompatibility = self.find_incompatibility(args, kwargs, signature, binder)
+            if incompatibility is not None:
                 incompatibilities.append(
                     IncompatibilityOverload(signature, incompatibility)
                 )
-        else:
-            self.raise_full_incompatibility(incompatibilities)
+        return incompatibilities
 
-    def raise_full_incompatibility(
-        self, incompatibilities: List[IncompatibilityOverload]
+    def raise_no_compatible_overload(
+        self, args: Tuple[object, ...], kwargs: Dict[str, object]
     ) -> typing.NoReturn:
-        error_message = str(
-            FullIncompatibilityReason(self.overtaken_function, incompatibilities)
+        """The checks are replayed only if the message of the error is read, with
+        the arguments as they are at that time."""
+        raise CompatibleOverloadNotFoundError(
+            DeferredIncompatibilityReason(
+                lambda: FullIncompatibilityReason(
+                    self.overtaken_function,
+                    self.find_all_incompatibilities(args, kwargs),
+                )
+            )
         )
-        raise CompatibleOverloadNotFoundError(error_message)
 
     def find_incompatibility(
         self,
         args: Tuple[object, ...],
         kwargs: Dict[str, object],
         signature: inspect.Signature,
+        binder: ArgumentBinder,
     ) -> Union[IncompatibilityReason, None]:
-        try:
-            bound_arguments = signature.bind(*args, **kwargs)
-        except TypeError as e:
-            return IncompatibilityBind(e)
+        if not binder.can_bind(args, kwargs):
+            return IncompatibilityBind(signature, args, kwargs)
 
-        for argument_name in self.arguments_to_check:
-            if argument_name not in bound_arguments.arguments:
-                continue
-            argument_value = bound_arguments.arguments[argument_name]
-            type_hint = signature.parameters[argument_name].annotation
-            parameter = signature.parameters[argument_name]
-            if parameter.kind == inspect.Parameter.VAR_POSITIONAL:
-                # in wonder if we should take typing.Unpack into account here. For now, let's
-                # say that we ignore it.
-                type_hint = Tuple[type_hint, ...]
-            elif parameter.kind == inspect.Parameter.VAR_KEYWORD:
-                if typing.get_origin(type_hint) == Unpack:
-                    type_hint = typing.get_args(type_hint)[0]
-                else:
-                    type_hint = Dict[str, type_hint]  # type: ignore
-
-            if type_hint == inspect.Parameter.empty:
+        predicates = self.inspection_results.decision_trees.predicates
+        for argument_check in binder.checks:
+            argument_value = argument_check.extract(args, kwargs)
+            if argument_value is MISSING:
                 continue
 
-            incompatibility_reason = check_type(
-                argument_value, type_hint, argument_name, self.runtime_type_checker
-            )
-            if incompatibility_reason is None:
+            # the predicates decided the dispatch, so they decide here too
+            if predicates[id(argument_check)](argument_value):
                 continue
-            else:
-                return incompatibility_reason
+            return self.explain_incompatibility(argument_value, argument_check)
 
         return None
+
+    def explain_incompatibility(
+        self, argument_value: object, argument_check: ArgumentCheck
+    ) -> IncompatibilityReason:
+        type_hint = argument_check.type_hint
+        argument_name = argument_check.argument_name
+        if not is_checked_by_overtake(type_hint, self.container_check):
+            incompatibility_reason = self.type_checker.check_type(
+                argument_value, type_hint, argument_name
+            )
+            if incompatibility_reason is not None:
+                return incompatibility_reason
+        container_check_description = None
+        if self.container_check is not None:
+            container_check_description = self.container_check.description
+        return IncompatibilityPredicate(
+            argument_value, type_hint, argument_name, container_check_description
+        )
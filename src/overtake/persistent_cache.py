@@ -0,0 +1,139 @@
+"""Opt-in cache on disk of the dispatch plans, for short-lived processes.
+
+Like `__pycache__`, it stores what is computed from the signatures of the
+overloads at the first call: the arguments to check for each overload, how
+calls bind to each overload, and the overloads which can bind each number of
+positional arguments. The type hints themselves are still analyzed in each
+process, they are objects which cannot be saved.
+
+The entry of a function is named after its qualified name and the Python
+implementation. It's keyed by the version of overtake and a fingerprint of the
+signatures of the overloads, see `make_plan_fingerprint` in `lazy_inspection`.
+Any change in the overloads changes the key, so the entry is computed again and
+overwritten.
+
+Entries are only read when they can only have been written by the current
+user, like the cache directory. Otherwise, another user could make overtake
+load the data they want.
+
+The modules only needed to read and write the entries are imported when the
+cache is first used, so they don't slow down `import overtake`.
+"""
+
+import functools
+import os
+import re
+import sys
+from typing import Any, Callable, Optional, Union
+
+from overtake.display_objects import get_fully_qualified_name
+
+_cache_directory: Optional[str] = None
+
+
+def set_cache_directory(directory: Union[str, "os.PathLike[str]", None]) -> None:
+    """Enables the cache on disk in `directory`, or disables it with None."""
+    global _cache_directory
+    _cache_directory = None if directory is None else os.fspath(directory)
+
+
+def get_cache_directory() -> Optional[str]:
+    return _cache_directory
+
+
+def load_dispatch_plan(function: Callable, fingerprint: str) -> Optional[Any]:
+    """The plan saved for these overloads, or None if there is none."""
+    cache_directory = _cache_directory
+    if cache_directory is None:
+        return None
+    cache_file = os.path.join(cache_directory, _make_file_name(function))
+    return _read_entry(cache_file, _make_key(fingerprint))
+
+
+def save_dispatch_plan(function: Callable, fingerprint: str, plan: Any) -> None:
+    """The plan must only contain what `marshal` supports."""
+    cache_directory = _cache_directory
+    if cache_directory is None:
+        return
+    cache_file = os.path.join(cache_directory, _make_file_name(function))
+    _write_entry(cache_file, _make_key(fingerprint), plan)
+
+
+def _make_key(fingerprint: str) -> bytes:
+    import hashlib
+
+    return hashlib.sha256(
+        f"{_get_overtake_version()}\n{fingerprint}".encode("utf-8")
+    ).digest()
+
+
+def _make_file_name(function: Callable) -> str:
+    name = re.sub(r"[^\w.-]", "_", get_fully_qualified_name(function))
+    return f"{name}.{sys.implementation.cache_tag}.overtake"
+
+
+def _read_entry(cache_file: str, key: bytes) -> Optional[Any]:
+    import marshal
+
+    try:
+        if not _is_private(os.stat(os.path.dirname(cache_file))):
+            return None
+        with open(cache_file, "rb") as file:
+            if not _is_private(os.fstat(file.fileno())):
+                return None
+            content = file.read()
+    except OSError:
+        return None
+    if content[: len(key)] != key:
+        return None
+    try:
+        return marshal.loads(content[len(key) :])
+    except (EOFError, ValueError, TypeError):
+        return None
+
+
+def _is_private(status: os.stat_result) -> bool:
+    """True if only the current user can write the file or directory."""
+    import stat
+
+    if not hasattr(os, "getuid"):
+        # Windows, the permissions are not described by the mode
+        return True
+    return status.st_uid == os.getuid() and not status.st_mode & (
+        stat.S_IWGRP | stat.S_IWOTH
+    )
+
+
+def _write_entry(cache_file: str, key: bytes, plan: Any) -> None:
+    """Errors are ignored, the cache must never break the function."""
+    import marshal
+    import tempfile
+
+    directory = os.path.dirname(cache_file)
+    try:
+        # like the files created by mkstemp(), only readable by the current user
+        os.makedirs(directory, mode=0o700, exist_ok=True)
+        content = key + marshal.dumps(plan)
+        file_descriptor, temporary_path = tempfile.mkstemp(dir=directory)
+    except (OSError, ValueError):
+        return
+    try:
+        with os.fdopen(file_descriptor, "wb") as temporary_file:
+            temporary_file.write(content)
+        # atomic, other processes never see a partially written file
+        os.replace(temporary_path, cache_file)
+    except OSError:
+        try:
+            os.remove(temporary_path)
+        except OSError:
+            pass
+
+
+@functools.lru_cache(maxsize=None)
+def _get_overtake_version() -> str:
+    from importlib.metadata import PackageNotFoundError, version
+
+    try:
+        return version("overtake")
+    except PackageNotFoundError:
+        return "unknown"
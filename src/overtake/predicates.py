@@ -0,0 +1,51 @@
+"""Builds the predicates used when dispatching, one per argument to check.
+
+Some type hints are checked by overtake itself: NumPy arrays, literals, and
+containers when `@overtake(container_check=...)` is used. The others are given to the
+runtime type checker.
+"""
+
+from typing import Callable, Optional
+
+from overtake.container_checks import (
+    ContainerCheck,
+    container_kind,
+    make_container_predicate,
+)
+from overtake.literal_checks import is_literal_type_hint, make_literal_predicate
+from overtake.ndarray_checks import is_ndarray_type_hint, make_ndarray_predicate
+from overtake.runtime_type_checkers.base import RuntimeTypeChecker
+
+
+def make_predicate(
+    type_checker: RuntimeTypeChecker,
+    container_check: Optional[ContainerCheck],
+    type_hint: object,
+    argument_name: str,
+) -> Callable[[object], bool]:
+    ndarray_predicate = make_ndarray_predicate(type_hint)
+    if ndarray_predicate is not None:
+        return ndarray_predicate
+    literal_predicate = make_literal_predicate(type_hint)
+    if literal_predicate is not None:
+        return literal_predicate
+    if container_check is not None:
+        container_predicate = make_container_predicate(
+            type_hint,
+            container_check,
+            lambda element_type_hint: make_predicate(
+                type_checker, container_check, element_type_hint, argument_name
+            ),
+        )
+        if container_predicate is not None:
+            return container_predicate
+    return type_checker.make_predicate(type_hint, argument_name)
+
+
+def is_checked_by_overtake(
+    type_hint: object, container_check: Optional[ContainerCheck]
+) -> bool:
+    """If False, the runtime type checker can explain why a value is rejected."""
+    if is_ndarray_type_hint(type_hint) or is_literal_type_hint(type_hint):
+        return True
+    return container_check is not None and container_kind(type_hint) is not None
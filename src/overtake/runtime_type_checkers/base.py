@@ -0,0 +1,47 @@
+from abc import ABC, abstractmethod
+from typing import Callable, Optional
+
+from overtake.incompatibility_reasons import IncompatibilityReason
+
+
+class RuntimeTypeChecker(ABC):
+    """The interface of a runtime type checker backend.
+
+    The backend is chosen when `@overtake(...)` runs. When the overloads are
+    inspected, `make_predicate` is called once per argument to check, and the
+    predicates are then called directly when dispatching. `check_type` is only
+    used to explain why no overload matched.
+
+    Third-party backends can be made available under a name with
+    `overtake.register_runtime_type_checker` or with an entry point in the
+    `overtake.runtime_type_checkers` group.
+    """
+
+    # True if, for type hints which are plain classes (or unions of them), the
+    # result is always the same as isinstance(). Overtake then uses the class
+    # hierarchy to skip some checks.
+    isinstance_compatible: bool = False
+
+    # True if, for type hints which are plain classes (or unions of them), the
+    # result only depends on the class of the value. Overtake then caches the
+    # chosen overload per classes of the arguments.
+    decided_by_class: bool = False
+
+    def verify_availability(self) -> None:
+        """Raises if the backend cannot be used, called when decorating."""
+
+    @abstractmethod
+    def check_type(
+        self, argument_value: object, type_hint: object, argument_name: str
+    ) -> Optional[IncompatibilityReason]:
+        """Returns None if the value is compatible with the type hint."""
+
+    def make_predicate(
+        self, type_hint: object, argument_name: str
+    ) -> Callable[[object], bool]:
+        """Returns a function telling if a value is compatible with the type hint."""
+
+        def predicate(argument_value: object) -> bool:
+            return self.check_type(argument_value, type_hint, argument_name) is None
+
+        return predicate
@@ -1,6 +1,8 @@
-from typing import Optional
+from typing import Callable, Optional
 
 from overtake.incompatibility_reasons import IncompatibilityReason
+from overtake.runtime_type_checkers.base import RuntimeTypeChecker
+from overtake.type_hint_analysis import classes_of, is_decidable_from_type
 
 
 class IncompatibilityTypeHintBasic(IncompatibilityReason):
@@ -37,3 +39,22 @@ def check_type(
             " type hints. Run `pip install overtake[beartype]` "
             "and use `@overtake(runtime_type_checker='beartype')`."
         )
+
+
+class BasicTypeChecker(RuntimeTypeChecker):
+    isinstance_compatible = True
+    decided_by_class = True
+
+    def check_type(
+        self, argument_value: object, type_hint: object, argument_name: str
+    ) -> Optional[IncompatibilityReason]:
+        return check_type(argument_value, type_hint, argument_name)
+
+    def make_predicate(
+        self, type_hint: object, argument_name: str
+    ) -> Callable[[object], bool]:
+        if not is_decidable_from_type(type_hint):
+            # check_type() raises a helpful error if the hint is not supported
+            return super().make_predicate(type_hint, argument_name)
+        classes = classes_of(type_hint)
+        return lambda argument_value: isinstance(argument_value, classes)
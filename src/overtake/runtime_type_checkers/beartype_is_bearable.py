@@ -1,12 +1,11 @@
-from typing import Optional
+"""beartype is only imported when a function using this type checker is first
+called."""
 
-from overtake.incompatibility_reasons import IncompatibilityReason
+import importlib.util
+from typing import Callable, Optional
 
-try:
-    import beartype.door
-    import beartype.roar
-except ImportError:
-    beartype = None  # type: ignore
+from overtake.incompatibility_reasons import IncompatibilityReason
+from overtake.runtime_type_checkers.base import RuntimeTypeChecker
 
 
 class IncompatibilityTypeHintBeartype(IncompatibilityReason):
@@ -19,9 +18,12 @@ class IncompatibilityTypeHintBeartype(IncompatibilityReason):
         self.argument_name = argument_name
 
     def __str__(self):
+        import beartype.door
+        import beartype.roar
+
         try:
-            beartype.door.die_if_unbearable(self.value, self.type_hint)  # type: ignore
-        except beartype.roar.BeartypeDoorHintViolation as e:  # type: ignore
+            beartype.door.die_if_unbearable(self.value, self.type_hint)
+        except beartype.roar.BeartypeDoorHintViolation as e:
             return (
                 f"There is a type hint mismatch for argument {self.argument_name}: "
                 + str(e)
@@ -31,15 +33,62 @@ class IncompatibilityTypeHintBeartype(IncompatibilityReason):
 def check_type(
     argument_value: object, type_hint: object, argument_name: str
 ) -> Optional[IncompatibilityReason]:
-    if beartype.door.is_bearable(argument_value, type_hint):  # type: ignore
+    import beartype.door
+
+    if beartype.door.is_bearable(argument_value, type_hint):
         return None
     else:
         return IncompatibilityTypeHintBeartype(argument_value, type_hint, argument_name)
 
 
+def make_predicate(type_hint: object) -> Callable[[object], bool]:
+    """Returns the tester that beartype.door.is_bearable() would use for this hint.
+
+    This avoids the lookup of the tester at each call, which costs about ten
+    times the check itself. `make_func_tester` is private: if it's gone, or if
+    its signature changed, we fall back on is_bearable(). If beartype cannot
+    build the tester (unsupported hint), is_bearable() will raise the right
+    error when called.
+    """
+    import beartype.door
+    import beartype.roar
+
+    def is_bearable(value: object) -> bool:
+        return beartype.door.is_bearable(value, type_hint)
+
+    try:
+        from beartype import BeartypeConf
+        from beartype._check.checkmake import make_func_tester
+    except ImportError:
+        return is_bearable
+
+    try:
+        return make_func_tester(type_hint, BeartypeConf())
+    except (beartype.roar.BeartypeException, TypeError):
+        return is_bearable
+
+
 def verify_availability():
-    if beartype is None:
+    if importlib.util.find_spec("beartype") is None:
         raise RuntimeError(
             "You have used @overtake(runtime_type_checker='beartype') but beartype"
             " is not installed on your system. Use 'pip install overtake[beartype]'."
         )
+
+
+class BeartypeTypeChecker(RuntimeTypeChecker):
+    isinstance_compatible = True
+    decided_by_class = True
+
+    def verify_availability(self) -> None:
+        verify_availability()
+
+    def check_type(
+        self, argument_value: object, type_hint: object, argument_name: str
+    ) -> Optional[IncompatibilityReason]:
+        return check_type(argument_value, type_hint, argument_name)
+
+    def make_predicate(
+        self, type_hint: object, argument_name: str
+    ) -> Callable[[object], bool]:
+        return make_predicate(type_hint)
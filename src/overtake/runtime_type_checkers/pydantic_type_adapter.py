@@ -1,11 +1,15 @@
-from typing import Optional
+"""pydantic is only imported when a function using this type checker is first
+called, it's a heavy import."""
+
+from functools import lru_cache
+import importlib.util
+from typing import TYPE_CHECKING, Callable, Optional
 
 from overtake.incompatibility_reasons import IncompatibilityReason
+from overtake.runtime_type_checkers.base import RuntimeTypeChecker
 
-try:
+if TYPE_CHECKING:
     import pydantic
-except ImportError:
-    pydantic = None  # type: ignore
 
 
 class IncompatibilityTypeHintPydantic(IncompatibilityReason):
@@ -20,20 +24,75 @@ class IncompatibilityTypeHintPydantic(IncompatibilityReason):
         )
 
 
+@lru_cache(maxsize=512)
+def _get_cached_type_adapter(type_hint: object) -> "pydantic.TypeAdapter":
+    import pydantic
+
+    return pydantic.TypeAdapter(type_hint)  # type: ignore
+
+
+def get_type_adapter(type_hint: object) -> "pydantic.TypeAdapter":
+    """Building a TypeAdapter (and its schema) is much slower than validating,
+    so we build one per type hint and reuse it."""
+    try:
+        hash(type_hint)
+    except TypeError:
+        import pydantic
+
+        return pydantic.TypeAdapter(type_hint)  # type: ignore
+    return _get_cached_type_adapter(type_hint)
+
+
 def check_type(
     argument_value: object, type_hint: object, argument_name: str
 ) -> Optional[IncompatibilityReason]:
+    import pydantic
+
     try:
-        pydantic.TypeAdapter(type_hint).validate_python(argument_value, strict=True)  # type: ignore
-    except pydantic.ValidationError as e:  # type: ignore
+        get_type_adapter(type_hint).validate_python(argument_value, strict=True)
+    except pydantic.ValidationError as e:
         return IncompatibilityTypeHintPydantic(str(e), argument_name)
     return None
 
 
 def verify_availability():
-    if pydantic is None:
+    if importlib.util.find_spec("pydantic") is None:
         raise RuntimeError(
             "You have used @overtake(runtime_type_checker='pydantic') but pydantic is"
             " not installed on your system. Install overtake with 'pip install"
             " overtake[pydantic]"
         )
+
+
+class PydanticTypeChecker(RuntimeTypeChecker):
+    # even for plain classes, pydantic validates the content of the value, like
+    # the fields of a NamedTuple, so the overload can't be cached per class
+    decided_by_class = False
+
+    def verify_availability(self) -> None:
+        verify_availability()
+
+    def check_type(
+        self, argument_value: object, type_hint: object, argument_name: str
+    ) -> Optional[IncompatibilityReason]:
+        return check_type(argument_value, type_hint, argument_name)
+
+    def make_predicate(
+        self, type_hint: object, argument_name: str
+    ) -> Callable[[object], bool]:
+        from pydantic import ValidationError
+
+        try:
+            validate_python = get_type_adapter(type_hint).validate_python
+        except Exception:
+            # let check_type() raise the error if this argument is ever checked
+            return super().make_predicate(type_hint, argument_name)
+
+        def predicate(argument_value: object) -> bool:
+            try:
+                validate_python(argument_value, strict=True)
+            except ValidationError:
+                return False
+            return True
+
+        return predicate
@@ -1,35 +1,91 @@
-from typing import Literal, Optional
+from functools import lru_cache
+import importlib
+import sys
+from typing import Callable, Dict, Literal, Optional, Union
 
-from overtake.incompatibility_reasons import IncompatibilityReason
-import overtake.runtime_type_checkers.basic
-import overtake.runtime_type_checkers.beartype_is_bearable
-import overtake.runtime_type_checkers.pydantic_type_adapter
+from overtake.runtime_type_checkers.base import RuntimeTypeChecker
+from overtake.runtime_type_checkers.basic import BasicTypeChecker
 
 AVAILABLE_TYPE_CHECKERS = Literal["basic", "beartype", "pydantic"]
 
+# What can be given to @overtake(runtime_type_checker=...)
+RuntimeTypeCheckerChoice = Union[AVAILABLE_TYPE_CHECKERS, str, RuntimeTypeChecker]
 
-def check_type(
-    argument_value: object,
-    type_hint: object,
-    argument_name: str,
-    runtime_type_checker: AVAILABLE_TYPE_CHECKERS,
-) -> Optional[IncompatibilityReason]:
-    if runtime_type_checker == "basic":
-        return overtake.runtime_type_checkers.basic.check_type(
-            argument_value, type_hint, argument_name
-        )
-    elif runtime_type_checker == "beartype":
-        overtake.runtime_type_checkers.beartype_is_bearable.verify_availability()
-        return overtake.runtime_type_checkers.beartype_is_bearable.check_type(
-            argument_value, type_hint, argument_name
-        )
-    elif runtime_type_checker == "pydantic":
-        overtake.runtime_type_checkers.pydantic_type_adapter.verify_availability()
-        return overtake.runtime_type_checkers.pydantic_type_adapter.check_type(
-            argument_value, type_hint, argument_name
-        )
+ENTRY_POINTS_GROUP = "overtake.runtime_type_checkers"
+
+RuntimeTypeCheckerFactory = Union[RuntimeTypeChecker, Callable[[], RuntimeTypeChecker]]
+
+
+def _lazy_import(module_name: str, class_name: str) -> Callable[[], RuntimeTypeChecker]:
+    """The optional backends are only imported when a function uses them."""
+
+    @lru_cache(maxsize=None)
+    def factory() -> RuntimeTypeChecker:
+        module = importlib.import_module(module_name)
+        return getattr(module, class_name)()
+
+    return factory
+
+
+_registered_type_checkers: Dict[str, RuntimeTypeCheckerFactory] = {
+    "basic": BasicTypeChecker(),
+    "beartype": _lazy_import(
+        "overtake.runtime_type_checkers.beartype_is_bearable", "BeartypeTypeChecker"
+    ),
+    "pydantic": _lazy_import(
+        "overtake.runtime_type_checkers.pydantic_type_adapter", "PydanticTypeChecker"
+    ),
+}
+
+
+def register_runtime_type_checker(
+    name: str, runtime_type_checker: RuntimeTypeCheckerFactory
+) -> None:
+    """Makes a runtime type checker available with `@overtake(runtime_type_checker=name)`.
+
+    `runtime_type_checker` is a RuntimeTypeChecker instance, or a callable without
+    arguments returning one (like a RuntimeTypeChecker subclass).
+    """
+    _registered_type_checkers[name] = runtime_type_checker
+
+
+def get_runtime_type_checker(
+    runtime_type_checker: RuntimeTypeCheckerChoice,
+) -> RuntimeTypeChecker:
+    """Resolves the backend to use, called once, when the function is decorated."""
+    if isinstance(runtime_type_checker, RuntimeTypeChecker):
+        result = runtime_type_checker
     else:
-        raise ValueError(
-            f"Unknown runtime_type_checker. '{runtime_type_checker}' was provided, but"
-            " only 'basic' and 'beartype' are available"
-        )
+        factory = _registered_type_checkers.get(runtime_type_checker)
+        if factory is None:
+            factory = _load_from_entry_points(runtime_type_checker)
+        if factory is None:
+            available = ", ".join(f"'{name}'" for name in _registered_type_checkers)
+            raise ValueError(
+                f"Unknown runtime_type_checker. '{runtime_type_checker}' was provided,"
+                f" but only {available} are available"
+            )
+        if isinstance(factory, RuntimeTypeChecker):
+            result = factory
+        else:
+            result = factory()
+    result.verify_availability()
+    return result
+
+
+def _load_from_entry_points(name: str) -> Optional[RuntimeTypeCheckerFactory]:
+    if sys.version_info >= (3, 10):
+        from importlib.metadata import entry_points
+
+        candidates = entry_points(group=ENTRY_POINTS_GROUP)
+    else:
+        from importlib.metadata import entry_points
+
+        candidates = entry_points().get(ENTRY_POINTS_GROUP, [])
+
+    for entry_point in candidates:
+        if entry_point.name == name:
+            factory = entry_point.load()
+            register_runtime_type_checker(name, factory)
+            return factory
+    return None
@@ -0,0 +1,149 @@
+"""Static analysis of type hints, done once when the overloads are inspected."""
+
+from abc import ABCMeta
+import inspect
+import sys
+import typing
+from typing import Tuple, Union
+
+from typing_extensions import is_typeddict
+
+if sys.version_info >= (3, 10):
+    from types import UnionType
+
+    UNION_TYPES: Tuple[object, ...] = (Union, UnionType)
+else:
+    UNION_TYPES = (Union,)
+
+
+def is_union(type_hint: object) -> bool:
+    return typing.get_origin(type_hint) in UNION_TYPES
+
+
+def is_plain_class(type_hint: object) -> bool:
+    """A class for which `isinstance` only depends on the class of the object."""
+    if not isinstance(type_hint, type):
+        return False
+    if not _has_class_based_instance_checks(type_hint):
+        return False
+    if getattr(type_hint, "_is_protocol", False):
+        # runtime_checkable protocols look at the attributes of the object
+        return False
+    if is_typeddict(type_hint):
+        return False
+    return True
+
+
+def _has_class_based_instance_checks(cls: type) -> bool:
+    """A metaclass can make `isinstance` look at the value itself, like
+    `isinstance(x, int) and x > 0`.
+
+    `ABCMeta` only looks at the class of the value, but the answer changes when
+    a class is registered, see `depends_on_abc_registry`.
+    """
+    metaclass = type(cls)
+    return metaclass.__instancecheck__ in (
+        type.__instancecheck__,
+        ABCMeta.__instancecheck__,
+    ) and metaclass.__subclasscheck__ in (
+        type.__subclasscheck__,
+        ABCMeta.__subclasscheck__,
+    )
+
+
+def depends_on_abc_registry(type_hint: object) -> bool:
+    """For a hint decidable from the type, True if `ABC.register()` can change
+    which classes match it."""
+    return any(isinstance(cls, ABCMeta) for cls in classes_of(type_hint))
+
+
+def is_decidable_from_type(type_hint: object) -> bool:
+    """True if knowing `type(value)` is enough to know if `value` matches the hint.
+
+    This is the case for plain classes and unions of plain classes.
+    """
+    if type_hint is inspect.Parameter.empty or type_hint is None:
+        return True
+    if is_union(type_hint):
+        return all(is_decidable_from_type(arg) for arg in typing.get_args(type_hint))
+    return is_plain_class(type_hint)
+
+
+def classes_of(type_hint: object) -> Tuple[type, ...]:
+    """The classes to give to `isinstance`, for a hint decidable from the type."""
+    if type_hint is inspect.Parameter.empty:
+        return (object,)
+    if type_hint is None:
+        return (type(None),)
+    if is_union(type_hint):
+        return tuple(
+            cls for arg in typing.get_args(type_hint) for cls in classes_of(arg)
+        )
+    return (typing.cast(type, type_hint),)
+
+
+# from CPython's object.h
+Py_TPFLAGS_HEAPTYPE = 1 << 9
+Py_TPFLAGS_BASETYPE = 1 << 10
+
+
+def are_disjoint_classes(first: type, second: type) -> bool:
+    """True if it's proven that no object can be an instance of both classes.
+
+    This is the case when no class can inherit from both, like `int` and `str`
+    (their layouts are incompatible), or `bool` and anything else (it cannot be
+    subclassed). Two regular classes are never disjoint, a third class could
+    inherit from both.
+
+    No class is created to find out, it would stay in `__subclasses__()` of both
+    classes. When the layouts cannot be compared for sure, the classes are not
+    disjoint.
+    """
+    if type(first) is not type or type(second) is not type:
+        # ABCs and other metaclasses can accept classes which don't inherit
+        return False
+    if issubclass(first, second) or issubclass(second, first):
+        return False
+    if not (_can_be_subclassed(first) and _can_be_subclassed(second)):
+        return True
+    first_base = _solid_base(first)
+    second_base = _solid_base(second)
+    return not (
+        issubclass(first_base, second_base) or issubclass(second_base, first_base)
+    )
+
+
+def _can_be_subclassed(cls: type) -> bool:
+    return bool(cls.__flags__ & Py_TPFLAGS_BASETYPE)
+
+
+def _solid_base(cls: type) -> type:
+    """The closest class in the bases which defines the memory layout of the
+    instances, like `solid_base()` in CPython.
+
+    A class can inherit from two classes only if the solid base of one is a
+    subclass of the solid base of the other.
+    """
+    base = cls.__base__
+    if base is None:
+        return cls
+    solid_base = _solid_base(base)
+    if _adds_to_layout(cls, solid_base):
+        return cls
+    return solid_base
+
+
+def _adds_to_layout(cls: type, solid_base: type) -> bool:
+    if not cls.__flags__ & Py_TPFLAGS_HEAPTYPE:
+        # a static type, from C, its size is all that matters
+        return (
+            cls.__basicsize__ != solid_base.__basicsize__
+            or cls.__itemsize__ != solid_base.__itemsize__
+        )
+    # `__dict__` and `__weakref__` don't make the layouts incompatible.
+    # Heap types created from C without `__slots__` are considered to add nothing,
+    # they are not disjoint from anything at worst.
+    slots = vars(cls).get("__slots__", ())
+    if isinstance(slots, str):
+        slots = (slots,)
+    return any(slot not in ("__dict__", "__weakref__") for slot in slots)
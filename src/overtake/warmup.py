@@ -0,0 +1,50 @@
+"""Runs the work of the first call of every overtaken function in advance.
+
+Call `overtake.warmup_all()` once all the modules are imported, for example in
+the parent process before forking workers, so the workers share the result
+instead of paying for it in their first requests.
+"""
+
+import time
+import types
+from typing import Iterable, List, Optional, Tuple, Union
+
+from overtake.display_objects import get_fully_qualified_name
+from overtake.overtake_class import ALL_REGISTRIES
+
+
+def warmup_all(
+    modules: Optional[Iterable[Union[str, types.ModuleType]]] = None
+) -> List[Tuple[str, float]]:
+    """Inspects the overloads and builds the dispatch structures of every function
+    decorated with `@overtake`, or only of those defined in `modules` (and their
+    submodules).
+
+    Returns the fully qualified name of each function, with the number of
+    seconds spent on it, slowest first.
+    """
+    module_names = None
+    if modules is not None:
+        module_names = tuple(
+            module.__name__ if isinstance(module, types.ModuleType) else module
+            for module in modules
+        )
+
+    timings = []
+    for registry in list(ALL_REGISTRIES):
+        function_module = registry.overtaken_function.__module__
+        if module_names is not None and not any(
+            function_module == name or function_module.startswith(name + ".")
+            for name in module_names
+        ):
+            continue
+        start = time.perf_counter()
+        registry.warmup()
+        timings.append(
+            (
+                get_fully_qualified_name(registry.overtaken_function),
+                time.perf_counter() - start,
+            )
+        )
+    timings.sort(key=lambda timing: timing[1], reverse=True)
+    return timings
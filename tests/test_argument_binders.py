@@ -0,0 +1,73 @@
+import inspect
+import itertools
+from typing import List, Union
+
+from overtake.argument_binders import MISSING, ArgumentBinder
+import pytest
+from typing_extensions import Literal, Protocol
+
+
+def positional_only(a: int, b: int = 1, /, c: int = 2, *, d: int = 3):
+    ...
+
+
+def with_var_positional(a: int, *args: int, d: int):
+    ...
+
+
+def with_var_keyword(a: int, /, b: int, **kwargs: int):
+    ...
+
+
+def keyword_only(*, a: int, b: int = 2):
+    ...
+
+
+@pytest.mark.parametrize(
+    "function", [positional_only, with_var_positional, with_var_keyword, keyword_only]
+)
+def test_binder_matches_signature_bind(function):
+    signature = inspect.signature(function)
+    binder = ArgumentBinder(signature, set(signature.parameters))
+    keyword_candidates = ["a", "b", "c", "d", "e"]
+    for number_of_args in range(5):
+        args = tuple(range(number_of_args))
+        for number_of_keywords in range(4):
+            for names in itertools.combinations(keyword_candidates, number_of_keywords):
+                kwargs = {name: name for name in names}
+                try:
+                    bound_arguments = signature.bind(*args, **kwargs).arguments
+                except TypeError:
+                    assert not binder.can_bind(args, kwargs), (args, kwargs)
+                    continue
+                assert binder.can_bind(args, kwargs), (args, kwargs)
+                for check in binder.checks:
+                    value = check.extract(args, kwargs)
+                    if value is MISSING:
+                        assert check.argument_name not in bound_arguments
+                    else:
+                        assert bound_arguments[check.argument_name] == value
+
+
+class Named(Protocol):
+    name: str
+
+
+def mixed_costs(
+    a: List[int], b: Named, c: Union[int, str], d: int, e: Literal["x"], f: int
+):
+    ...
+
+
+def test_checks_sorted_by_cost():
+    signature = inspect.signature(mixed_costs)
+    binder = ArgumentBinder(signature, set(signature.parameters))
+    # ties keep the order of the signature
+    assert [check.argument_name for check in binder.checks] == [
+        "e",
+        "d",
+        "f",
+        "c",
+        "b",
+        "a",
+    ]
@@ -0,0 +1,127 @@
+from overtake import CompatibleOverloadNotFoundError, overtake
+import pytest
+from typing_extensions import overload
+
+
+def test_same_position_with_different_names():
+    @overload
+    def process(x: int) -> str:
+        return "int"
+
+    @overload
+    def process(y: str) -> str:
+        return "str"
+
+    @overtake
+    def process(*args, **kwargs):
+        ...
+
+    assert process(1) == "int"
+    assert process("a") == "str"
+    assert process(x=1) == "int"
+    assert process(y="a") == "str"
+    with pytest.raises(CompatibleOverloadNotFoundError):
+        process(2.5)
+    inspection_results = process.__overtake_registry__.inspection_results
+    assert inspection_results.arguments_to_check_per_overload == [{"x"}, {"y"}]
+
+
+def test_same_name_at_different_positions():
+    @overload
+    def scale(value: int, factor: int) -> str:
+        return "int"
+
+    @overload
+    def scale(factor: float, value: int) -> str:
+        return "float"
+
+    @overtake
+    def scale(*args, **kwargs):
+        ...
+
+    assert scale(1, 2) == "int"
+    assert scale(1.5, 2) == "float"
+    assert scale(value=1, factor=2) == "int"
+    assert scale(value=1, factor=1.5) == "float"
+    inspection_results = scale.__overtake_registry__.inspection_results
+    # `value` is an int at both positions it can come from
+    assert inspection_results.arguments_to_check_per_overload == [
+        {"value", "factor"},
+        {"factor"},
+    ]
+
+
+def test_var_positional_receiving_a_named_argument():
+    @overload
+    def join(first: int, second: str) -> str:
+        return "int and str"
+
+    @overload
+    def join(*values: str) -> str:
+        return "strings"
+
+    @overtake(runtime_type_checker="beartype")
+    def join(*args, **kwargs):
+        ...
+
+    assert join(1, "a") == "int and str"
+    assert join("a", "b") == "strings"
+    assert join("a", "b", "c") == "strings"
+    inspection_results = join.__overtake_registry__.inspection_results
+    # `second` is a str, like the values going to `*values`
+    assert inspection_results.arguments_to_check_per_overload == [{"first"}, {"values"}]
+
+
+def test_overloads_with_different_number_of_arguments():
+    @overload
+    def area(side: int) -> str:
+        return "square"
+
+    @overload
+    def area(width: float, height: float) -> str:
+        return "rectangle"
+
+    @overload
+    def area(width: str, height: str, unit: str) -> str:
+        return "with unit"
+
+    @overtake
+    def area(*args, **kwargs):
+        ...
+
+    assert area(2) == "square"
+    assert area(2.0, 3.0) == "rectangle"
+    assert area("2", "3", "m") == "with unit"
+    inspection_results = area.__overtake_registry__.inspection_results
+    # no call can bind two of the overloads, the arity is enough
+    assert inspection_results.arguments_to_check_per_overload == [set(), set(), set()]
+    assert inspection_results.arguments_to_check == set()
+
+
+def test_only_overlapping_overloads_are_told_apart():
+    @overload
+    def area(side: int) -> str:
+        return "square"
+
+    @overload
+    def area(side: float, unit: str = "m") -> str:
+        return "square with unit"
+
+    @overload
+    def area(width: str, height: str, unit: str) -> str:
+        return "rectangle"
+
+    @overtake
+    def area(*args, **kwargs):
+        ...
+
+    assert area(2) == "square"
+    assert area(2.0) == "square with unit"
+    assert area(2.0, "cm") == "square with unit"
+    assert area("2", "3", "m") == "rectangle"
+    inspection_results = area.__overtake_registry__.inspection_results
+    assert inspection_results.arguments_to_check_per_overload == [
+        {"side"},
+        {"side"},
+        set(),
+    ]
@@ -0,0 +1,117 @@
+from typing import List, Optional
+from unittest import mock
+
+from overtake import CompatibleOverloadNotFoundError, overtake
+import pytest
+import typing_extensions
+
+
+@typing_extensions.overload
+def my_function(my_var: int) -> str:
+    return f"int {my_var}"
+
+
+@typing_extensions.overload
+def my_function(my_var: Optional[str]) -> str:
+    return f"str {my_var}"
+
+
+@typing_extensions.overload
+def my_function(my_var: float, my_second: int) -> str:
+    return f"float {my_var} {my_second}"
+
+
+@overtake
+def my_function(my_var, my_second=None):
+    ...
+
+
+def test_map():
+    values = [1, "a", None, 2, True, "b"]
+    expected = ["int 1", "str a", "str None", "int 2", "int True", "str b"]
+    assert my_function.map(values) == expected
+    results = my_function.map(iter(values), lazy=True)
+    assert not isinstance(results, list)
+    assert list(results) == expected
+
+
+def test_starmap():
+    assert my_function.starmap([(1,), (2.5, 3), ("a",), (1.5, 2)]) == [
+        "int 1",
+        "float 2.5 3",
+        "str a",
+        "float 1.5 2",
+    ]
+
+
+def test_map_is_lazy():
+    calls = []
+
+    def values():
+        for value in [1, "a", 2]:
+            calls.append(value)
+            yield value
+
+    results = my_function.map(values(), lazy=True)
+    assert calls == []
+    assert next(results) == "int 1"
+    assert calls == [1]
+
+
+def test_map_raises_on_incompatible_element():
+    with pytest.raises(CompatibleOverloadNotFoundError):
+        my_function.map([1, b"a"])
+
+
+def test_map_with_objects_lying_about_their_class():
+    mock_int = mock.Mock(spec=int)
+    mock_str = mock.Mock(spec=str)
+    assert [result[:3] for result in my_function.map([mock_int, mock_str])] == [
+        "int",
+        "str",
+    ]
+
+
+def test_map_with_type_hints_not_decided_by_class():
+    pytest.importorskip("beartype")
+
+    @typing_extensions.overload
+    def generic_function(my_var: List[int]) -> str:
+        return "list of int"
+
+    @typing_extensions.overload
+    def generic_function(my_var: List[str]) -> str:
+        return "list of str"
+
+    @overtake(runtime_type_checker="beartype")
+    def generic_function(my_var):
+        ...
+
+    assert generic_function.map([[1], ["a"]]) == ["list of int", "list of str"]
+
+
+class Formatter:
+    def __init__(self, prefix: str):
+        self.prefix = prefix
+
+    @typing_extensions.overload
+    def format(self, value: int) -> str:
+        return f"{self.prefix} int {value}"
+
+    @typing_extensions.overload
+    def format(self, value: str, suffix: str = "") -> str:
+        return f"{self.prefix} str {value}{suffix}"
+
+    @overtake
+    def format(self, value, suffix=""):
+        ...
+
+
+def test_map_on_methods():
+    formatter = Formatter(">")
+    # the receiver is given like the other arguments
+    assert formatter.format.starmap([(formatter, 1), (formatter, "x", "!")]) == [
+        "> int 1",
+        "> str x!",
+    ]
+    assert list(Formatter.format.starmap([(formatter, "x")], lazy=True)) == ["> str x"]
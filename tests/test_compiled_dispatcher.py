@@ -0,0 +1,57 @@
+from typing import List, Optional
+
+from overtake import CompatibleOverloadNotFoundError, overtake
+from overtake.runtime_type_checkers.umbrella import AVAILABLE_TYPE_CHECKERS
+import pytest
+import typing_extensions
+
+
+@pytest.mark.parametrize("runtime_type_checker", ["basic", "beartype", "pydantic"])
+def test_compiled_dispatcher(runtime_type_checker: AVAILABLE_TYPE_CHECKERS):
+    @typing_extensions.overload
+    def my_function(my_var: int) -> str:
+        return "int"
+
+    @typing_extensions.overload
+    def my_function(my_var: Optional[str], my_second: float = 4.1) -> str:
+        return "str"
+
+    @typing_extensions.overload
+    def my_function(my_var: bytes, my_second: int, my_third: str) -> str:
+        return "bytes"
+
+    @overtake(runtime_type_checker=runtime_type_checker, compile=True)
+    def my_function(my_var, my_second=None, my_third=None):
+        ...
+
+    assert my_function.__name__ == "my_function"
+    assert my_function(3) == "int"
+    assert my_function("a") == "str"
+    assert my_function(None, 2.5) == "str"
+    assert my_function(my_var="a", my_second=2.5) == "str"
+    assert my_function(b"", 1, "") == "bytes"
+    assert my_function.__code__.co_name == "dispatch"
+
+    with pytest.raises(CompatibleOverloadNotFoundError):
+        my_function(3.5)
+
+
+@pytest.mark.parametrize("runtime_type_checker", ["beartype", "pydantic"])
+def test_compiled_dispatcher_generic_hints(
+    runtime_type_checker: AVAILABLE_TYPE_CHECKERS,
+):
+    @typing_extensions.overload
+    def my_function(my_var: List[int], *args: int) -> str:
+        return "int"
+
+    @typing_extensions.overload
+    def my_function(my_var: List[str], *args: str) -> str:
+        return "str"
+
+    @overtake(runtime_type_checker=runtime_type_checker, compile=True)
+    def my_function(my_var, *args):
+        ...
+
+    assert my_function([1]) == "int"
+    assert my_function(["a"], "b", "c") == "str"
+    assert my_function([1], 2, 3, 4, 5) == "int"
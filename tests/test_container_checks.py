@@ -0,0 +1,160 @@
+import collections
+from typing import Dict, List, Sequence, Set, Tuple
+
+from overtake import CompatibleOverloadNotFoundError, overtake
+from overtake.container_checks import ContainerCheck, parse_container_check
+import pytest
+import typing_extensions
+
+
+def make_function(container_check, runtime_type_checker="basic"):
+    @typing_extensions.overload
+    def my_function(my_var: List[int]) -> str:
+        return "list of int"
+
+    @typing_extensions.overload
+    def my_function(my_var: Dict[str, str]) -> str:
+        return "dict of str"
+
+    @typing_extensions.overload
+    def my_function(my_var: Sequence[str]) -> str:
+        return "sequence of str"
+
+    @typing_extensions.overload
+    def my_function(my_var: Set[float]) -> str:
+        return "set of float"
+
+    @overtake(
+        runtime_type_checker=runtime_type_checker, container_check=container_check
+    )
+    def my_function(my_var):
+        ...
+
+    return my_function
+
+
+@pytest.mark.parametrize("container_check", ["first", "sample(3)", "full"])
+@pytest.mark.parametrize("runtime_type_checker", ["basic", "beartype", "pydantic"])
+def test_container_check(container_check, runtime_type_checker):
+    if runtime_type_checker != "basic":
+        pytest.importorskip(runtime_type_checker)
+    my_function = make_function(container_check, runtime_type_checker)
+    assert my_function([1, 2, 3]) == "list of int"
+    assert my_function({"a": "b"}) == "dict of str"
+    assert my_function(("a", "b")) == "sequence of str"
+    assert my_function(["a"]) == "sequence of str"
+    assert my_function({1.0}) == "set of float"
+    assert my_function([]) == "list of int"
+
+    with pytest.raises(CompatibleOverloadNotFoundError) as err:
+        my_function({"a": 1})
+    assert f"container_check='{container_check}'" in str(err.value)
+
+
+def test_only_some_elements_are_checked():
+    values = [1] * 100 + ["a"] + [1] * 100
+    assert make_function("first")(values) == "list of int"
+    assert make_function("sample(2)")(values) == "list of int"
+    with pytest.raises(CompatibleOverloadNotFoundError):
+        make_function("sample(3)")(values)
+    with pytest.raises(CompatibleOverloadNotFoundError):
+        make_function("full")(values)
+
+
+def test_sequence_sampling_includes_both_ends():
+    container_check = ContainerCheck(3, "sample(3)")
+    assert container_check.select_from_sequence(list(range(101))) == [0, 50, 100]
+    assert container_check.select_from_sequence([0, 1]) == [0, 1]
+
+
+@pytest.mark.parametrize("container_check", ["first", "sample(1)", "sample(2)"])
+def test_sequences_without_slicing(container_check):
+    @typing_extensions.overload
+    def my_function(my_var: Sequence[int]) -> str:
+        return "sequence of int"
+
+    @typing_extensions.overload
+    def my_function(my_var: Sequence[str]) -> str:
+        return "sequence of str"
+
+    @overtake(container_check=container_check)
+    def my_function(my_var):
+        ...
+
+    assert my_function(collections.deque([1, 2, 3])) == "sequence of int"
+    assert my_function(collections.deque(["a", "b", "c"])) == "sequence of str"
+
+
+def test_var_args_and_var_kwargs():
+    @typing_extensions.overload
+    def my_function(*args: int, **kwargs: int) -> str:
+        return "int"
+
+    @typing_extensions.overload
+    def my_function(*args: str, **kwargs: str) -> str:
+        return "str"
+
+    @overtake(container_check="full")
+    def my_function(*args, **kwargs):
+        ...
+
+    assert my_function(1, 2, a=3) == "int"
+    assert my_function("1", "2", a="3") == "str"
+    with pytest.raises(CompatibleOverloadNotFoundError):
+        my_function(1, "2")
+
+
+def test_nested_containers_and_fixed_size_tuples():
+    pytest.importorskip("beartype")
+
+    @typing_extensions.overload
+    def my_function(my_var: List[List[int]]) -> str:
+        return "nested"
+
+    @typing_extensions.overload
+    def my_function(my_var: Tuple[int, str]) -> str:
+        return "fixed-size tuple"
+
+    @overtake(runtime_type_checker="beartype", container_check="first")
+    def my_function(my_var):
+        ...
+
+    assert my_function([[1], ["a"]]) == "nested"
+    assert my_function((1, "a")) == "fixed-size tuple"
+
+
+@pytest.mark.parametrize("container_check", ["sample(0)", "sample", "last", ""])
+def test_unknown_container_check_fails_at_decoration(container_check):
+    with pytest.raises(ValueError):
+        parse_container_check(container_check)
+    with pytest.raises(ValueError):
+        make_function(container_check)
+
+
+def test_cheap_checks_run_first():
+    class CountingList(list):
+        iterations = 0
+
+        def __iter__(self):
+            CountingList.iterations += 1
+            return super().__iter__()
+
+    @typing_extensions.overload
+    def my_function(my_var: List[int], name: int) -> str:
+        return "int"
+
+    @typing_extensions.overload
+    def my_function(my_var: List[str], name: str) -> str:
+        return "str"
+
+    @overtake(container_check="full")
+    def my_function(my_var, name):
+        ...
+
+    values = CountingList(range(1000))
+    assert my_function(values, 1) == "int"
+    assert CountingList.iterations == 1
+    # the first overload is rejected by `name`, the list is only walked once
+    with pytest.raises(CompatibleOverloadNotFoundError):
+        my_function(values, "a")
+    assert CountingList.iterations == 2
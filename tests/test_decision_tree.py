@@ -0,0 +1,242 @@
+import inspect
+import random
+from typing import Optional, Union
+
+from overtake import decision_tree, overtake
+from overtake.argument_binders import MISSING, ArgumentBinder, ArityIndex
+from overtake.decision_tree import DecisionTrees
+from overtake.literal_checks import make_literal_predicate
+from overtake.type_hint_analysis import are_disjoint_classes, classes_of
+import pytest
+import typing_extensions
+from typing_extensions import Literal
+
+HINTS = [
+    bool,
+    int,
+    float,
+    object,
+    str,
+    Union[int, str],
+    Optional[float],
+    Literal["a"],
+    Literal["a", 1],
+    Literal[1, True],
+    Optional[Literal["x", "y"]],
+]
+VALUES = [True, 1, 1.5, "a", None, b"", "x", []]
+
+
+def matches(value, type_hint) -> bool:
+    literal_predicate = make_literal_predicate(type_hint)
+    if literal_predicate is not None:
+        return literal_predicate(value)
+    # isinstance() only accepts unions since Python 3.10
+    return isinstance(value, classes_of(type_hint))
+
+
+def make_signature(rng: random.Random) -> inspect.Signature:
+    parameters = []
+    for name in ["a", "b", "c"][: rng.randint(1, 3)]:
+        parameters.append(
+            inspect.Parameter(
+                name,
+                inspect.Parameter.POSITIONAL_OR_KEYWORD,
+                annotation=rng.choice(HINTS),
+            )
+        )
+    return inspect.Signature(parameters)
+
+
+def linear_scan(binders, args, kwargs) -> Optional[int]:
+    for index, binder in enumerate(binders):
+        if not binder.can_bind(args, kwargs):
+            continue
+        for check in binder.checks:
+            value = check.extract(args, kwargs)
+            if value is not MISSING and not matches(value, check.type_hint):
+                break
+        else:
+            return index
+    return None
+
+
+@pytest.mark.parametrize("reordering_period", [decision_tree.REORDERING_PERIOD, 3])
+@pytest.mark.parametrize("isinstance_compatible", [True, False])
+def test_decision_tree_same_as_linear_scan(
+    isinstance_compatible: bool, reordering_period: int, monkeypatch
+):
+    monkeypatch.setattr(decision_tree, "REORDERING_PERIOD", reordering_period)
+    rng = random.Random(0)
+    for _ in range(200):
+        signatures = [make_signature(rng) for _ in range(rng.randint(1, 8))]
+        all_names = {name for s in signatures for name in s.parameters}
+        binders = [ArgumentBinder(signature, all_names) for signature in signatures]
+        trees = DecisionTrees(
+            binders,
+            ArityIndex(binders),
+            lambda check: lambda value: matches(value, check.type_hint),
+            isinstance_compatible,
+        )
+        for _ in range(60):
+            args = tuple(rng.choice(VALUES) for _ in range(rng.randint(0, 3)))
+            kwargs = {}
+            if rng.random() < 0.3:
+                kwargs["c"] = rng.choice(VALUES)
+            assert trees.find_overload(args, kwargs) == linear_scan(
+                binders, args, kwargs
+            )
+
+
+def test_decision_tree_runs_each_check_once():
+    checked = []
+
+    class Spy(type):
+        def __instancecheck__(cls, instance):
+            checked.append(cls.__name__)
+            return type.__instancecheck__(cls, instance)
+
+    class A(metaclass=Spy):
+        pass
+
+    class B(metaclass=Spy):
+        pass
+
+    class SubB(B):
+        pass
+
+    @typing_extensions.overload
+    def my_function(first: A, second: A) -> str:
+        return "A A"
+
+    @typing_extensions.overload
+    def my_function(first: A, second: B) -> str:
+        return "A B"
+
+    @typing_extensions.overload
+    def my_function(first: B, second: B) -> str:
+        return "B B"
+
+    @overtake
+    def my_function(first, second):
+        ...
+
+    # the checks of 'first: A' are shared by the first two overloads
+    assert my_function(SubB(), SubB()) == "B B"
+    assert checked == ["A", "B", "B"]
+
+
+def test_disjoint_overloads_are_reordered(monkeypatch):
+    monkeypatch.setattr(decision_tree, "REORDERING_PERIOD", 10)
+
+    class A:
+        pass
+
+    @typing_extensions.overload
+    def my_function(my_var: int) -> str:
+        return "int"
+
+    @typing_extensions.overload
+    def my_function(my_var: str) -> str:
+        return "str"
+
+    @typing_extensions.overload
+    def my_function(my_var: bytes) -> str:
+        return "bytes"
+
+    @typing_extensions.overload
+    def my_function(my_var: A) -> str:
+        return "A"
+
+    @overtake
+    def my_function(my_var):
+        ...
+
+    my_function(1)
+    trees = my_function.__overtake_registry__.inspection_results.decision_trees
+    for _ in range(10):
+        assert trees.find_overload((b"",), {}) == 2
+        assert trees.find_overload((A(),), {}) == 3
+
+    root = trees._roots[(1, ())]
+    # a class can inherit from both int and A, so A stays last
+    assert [index for index, _ in root.candidates] == [2, 0, 1, 3]
+    assert trees.find_overload((1,), {}) == 0
+    assert trees.find_overload(("a",), {}) == 1
+    assert trees.find_overload((A(),), {}) == 3
+
+
+class Slotted:
+    __slots__ = ("x",)
+
+
+class OtherSlotted:
+    __slots__ = ("y",)
+
+
+class Plugin:
+    pass
+
+
+@pytest.mark.parametrize(
+    "first, second, expected",
+    [
+        (int, str, True),
+        (bool, Plugin, True),
+        (Slotted, OtherSlotted, True),
+        (Slotted, int, True),
+        (int, Plugin, False),
+        (TypeError, ValueError, False),
+        (Slotted, Plugin, False),
+        (bool, int, False),
+    ],
+)
+def test_are_disjoint_classes(first, second, expected):
+    assert are_disjoint_classes(first, second) is expected
+    assert are_disjoint_classes(second, first) is expected
+
+
+def test_disjoint_classes_found_without_creating_subclasses():
+    class Other:
+        pass
+
+    @typing_extensions.overload
+    def my_function(my_var: Plugin) -> str:
+        return "plugin"
+
+    @typing_extensions.overload
+    def my_function(my_var: Other) -> str:
+        return "other"
+
+    @typing_extensions.overload
+    def my_function(my_var: int) -> str:
+        return "int"
+
+    @overtake
+    def my_function(my_var):
+        ...
+
+    assert my_function(1) == "int"
+    assert Plugin.__subclasses__() == []
+    assert Other.__subclasses__() == []
+    assert not any(
+        cls.__module__.startswith("overtake") for cls in int.__subclasses__()
+    )
+
+
+def test_no_reordering_without_disjoint_overloads():
+    @typing_extensions.overload
+    def my_function(my_var: int) -> str:
+        return "int"
+
+    @typing_extensions.overload
+    def my_function(my_var: object) -> str:
+        return "object"
+
+    @overtake
+    def my_function(my_var):
+        ...
+
+    my_function(1)
+    trees = my_function.__overtake_registry__.inspection_results.decision_trees
+    assert trees._roots[(1, ())].hit_counter is None
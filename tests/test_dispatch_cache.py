@@ -0,0 +1,186 @@
+from abc import ABC
+import gc
+from typing import List, NamedTuple, Union
+
+from overtake import overtake
+from overtake.dispatch_cache import CallKeyBuilder, TypeDispatchCache
+from overtake.runtime_type_checkers.umbrella import AVAILABLE_TYPE_CHECKERS
+import pytest
+import typing_extensions
+
+
+@pytest.mark.parametrize("runtime_type_checker", ["basic", "beartype"])
+def test_cache_is_used_for_classes(runtime_type_checker: AVAILABLE_TYPE_CHECKERS):
+    @typing_extensions.overload
+    def my_function(my_var: int, other: str) -> str:
+        return "int"
+
+    @typing_extensions.overload
+    def my_function(my_var: Union[str, bytes], other: str) -> str:
+        return "str or bytes"
+
+    @overtake(runtime_type_checker=runtime_type_checker)
+    def my_function(my_var, other):
+        ...
+
+    cache = my_function.__overtake_registry__.dispatch_cache
+    assert my_function(1, "a") == "int"
+    assert my_function(2, "b") == "int"
+    assert my_function(my_var=2, other="b") == "int"
+    assert len(cache) == 2
+    assert my_function(b"", "a") == "str or bytes"
+    assert my_function("", "a") == "str or bytes"
+    assert len(cache) == 4
+
+
+@pytest.mark.parametrize("runtime_type_checker", ["beartype", "pydantic"])
+def test_cache_not_used_for_generics(runtime_type_checker: AVAILABLE_TYPE_CHECKERS):
+    @typing_extensions.overload
+    def my_function(my_var: List[int]) -> str:
+        return "int"
+
+    @typing_extensions.overload
+    def my_function(my_var: List[str]) -> str:
+        return "str"
+
+    @overtake(runtime_type_checker=runtime_type_checker)
+    def my_function(my_var):
+        ...
+
+    assert my_function([1]) == "int"
+    assert my_function(["a"]) == "str"
+    assert len(my_function.__overtake_registry__.dispatch_cache) == 0
+
+
+class Point(NamedTuple):
+    x: int
+
+
+def test_cache_not_used_with_pydantic():
+    @typing_extensions.overload
+    def my_function(my_var: Point) -> str:
+        return "point"
+
+    @typing_extensions.overload
+    def my_function(my_var: object) -> str:
+        return "object"
+
+    @overtake(runtime_type_checker="pydantic")
+    def my_function(my_var):
+        ...
+
+    assert my_function(Point(1)) == "point"
+    # same class, but pydantic also validates the fields
+    assert my_function(Point("x")) == "object"  # type: ignore
+    assert len(my_function.__overtake_registry__.dispatch_cache) == 0
+
+
+class PositiveMeta(type):
+    def __instancecheck__(cls, instance: object) -> bool:
+        return isinstance(instance, int) and instance > 0
+
+
+class Positive(metaclass=PositiveMeta):
+    pass
+
+
+def test_cache_not_used_with_metaclass_instance_checks():
+    @typing_extensions.overload
+    def my_function(my_var: Positive) -> str:
+        return "positive"
+
+    @typing_extensions.overload
+    def my_function(my_var: int) -> str:
+        return "int"
+
+    @overtake
+    def my_function(my_var):
+        ...
+
+    assert my_function(5) == "positive"
+    assert my_function(-5) == "int"
+    assert len(my_function.__overtake_registry__.dispatch_cache) == 0
+
+
+def test_cache_invalidated_by_abc_register():
+    class Shape(ABC):
+        pass
+
+    class Square:
+        pass
+
+    @typing_extensions.overload
+    def my_function(my_var: Shape) -> str:
+        return "shape"
+
+    @typing_extensions.overload
+    def my_function(my_var: object) -> str:
+        return "object"
+
+    @overtake
+    def my_function(my_var):
+        ...
+
+    assert my_function(Square()) == "object"
+    Shape.register(Square)
+    assert my_function(Square()) == "shape"
+
+
+def test_cache_entries_removed_with_their_class():
+    @typing_extensions.overload
+    def my_function(my_var: int) -> str:
+        return "int"
+
+    @typing_extensions.overload
+    def my_function(my_var: object) -> str:
+        return "object"
+
+    @overtake
+    def my_function(my_var):
+        ...
+
+    class Dynamic:
+        pass
+
+    assert my_function(Dynamic()) == "object"
+    cache = my_function.__overtake_registry__.dispatch_cache
+    assert len(cache) == 1
+    del Dynamic
+    gc.collect()
+    assert len(cache) == 0
+
+
+def test_cache_eviction():
+    cache = TypeDispatchCache(maxsize=2)
+    cache.add((1, (), id(int)), [1], int)
+    cache.add((1, (), id(str)), [""], str)
+    cache.add((1, (), id(bytes)), [b""], bytes)
+    assert len(cache) == 2
+    assert cache.get((1, (), id(int))) is None
+    assert cache.get((1, (), id(bytes))) is bytes
+
+
+@pytest.mark.parametrize(
+    "positions, varargs_start, keywords, all_keywords, with_abc_cache_token",
+    [
+        ((0, 2), None, frozenset({"a", "c"}), False, False),
+        ((), None, frozenset({"a"}), False, False),
+        ((1,), 2, frozenset(), True, False),
+        ((0, 2), None, frozenset({"a", "c"}), False, True),
+    ],
+)
+def test_generated_key_same_as_general_key(
+    positions, varargs_start, keywords, all_keywords, with_abc_cache_token
+):
+    builder = CallKeyBuilder(
+        positions, varargs_start, keywords, all_keywords, with_abc_cache_token
+    )
+    for args, kwargs in [
+        ((), {}),
+        ((1,), {}),
+        ((1, "a", 2.5), {}),
+        ((1, "a", 2.5, None), {}),
+        ((1,), {"c": "a", "d": None}),
+        ((), {"a": 1, "b": 2}),
+    ]:
+        assert builder.make_key(args, kwargs) == builder.make_general_key(args, kwargs)
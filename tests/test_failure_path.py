@@ -0,0 +1,143 @@
+import inspect
+import pickle
+from unittest import mock
+
+from overtake import NO_COMPATIBLE_OVERLOAD, CompatibleOverloadNotFoundError, overtake
+from overtake.overtake_class import OvertakenFunctionRegistry
+import pytest
+import typing_extensions
+
+
+@typing_extensions.overload
+def my_function(my_var: int) -> str:
+    return f"int {my_var}"
+
+
+@typing_extensions.overload
+def my_function(my_var: str) -> str:
+    return f"str {my_var}"
+
+
+@overtake
+def my_function(my_var):
+    ...
+
+
+def test_error_message_is_built_when_read():
+    with mock.patch.object(
+        OvertakenFunctionRegistry,
+        "find_all_incompatibilities",
+        autospec=True,
+        side_effect=OvertakenFunctionRegistry.find_all_incompatibilities,
+    ) as find_all_incompatibilities:
+        with pytest.raises(CompatibleOverloadNotFoundError) as err:
+            my_function(2.5)
+        find_all_incompatibilities.assert_not_called()
+
+        message = str(err.value)
+        assert message.startswith("No compatible overload found for function")
+        assert "Incompatible with '(my_var: int) -> str'" in message
+        assert str(err.value) == message
+        find_all_incompatibilities.assert_called_once()
+
+
+def test_error_can_be_pickled():
+    with pytest.raises(CompatibleOverloadNotFoundError) as err:
+        my_function(2.5)
+    unpickled = pickle.loads(pickle.dumps(err.value))
+    assert str(unpickled) == str(err.value)
+    assert str(CompatibleOverloadNotFoundError("some message")) == "some message"
+
+
+def test_try_dispatch():
+    implementation = my_function.try_dispatch(1)
+    assert implementation(3) == "int 3"
+    assert my_function.try_dispatch(my_var="a")("b") == "str b"
+    # the second time, from the dispatch cache
+    assert my_function.try_dispatch(2) is implementation
+
+
+def test_try_dispatch_no_compatible_overload():
+    with mock.patch.object(
+        OvertakenFunctionRegistry, "find_all_incompatibilities"
+    ) as find_all_incompatibilities:
+        assert my_function.try_dispatch(2.5) is NO_COMPATIBLE_OVERLOAD
+        assert my_function.try_dispatch(1, 2) is NO_COMPATIBLE_OVERLOAD
+    find_all_incompatibilities.assert_not_called()
+    assert not NO_COMPATIBLE_OVERLOAD
+
+
+@pytest.mark.parametrize("compile", [False, True])
+def test_try_dispatch_on_any_wrapper(compile: bool):
+    @typing_extensions.overload
+    def other_function(my_var: int) -> str:
+        return "int"
+
+    @typing_extensions.overload
+    def other_function(my_var: object) -> str:
+        return "object"
+
+    @overtake(runtime_type_checker="beartype", compile=compile)
+    def other_function(my_var):
+        ...
+
+    assert other_function.try_dispatch(None)(None) == "object"
+    assert other_function.try_dispatch() is NO_COMPATIBLE_OVERLOAD
+
+
+def test_checks_not_replayed_on_success():
+    with mock.patch.object(
+        OvertakenFunctionRegistry, "find_all_incompatibilities"
+    ) as find_all_incompatibilities:
+        assert my_function("a") == "str a"
+        assert my_function(my_var="b") == "str b"
+    find_all_incompatibilities.assert_not_called()
+
+
+def test_error_args_and_repr():
+    with pytest.raises(CompatibleOverloadNotFoundError) as err:
+        my_function(2.5)
+    message = str(err.value)
+    assert err.value.args == (message,)
+    assert repr(err.value) == f"CompatibleOverloadNotFoundError({message!r})"
+
+
+class Model:
+    @typing_extensions.overload
+    def describe(self, value: int) -> str:
+        return f"int for {type(self).__name__}"
+
+    @typing_extensions.overload
+    def describe(self, value: str) -> str:
+        return f"str for {type(self).__name__}"
+
+    @overtake
+    def describe(self, value):
+        ...
+
+    @typing_extensions.overload
+    @classmethod
+    def create(cls, value: int) -> str:
+        return f"int for {cls.__name__}"
+
+    @typing_extensions.overload
+    @classmethod
+    def create(cls, value: str) -> str:
+        return f"str for {cls.__name__}"
+
+    @overtake
+    @classmethod
+    def create(cls, value):
+        ...
+
+
+def test_try_dispatch_on_methods():
+    model = Model()
+    # the receiver is given like the other arguments
+    implementation = model.describe.try_dispatch(model, 1)
+    assert implementation(model, 2) == "int for Model"
+    assert Model.describe.try_dispatch(model, value="a")(model, "b") == "str for Model"
+    assert Model.describe.try_dispatch(model, 2.5) is NO_COMPATIBLE_OVERLOAD
+    assert Model.create.try_dispatch(Model, 1)(Model, 2) == "int for Model"
+    # the methods stay functions, bound by Python itself
+    assert inspect.isfunction(Model.describe)
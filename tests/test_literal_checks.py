@@ -0,0 +1,103 @@
+import enum
+import inspect
+
+from overtake import CompatibleOverloadNotFoundError, overtake
+from overtake.argument_binders import ArgumentBinder, ArityIndex
+from overtake.decision_tree import DecisionTrees
+from overtake.literal_checks import make_literal_predicate
+from overtake.runtime_type_checkers.umbrella import AVAILABLE_TYPE_CHECKERS
+import pytest
+from typing_extensions import Literal, overload
+
+
+class Color(enum.Enum):
+    RED = 1
+    BLUE = 2
+
+
+@pytest.mark.parametrize("runtime_type_checker", ["basic", "beartype", "pydantic"])
+def test_dispatch_on_literals(runtime_type_checker: AVAILABLE_TYPE_CHECKERS):
+    @overload
+    def encode(value: object, format: Literal["json"]) -> str:
+        return "json"
+
+    @overload
+    def encode(value: object, format: Literal["msgpack", "cbor"]) -> str:
+        return "binary"
+
+    @overload
+    def encode(value: object, format: Literal[Color.RED]) -> str:
+        return "red"
+
+    @overload
+    def encode(value: object, format: Literal[1]) -> str:
+        return "one"
+
+    @overload
+    def encode(value: object, format: object) -> str:
+        return "fallback"
+
+    @overtake(runtime_type_checker=runtime_type_checker)
+    def encode(value, format):
+        ...
+
+    assert encode(None, "json") == "json"
+    assert encode(None, format="cbor") == "binary"
+    assert encode(None, Color.RED) == "red"
+    assert encode(None, Color.BLUE) == "fallback"
+    assert encode(None, 1) == "one"
+    # equal to 1, but not of the same class
+    assert encode(None, True) == "fallback"
+    assert encode(None, 1.0) == "fallback"
+    assert encode(None, ["json"]) == "fallback"
+
+
+def test_error_message_with_literals():
+    @overload
+    def encode(format: Literal["json"]) -> str:
+        ...
+
+    @overload
+    def encode(format: Literal["msgpack"]) -> str:
+        ...
+
+    @overtake
+    def encode(format):
+        ...
+
+    with pytest.raises(CompatibleOverloadNotFoundError) as err:
+        encode("yaml")
+    assert f"is not compatible with {Literal['json']!r}" in str(err.value)
+
+
+def test_literals_are_looked_up_once():
+    checked = []
+
+    def make_predicate(argument_check):
+        literal_predicate = make_literal_predicate(argument_check.type_hint)
+
+        def predicate(value):
+            checked.append(argument_check.type_hint)
+            return literal_predicate(value)
+
+        return predicate
+
+    signatures = [
+        inspect.Signature(
+            [
+                inspect.Parameter(
+                    "format",
+                    inspect.Parameter.POSITIONAL_OR_KEYWORD,
+                    annotation=Literal[f"format_{i}"],
+                )
+            ]
+        )
+        for i in range(100)
+    ]
+    binders = [ArgumentBinder(signature, {"format"}) for signature in signatures]
+    trees = DecisionTrees(binders, ArityIndex(binders), make_predicate, True)
+    assert trees.find_overload(("format_99",), {}) == 99
+    assert trees.find_overload(("format_0",), {}) == 0
+    assert trees.find_overload(("format_100",), {}) is None
+    assert trees.find_overload(([],), {}) is None
+    assert checked == []
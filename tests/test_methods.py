@@ -0,0 +1,202 @@
+import inspect
+from typing import Type
+
+from overtake import overtake
+import pytest
+import typing_extensions
+
+
+class Model:
+    @typing_extensions.overload
+    def describe(self: "Model", value: int) -> str:
+        return f"int for {type(self).__name__}"
+
+    @typing_extensions.overload
+    def describe(self, value: str) -> str:
+        return f"str for {type(self).__name__}"
+
+    @overtake
+    def describe(self, value):
+        ...
+
+    @typing_extensions.overload
+    @classmethod
+    def create(cls, value: int) -> str:
+        return f"int for {cls.__name__}"
+
+    @typing_extensions.overload
+    @classmethod
+    def create(cls, value: str) -> str:
+        return f"str for {cls.__name__}"
+
+    @overtake
+    @classmethod
+    def create(cls, value):
+        ...
+
+    @typing_extensions.overload
+    @staticmethod
+    def convert(value: int) -> str:
+        return "int"
+
+    @typing_extensions.overload
+    @staticmethod
+    def convert(value: str) -> str:
+        return "str"
+
+    @overtake(compile=True)
+    @staticmethod
+    def convert(value):
+        ...
+
+
+class SubModel(Model):
+    pass
+
+
+def test_instance_method():
+    assert Model().describe(1) == "int for Model"
+    assert SubModel().describe("a") == "str for SubModel"
+    assert Model.describe(SubModel(), 1) == "int for SubModel"
+    # `self` is never checked, so the dispatch cache is shared by all receivers
+    registry = Model.describe.__overtake_registry__
+    assert registry.arguments_to_check == {"value"}
+    assert len(registry.dispatch_cache) == 2
+
+
+def test_classmethod():
+    assert Model.create(1) == "int for Model"
+    assert SubModel.create("a") == "str for SubModel"
+    assert SubModel().create(1) == "int for SubModel"
+    registry = Model.__dict__["create"].__func__.__overtake_registry__
+    assert registry.arguments_to_check == {"value"}
+
+
+def test_staticmethod():
+    assert Model.convert(1) == "int"
+    assert Model().convert("a") == "str"
+    assert SubModel.convert("a") == "str"
+    assert Model.convert.__code__.co_name == "dispatch"
+
+
+def test_function_defined_in_a_function_is_not_a_method():
+    @typing_extensions.overload
+    def my_function(my_var: int, my_second: int) -> str:
+        return "int"
+
+    @typing_extensions.overload
+    def my_function(my_var: str, my_second: int) -> str:
+        return "str"
+
+    @overtake
+    def my_function(my_var, my_second):
+        ...
+
+    assert my_function("a", 1) == "str"
+    assert my_function.__overtake_registry__.arguments_to_check == {"my_var"}
+
+
+@typing_extensions.overload
+def describe_class(cls: Type[int]) -> str:
+    return "int"
+
+
+@typing_extensions.overload
+def describe_class(cls: Type[str]) -> str:
+    return "str"
+
+
+@overtake(runtime_type_checker="beartype")
+def describe_class(cls):
+    ...
+
+
+def test_module_level_function_with_cls_parameter_is_not_a_method():
+    pytest.importorskip("beartype")
+    assert describe_class(int) == "int"
+    assert describe_class(str) == "str"
+    assert describe_class.__overtake_registry__.arguments_to_check == {"cls"}
+    assert inspect.isfunction(describe_class)
+
+
+@pytest.mark.parametrize("runtime_type_checker", ["basic", "beartype", "pydantic"])
+def test_receiver_is_never_checked(runtime_type_checker):
+    if runtime_type_checker != "basic":
+        pytest.importorskip(runtime_type_checker)
+
+    class Receiver:
+        @typing_extensions.overload
+        def method(self: "Receiver", value: int) -> str:
+            return "int"
+
+        @typing_extensions.overload
+        def method(self: "Unknown", value: str) -> str:  # type: ignore # noqa: F821
+            return "str"
+
+        @overtake(runtime_type_checker=runtime_type_checker)
+        def method(self, value):
+            ...
+
+    assert Receiver().method(1) == "int"
+    assert Receiver().method("a") == "str"
+
+
+class DecoratedAfterOvertake:
+    @typing_extensions.overload
+    @staticmethod
+    def convert(value: int) -> str:
+        return "int"
+
+    @typing_extensions.overload
+    @staticmethod
+    def convert(value: str) -> str:
+        return "str"
+
+    @staticmethod
+    @overtake
+    def convert(value):
+        ...
+
+    @typing_extensions.overload
+    def plain_overloads(value: int) -> str:
+        return "int"
+
+    @typing_extensions.overload
+    def plain_overloads(value: str) -> str:
+        return "str"
+
+    @staticmethod
+    @overtake
+    def plain_overloads(value):
+        ...
+
+    @typing_extensions.overload
+    @classmethod
+    def create(cls, value: int) -> str:
+        return f"int for {cls.__name__}"
+
+    @typing_extensions.overload
+    @classmethod
+    def create(cls, value: str) -> str:
+        return f"str for {cls.__name__}"
+
+    @classmethod
+    @overtake
+    def create(cls, value):
+        ...
+
+
+@pytest.mark.parametrize("method_name", ["convert", "plain_overloads"])
+def test_staticmethod_applied_after_overtake(method_name):
+    method = getattr(DecoratedAfterOvertake, method_name)
+    assert method(1) == "int"
+    assert method("a") == "str"
+    assert getattr(DecoratedAfterOvertake(), method_name)("a") == "str"
+    assert method.__overtake_registry__.arguments_to_check == {"value"}
+
+
+def test_classmethod_applied_after_overtake():
+    assert DecoratedAfterOvertake.create(1) == "int for DecoratedAfterOvertake"
+    assert DecoratedAfterOvertake().create("a") == "str for DecoratedAfterOvertake"
+    registry = DecoratedAfterOvertake.create.__func__.__overtake_registry__
+    assert registry.arguments_to_check == {"value"}
@@ -0,0 +1,182 @@
+from collections.abc import Sized
+from typing import List, Union
+import warnings
+
+from overtake import AmbiguousOverloadsError, AmbiguousOverloadsWarning, overtake
+import pytest
+import typing_extensions
+
+
+class Animal:
+    pass
+
+
+class Dog(Animal):
+    pass
+
+
+@pytest.mark.parametrize("runtime_type_checker", ["basic", "beartype"])
+def test_most_specific_overload_wins(runtime_type_checker):
+    @typing_extensions.overload
+    def describe(animal: Animal) -> str:
+        return "animal"
+
+    @typing_extensions.overload
+    def describe(animal: Dog) -> str:
+        return "dog"
+
+    @overtake(runtime_type_checker=runtime_type_checker, resolution="most_specific")
+    def describe(animal):
+        ...
+
+    assert describe(Dog()) == "dog"
+    assert describe(Animal()) == "animal"
+    assert describe(animal=Dog()) == "dog"
+    # the choice is cached per class
+    assert describe(Dog()) == "dog"
+    assert len(describe.__overtake_registry__.dispatch_cache) == 3
+
+
+def test_several_arguments():
+    @typing_extensions.overload
+    def meet(first: Animal, second: Animal) -> str:
+        return "animal animal"
+
+    @typing_extensions.overload
+    def meet(first: Dog, second: Animal) -> str:
+        return "dog animal"
+
+    @typing_extensions.overload
+    def meet(first: Dog, second: Dog) -> str:
+        return "dog dog"
+
+    @overtake(resolution="most_specific")
+    def meet(first, second):
+        ...
+
+    assert meet(Animal(), Dog()) == "animal animal"
+    assert meet(Dog(), Animal()) == "dog animal"
+    assert meet(Dog(), Dog()) == "dog dog"
+
+
+def test_ambiguous_overloads():
+    @typing_extensions.overload
+    def meet(first: Dog, second: Animal) -> str:
+        return "dog animal"
+
+    @typing_extensions.overload
+    def meet(first: Animal, second: Dog) -> str:
+        return "animal dog"
+
+    @overtake(resolution="most_specific")
+    def meet(first, second):
+        ...
+
+    with pytest.warns(AmbiguousOverloadsWarning, match="are ambiguous") as record:
+        assert meet(Dog(), Animal()) == "dog animal"
+    # the warning points at the call, not inside overtake
+    assert record[0].filename == __file__
+    assert meet(Animal(), Dog()) == "animal dog"
+    with pytest.raises(AmbiguousOverloadsError) as err:
+        meet(Dog(), Dog())
+    assert "second: test_most_specific.Animal) -> str'" in str(err.value)
+    assert "second: test_most_specific.Dog) -> str'" in str(err.value)
+
+
+def test_ambiguity_resolved_by_a_more_specific_overload():
+    @typing_extensions.overload
+    def meet(first: Dog, second: Animal) -> str:
+        return "dog animal"
+
+    @typing_extensions.overload
+    def meet(first: Animal, second: Dog) -> str:
+        return "animal dog"
+
+    @typing_extensions.overload
+    def meet(first: Dog, second: Dog) -> str:
+        return "dog dog"
+
+    @overtake(resolution="most_specific")
+    def meet(first, second):
+        ...
+
+    with warnings.catch_warnings():
+        warnings.simplefilter("error", AmbiguousOverloadsWarning)
+        assert meet(Dog(), Dog()) == "dog dog"
+
+
+def test_multiple_inheritance_follows_the_mro():
+    class Swimmer:
+        pass
+
+    class Flyer:
+        pass
+
+    class Duck(Swimmer, Flyer):
+        pass
+
+    @typing_extensions.overload
+    def move(animal: Flyer, speed: int) -> str:
+        return "fly"
+
+    @typing_extensions.overload
+    def move(animal: Swimmer, speed: object) -> str:
+        return "swim"
+
+    @overtake(resolution="most_specific")
+    def move(animal, speed):
+        ...
+
+    assert move(Duck(), "fast") == "swim"
+    with pytest.raises(AmbiguousOverloadsError):
+        move(Duck(), 3)
+
+
+def test_ties_on_the_class():
+    @typing_extensions.overload
+    def show(value: Union[int, str]) -> str:
+        return "int or str"
+
+    @typing_extensions.overload
+    def show(value: int) -> str:
+        return "int"
+
+    @typing_extensions.overload
+    def show(value: object) -> str:
+        return "object"
+
+    @typing_extensions.overload
+    def show(value: Sized) -> str:
+        return "sized"
+
+    @overtake(resolution="most_specific")
+    def show(value):
+        ...
+
+    assert show(1) == "int"
+    assert show("a") == "int or str"
+    assert show(2.5) == "object"
+    # list is only registered as Sized, it's not in its MRO
+    assert show([1]) == "sized"
+
+
+def test_invalid_configurations():
+    @typing_extensions.overload
+    def count(values: List[int]) -> int:
+        ...
+
+    @typing_extensions.overload
+    def count(values: str) -> int:
+        ...
+
+    @overtake(runtime_type_checker="beartype", resolution="most_specific")
+    def count(values):
+        ...
+
+    with pytest.raises(TypeError, match="classes or unions of classes"):
+        count("a")
+
+    with pytest.raises(ValueError, match="Invalid resolution"):
+        overtake(resolution="last")(count)
+    with pytest.raises(ValueError, match="compile=True"):
+        overtake(resolution="most_specific", compile=True)(count)
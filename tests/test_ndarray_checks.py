@@ -0,0 +1,76 @@
+import subprocess
+import sys
+from typing import Any, Tuple
+
+from overtake import CompatibleOverloadNotFoundError, overtake
+import pytest
+import typing_extensions
+
+np = pytest.importorskip("numpy")
+npt = pytest.importorskip("numpy.typing")
+
+
+@pytest.mark.parametrize("runtime_type_checker", ["basic", "beartype", "pydantic"])
+def test_dispatch_on_dtype(runtime_type_checker):
+    if runtime_type_checker != "basic":
+        pytest.importorskip(runtime_type_checker)
+
+    @typing_extensions.overload
+    def my_function(my_var: npt.NDArray[np.float32]) -> str:
+        return "float32"
+
+    @typing_extensions.overload
+    def my_function(my_var: npt.NDArray[np.int64]) -> str:
+        return "int64"
+
+    @typing_extensions.overload
+    def my_function(my_var: npt.NDArray[np.floating]) -> str:
+        return "floating"
+
+    @overtake(runtime_type_checker=runtime_type_checker)
+    def my_function(my_var):
+        ...
+
+    assert my_function(np.zeros(3, dtype=np.float32)) == "float32"
+    assert my_function(np.zeros((3, 2), dtype=np.int64)) == "int64"
+    assert my_function(np.zeros(3, dtype=np.float16)) == "floating"
+    with pytest.raises(CompatibleOverloadNotFoundError):
+        my_function(np.zeros(3, dtype=np.int8))
+    with pytest.raises(CompatibleOverloadNotFoundError):
+        my_function([1.0, 2.0])
+
+
+@pytest.mark.skipif(
+    sys.version_info < (3, 9), reason="np.ndarray can be subscripted since Python 3.9"
+)
+def test_dispatch_on_ndim():
+    @typing_extensions.overload
+    def my_function(my_var: np.ndarray[Tuple[int], np.dtype[Any]]) -> str:
+        return "vector"
+
+    @typing_extensions.overload
+    def my_function(my_var: np.ndarray[Tuple[int, int], np.dtype[np.float64]]) -> str:
+        return "matrix of float64"
+
+    @typing_extensions.overload
+    def my_function(my_var: np.ndarray[Any, np.dtype[Any]]) -> str:
+        return "any array"
+
+    @overtake(compile=True)
+    def my_function(my_var):
+        ...
+
+    assert my_function(np.zeros(3, dtype=np.int8)) == "vector"
+    assert my_function(np.zeros((3, 2))) == "matrix of float64"
+    assert my_function(np.zeros((3, 2), dtype=np.int8)) == "any array"
+    assert my_function(np.zeros((3, 2, 1))) == "any array"
+
+
+def test_numpy_is_not_imported():
+    code = (
+        "import sys; from overtake import overtake; from typing_extensions import"
+        " overload\n@overload\ndef f(x: int) -> int: ...\n@overload\ndef f(x: str)"
+        " -> int: ...\n@overtake\ndef f(x): ...\nf(1)\nassert 'numpy' not in"
+        " sys.modules"
+    )
+    subprocess.run([sys.executable, "-c", code], check=True)
@@ -0,0 +1,112 @@
+import os
+import sys
+
+import overtake
+from overtake import lazy_inspection, persistent_cache
+from overtake import overtake as overtake_decorator
+import pytest
+import typing_extensions
+
+
+@pytest.fixture
+def cache_directory(tmp_path):
+    overtake.set_cache_directory(tmp_path)
+    yield tmp_path
+    overtake.set_cache_directory(None)
+
+
+def make_function(second_type, with_third_overload=False, compile=False):
+    @typing_extensions.overload
+    def my_function(my_var: int) -> str:
+        return "int"
+
+    @typing_extensions.overload
+    def my_function(my_var: second_type) -> str:  # type: ignore
+        return "second"
+
+    if with_third_overload:
+
+        @typing_extensions.overload
+        def my_function(my_var: int, my_second: int) -> str:
+            return "third"
+
+    @overtake_decorator(compile=compile)
+    def my_function(my_var, my_second=None):
+        ...
+
+    return my_function
+
+
+def load_plan(my_function):
+    inspection_results = my_function.__overtake_registry__.inspection_results
+    fingerprint = lazy_inspection.make_plan_fingerprint(
+        inspection_results.implementations, inspection_results.takes_receiver
+    )
+    return persistent_cache.load_dispatch_plan(my_function, fingerprint)
+
+
+def test_dispatch_plan_is_cached_on_disk(cache_directory, monkeypatch):
+    assert make_function(str)("a") == "second"
+    (cache_file,) = cache_directory.iterdir()
+    assert "my_function" in cache_file.name
+
+    def fail(*args, **kwargs):
+        raise AssertionError("the plan should be read from the cache")
+
+    monkeypatch.setattr(lazy_inspection, "_find_arguments_to_check", fail)
+    my_function = make_function(str)
+    assert my_function("a") == "second"
+    assert my_function(1) == "int"
+    assert my_function.__overtake_registry__.arguments_to_check == {"my_var"}
+    # the compiled dispatcher is generated from the same inspection results
+    assert make_function(str, compile=True)("a") == "second"
+
+    # the plan doesn't depend on the type hints themselves, it can be reused
+    content = cache_file.read_bytes()
+    assert make_function(bytes)(b"") == "second"
+    monkeypatch.undo()
+    assert cache_file.read_bytes() == content
+
+    # the overloads changed, the entry is replaced
+    my_function = make_function(str, with_third_overload=True)
+    assert my_function(1, 2) == "third"
+    assert cache_file.read_bytes() != content
+
+
+def test_plan_depends_on_which_type_hints_are_equal(cache_directory):
+    # the same source, but no argument needs to be checked when both are int
+    assert make_function(int)("a") == "int"
+    assert make_function(str)("a") == "second"
+    assert make_function(str)(1) == "int"
+
+
+def test_corrupted_entries_are_ignored(cache_directory):
+    assert make_function(str)("a") == "second"
+    (cache_file,) = cache_directory.iterdir()
+    cache_file.write_bytes(cache_file.read_bytes()[:40])
+    assert make_function(str)("a") == "second"
+    assert make_function(str)(1) == "int"
+
+
+@pytest.mark.skipif(sys.platform == "win32", reason="no permissions in the mode")
+def test_entries_writable_by_other_users_are_ignored(cache_directory):
+    my_function = make_function(str)
+    assert my_function("a") == "second"
+    assert load_plan(my_function) is not None
+    (cache_file,) = cache_directory.iterdir()
+
+    os.chmod(cache_file, 0o666)
+    assert load_plan(my_function) is None
+    os.chmod(cache_file, 0o600)
+    os.chmod(cache_directory, 0o777)
+    try:
+        assert load_plan(my_function) is None
+    finally:
+        os.chmod(cache_directory, 0o700)
+    assert load_plan(my_function) is not None
+
+
+def test_no_cache_by_default(tmp_path):
+    assert persistent_cache.get_cache_directory() is None
+    assert make_function(str)("a") == "second"
+    assert list(tmp_path.iterdir()) == []
@@ -0,0 +1,139 @@
+import subprocess
+import sys
+from typing import Dict, List
+
+from overtake import (
+    CompatibleOverloadNotFoundError,
+    IncompatibilityReason,
+    RuntimeTypeChecker,
+    overtake,
+    register_runtime_type_checker,
+)
+from overtake.runtime_type_checkers import beartype_is_bearable
+from overtake.runtime_type_checkers.basic import IncompatibilityTypeHintBasic
+from overtake.runtime_type_checkers.pydantic_type_adapter import (
+    check_type,
+    get_type_adapter,
+)
+import pytest
+import typing_extensions
+
+
+def test_pydantic_type_adapter_is_reused():
+    assert get_type_adapter(List[int]) is get_type_adapter(List[int])
+    assert get_type_adapter(Dict[str, int]) is not get_type_adapter(List[int])
+    assert check_type([1, 2], List[int], "my_var") is None
+    assert check_type(["1"], List[int], "my_var") is not None
+
+
+def test_beartype_predicate():
+    predicate = beartype_is_bearable.make_predicate(List[int])
+    assert predicate([1, 2])
+    assert not predicate(["1"])
+    assert not predicate(1)
+
+
+def test_beartype_predicate_when_the_private_tester_changed(monkeypatch):
+    checkmake = pytest.importorskip("beartype._check.checkmake")
+
+    def make_func_tester(type_hint):
+        ...
+
+    # a signature different from the one overtake knows
+    monkeypatch.setattr(checkmake, "make_func_tester", make_func_tester)
+    predicate = beartype_is_bearable.make_predicate(List[int])
+    assert predicate([1, 2])
+    assert not predicate(["1"])
+
+
+def test_backends_are_not_imported_before_the_first_call():
+    code = """
+import sys
+
+from overtake import overtake
+from typing_extensions import overload
+
+@overload
+def f(x: int) -> int: ...
+@overload
+def f(x: str) -> int: ...
+@overtake(runtime_type_checker="beartype")
+def f(x): ...
+
+@overload
+def g(x: int) -> int: ...
+@overload
+def g(x: str) -> int: ...
+@overtake(runtime_type_checker="pydantic")
+def g(x): ...
+
+for module in ("beartype", "pydantic"):
+    assert module not in sys.modules, module
+"""
+    subprocess.run([sys.executable, "-c", code], check=True)
+
+
+def test_unknown_type_checker_fails_at_decoration():
+    with pytest.raises(ValueError):
+
+        @overtake(runtime_type_checker="dodo")  # type: ignore
+        def my_function(my_var):
+            ...
+
+
+class NotPositive(IncompatibilityReason):
+    def __init__(self, argument_name):
+        self.argument_name = argument_name
+
+    def __str__(self):
+        return f"{self.argument_name} is not positive"
+
+
+class OnlyPositiveNumbers(RuntimeTypeChecker):
+    def check_type(self, argument_value, type_hint, argument_name):
+        if not isinstance(argument_value, type_hint):
+            return IncompatibilityTypeHintBasic(
+                argument_value, type_hint, argument_name
+            )
+        if type_hint is int and argument_value <= 0:
+            return NotPositive(argument_name)
+        return None
+
+
+@pytest.mark.parametrize(
+    "runtime_type_checker", [OnlyPositiveNumbers(), "only_positive_numbers"]
+)
+def test_custom_runtime_type_checker(runtime_type_checker):
+    register_runtime_type_checker("only_positive_numbers", OnlyPositiveNumbers)
+
+    @typing_extensions.overload
+    def my_function(my_var: int) -> str:
+        return "positive int"
+
+    @typing_extensions.overload
+    def my_function(my_var: object) -> str:
+        return "something else"
+
+    @overtake(runtime_type_checker=runtime_type_checker)
+    def my_function(my_var):
+        ...
+
+    assert my_function(4) == "positive int"
+    assert my_function(-4) == "something else"
+
+
+def test_custom_incompatibility_reason():
+    @typing_extensions.overload
+    def my_function(my_var: int) -> str:
+        return "positive int"
+
+    @typing_extensions.overload
+    def my_function(my_var: str) -> str:
+        return "str"
+
+    @overtake(runtime_type_checker=OnlyPositiveNumbers())
+    def my_function(my_var):
+        ...
+
+    with pytest.raises(CompatibleOverloadNotFoundError, match="my_var is not positive"):
+        my_function(-4)
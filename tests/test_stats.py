@@ -0,0 +1,109 @@
+import overtake
+from overtake import CompatibleOverloadNotFoundError
+from overtake import overtake as overtake_decorator
+from overtake.instrumentation import InstrumentedOvertakenFunctionRegistry
+from overtake.overtake_class import OvertakenFunctionRegistry
+import pytest
+import typing_extensions
+
+
+@pytest.fixture(autouse=True)
+def disable_stats_after_test():
+    yield
+    overtake.disable_stats()
+
+
+def make_function(compile=False):
+    @typing_extensions.overload
+    def my_function(my_var: int) -> str:
+        return "int"
+
+    @typing_extensions.overload
+    def my_function(my_var: str) -> str:
+        return "str"
+
+    @overtake_decorator(compile=compile)
+    def my_function(my_var):
+        ...
+
+    return my_function
+
+
+@pytest.mark.parametrize("compile", [False, True])
+def test_stats(compile):
+    my_function = make_function(compile)
+    my_function(1)
+    stats = my_function.__overtake_stats__
+    assert stats.calls == 0
+    assert stats.inspection_seconds > 0
+
+    overtake.enable_stats(my_function)
+    assert type(my_function.__overtake_registry__) is (
+        InstrumentedOvertakenFunctionRegistry
+    )
+    assert my_function(1) == "int"
+    assert my_function("a") == "str"
+    assert my_function("b") == "str"
+    with pytest.raises(CompatibleOverloadNotFoundError):
+        my_function(b"")
+
+    summary = stats.summary()
+    assert summary["calls"] == 3
+    assert summary["calls_per_overload"] == {
+        "(my_var: int) -> str": 1,
+        "(my_var: str) -> str": 2,
+    }
+    assert summary["no_compatible_overload"] == 1
+    # "a" and b"" failed the int check, b"" failed the str check
+    assert summary["failed_checks"] == 3
+    # with compile=True, the first call did not go through the dispatch cache
+    assert summary["cache_hits"] == (1 if compile else 2)
+    assert summary["cache_hits"] + summary["cache_misses"] == 4
+    assert summary["dispatch_seconds"] > 0
+    assert summary["implementation_seconds"] > 0
+
+    overtake.disable_stats(my_function)
+    assert type(my_function.__overtake_registry__) is OvertakenFunctionRegistry
+    assert my_function(1) == "int"
+    assert stats.calls == 3
+    if compile:
+        assert my_function.__code__.co_name == "dispatch"
+        assert "isinstance" in my_function.__code__.co_names
+
+
+def test_enable_stats_for_all_functions():
+    # the functions of the other tests may be garbage collected at any time,
+    # they must not have the same name
+    def make_function_of_this_test():
+        @typing_extensions.overload
+        def my_function(my_var: int) -> str:
+            return "int"
+
+        @typing_extensions.overload
+        def my_function(my_var: str) -> str:
+            return "str"
+
+        @overtake_decorator
+        def my_function(my_var):
+            ...
+
+        return my_function
+
+    name = (
+        "test_stats.test_enable_stats_for_all_functions.<locals>"
+        ".make_function_of_this_test.<locals>.my_function"
+    )
+    overtake.enable_stats()
+    my_function = make_function_of_this_test()
+    my_function(1)
+    other_function = make_function_of_this_test()
+    other_function(2)
+    other_function("a")
+    summary = overtake.stats()[name]
+    # the stats of both functions are added together
+    assert summary["calls"] == 3
+
+    overtake.disable_stats()
+    my_function = make_function()
+    my_function(1)
+    assert not my_function.__overtake_stats__.enabled
@@ -0,0 +1,72 @@
+from concurrent.futures import ThreadPoolExecutor
+import threading
+import time
+from unittest import mock
+
+from overtake import overtake, overtake_class
+from overtake.dispatch_cache import TypeDispatchCache
+import pytest
+import typing_extensions
+
+NUMBER_OF_THREADS = 8
+
+
+def make_function(compile: bool):
+    @typing_extensions.overload
+    def my_function(my_var: int) -> str:
+        return "int"
+
+    @typing_extensions.overload
+    def my_function(my_var: str) -> str:
+        return "str"
+
+    @overtake(compile=compile)
+    def my_function(my_var):
+        ...
+
+    return my_function
+
+
+@pytest.mark.parametrize("compile", [False, True])
+def test_first_calls_from_many_threads_inspect_once(compile: bool):
+    my_function = make_function(compile)
+    original_inspection = overtake_class.LazyOverloadsInspection
+
+    def slow_inspection(*args, **kwargs):
+        # gives time to the other threads to arrive
+        time.sleep(0.05)
+        return original_inspection(*args, **kwargs)
+
+    barrier = threading.Barrier(NUMBER_OF_THREADS)
+
+    def first_call(value):
+        barrier.wait()
+        return my_function(value)
+
+    values = [1, "a"] * (NUMBER_OF_THREADS // 2)
+    with mock.patch.object(
+        overtake_class, "LazyOverloadsInspection", side_effect=slow_inspection
+    ) as inspection:
+        with ThreadPoolExecutor(NUMBER_OF_THREADS) as executor:
+            results = list(executor.map(first_call, values))
+    assert results == ["int", "str"] * (NUMBER_OF_THREADS // 2)
+    inspection.assert_called_once()
+
+
+def test_dispatch_cache_updated_from_many_threads():
+    classes = [type(f"C{i}", (), {}) for i in range(50)]
+    cache = TypeDispatchCache(maxsize=10)
+
+    def update(thread_index):
+        for i in range(2000):
+            cls = classes[(i * 7 + thread_index) % len(classes)]
+            key = (1, (), id(cls))
+            implementation = cache.get(key)
+            if implementation is None:
+                cache.add(key, [cls()], cls)
+            else:
+                assert implementation is cls
+
+    with ThreadPoolExecutor(NUMBER_OF_THREADS) as executor:
+        list(executor.map(update, range(NUMBER_OF_THREADS)))
+    assert len(cache) <= 10
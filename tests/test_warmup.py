@@ -0,0 +1,66 @@
+import sys
+
+import overtake
+from overtake import overtake as overtake_decorator
+import typing_extensions
+
+
+def test_warmup_all():
+    @typing_extensions.overload
+    def my_function(my_var: int) -> str:
+        return "int"
+
+    @typing_extensions.overload
+    def my_function(my_var: str, my_second: int = 1) -> str:
+        return "str"
+
+    @overtake_decorator
+    def my_function(my_var, my_second=1):
+        ...
+
+    @typing_extensions.overload
+    def my_compiled_function(my_var: int) -> str:
+        return "int"
+
+    @typing_extensions.overload
+    def my_compiled_function(my_var: str) -> str:
+        return "str"
+
+    @overtake_decorator(compile=True)
+    def my_compiled_function(my_var):
+        ...
+
+    registry = my_function.__overtake_registry__
+    assert registry._lazy_inspection is None
+
+    timings = dict(overtake.warmup_all(modules=[sys.modules[__name__]]))
+
+    assert registry._lazy_inspection is not None
+    assert len(registry.inspection_results.decision_trees._roots) == 3
+    assert my_compiled_function.__code__.co_name == "dispatch"
+    assert "compile_and_call" not in my_compiled_function.__code__.co_names
+    assert f"{__name__}.test_warmup_all.<locals>.my_function" in timings
+    assert all(seconds >= 0 for seconds in timings.values())
+
+    assert my_function(1) == "int"
+    assert my_function("a", 2) == "str"
+    assert my_compiled_function("a") == "str"
+
+
+def test_warmup_all_filters_modules():
+    @typing_extensions.overload
+    def my_function(my_var: int) -> str:
+        return "int"
+
+    @typing_extensions.overload
+    def my_function(my_var: str) -> str:
+        return "str"
+
+    @overtake_decorator
+    def my_function(my_var):
+        ...
+
+    assert overtake.warmup_all(modules=["some_other_module"]) == []
+    assert my_function.__overtake_registry__._lazy_inspection is None
+    overtake.warmup_all(modules=[__name__])
+    assert my_function.__overtake_registry__._lazy_inspection is not None